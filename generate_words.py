@@ -1,8 +1,20 @@
+import argparse
 import json
+import os
+import sys
 import nltk
 from nltk.corpus import cmudict
 import random
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "web_app", "backend"))
+from core.sharded_corpus import SCHEMES, write_shards
+
+parser = argparse.ArgumentParser(description="Generate the quiz word files from the CMU dictionary")
+parser.add_argument("--shards", metavar="DIR", help="Also write the full word list as a shard directory")
+parser.add_argument("--shard-by", choices=SCHEMES, default="letter", help="Shard by first letter or by text hash")
+parser.add_argument("--shard-count", type=int, default=16, help="Number of hash shards")
+args = parser.parse_args()
+
 # Download CMU dictionary (only first time)
 nltk.download('cmudict')
 
@@ -73,4 +85,8 @@ with open("test_words.json", "w") as f:
 with open("all_words_firestore.json", "w") as f:
     json.dump(all_words, f, indent=2)
 
+if args.shards:
+    counts = write_shards(all_words, args.shards, scheme=args.shard_by, shard_count=args.shard_count)
+    print(f"Wrote {len(counts)} shards to {args.shards}")
+
 print("Files generated successfully.")
@@ -1,18 +1,57 @@
 import argparse
-import json
 import random
+import sys
+import threading
 import webbrowser
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "web_app" / "backend"))
+from core.heavy_hitters import SpaceSaving
+from core.json_stream import iter_json_array
+from core.weighted_sampler import FenwickSampler
+
+
+def iter_words(json_path: Path) -> Iterator[dict]:
+    """Yield word entries from a JSON array file without reading it all at once."""
+    for item in iter_json_array(str(json_path)):
+        if not isinstance(item, dict):
+            raise ValueError("Expected a JSON array of word objects.")
+        yield item
 
 
 def load_words(json_path: Path) -> list[dict]:
     """Load word entries from a JSON file."""
-    with json_path.open("r", encoding="utf-8") as file_handle:
-        data = json.load(file_handle)
-    if not isinstance(data, list):
-        raise ValueError("Expected a JSON array of word objects.")
-    return data
+    return list(iter_words(json_path))
+
+
+class BackgroundWordLoader:
+    """Stream words into a shared list on a worker thread so a quiz can start early."""
+
+    def __init__(self, json_path: Path) -> None:
+        self.json_path = json_path
+        self.words: list[dict] = []
+        self.error: Exception | None = None
+        self.done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            for word in iter_words(self.json_path):
+                self.words.append(word)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done.set()
+
+    def wait_for_first_word(self) -> None:
+        while not self.words and not self.done.wait(0.01):
+            pass
+        if not self.words:
+            if self.error:
+                raise self.error
+            raise ValueError(f"No words found in {self.json_path.name}.")
 
 
 def load_words_firestore(
@@ -184,7 +223,13 @@ def run_round(
     return attempts, wrong_guesses, skipped, correct, feature, text, False
 
 
-def init_stats() -> dict:
+def init_stats(top_k: int | None = None) -> dict:
+    """
+    Empty stats. With top_k, missed_words and attempts_per_word keep at most
+    top_k words each, chosen by Space-Saving sketches, instead of one entry
+    per distinct word.
+    """
+    missed_sketch = SpaceSaving(top_k) if top_k else None
     return {
         "total_rounds": 0,
         "total_attempts": 0,
@@ -197,11 +242,23 @@ def init_stats() -> dict:
             "t_flap": {"rounds": 0, "correct": 0},
             "intonation": {"rounds": 0, "correct": 0},
         },
-        "missed_words": {},
+        # With a sketch, its live counts dict
+        "missed_words": missed_sketch.counts if missed_sketch is not None else {},
         "attempts_per_word": {},
+        # Space-Saving sketches bounding the two dicts above (None: unbounded)
+        "missed_sketch": missed_sketch,
+        "attempts_sketch": SpaceSaving(top_k) if top_k else None,
     }
 
 
+def _count_missed(stats: dict, text: str, misses: int) -> None:
+    sketch = stats["missed_sketch"]
+    if sketch is not None:
+        sketch.add(text, misses)
+    else:
+        stats["missed_words"][text] = stats["missed_words"].get(text, 0) + misses
+
+
 def update_stats(
     stats: dict,
     attempts: int,
@@ -215,17 +272,26 @@ def update_stats(
     stats["total_attempts"] += attempts
     if skipped:
         stats["skipped"] += 1
-        stats["missed_words"][text] = stats["missed_words"].get(text, 0) + 1
+        _count_missed(stats, text, 1)
     if correct:
         stats["correct"] += 1
     stats["per_feature"][feature]["rounds"] += 1
     if correct:
         stats["per_feature"][feature]["correct"] += 1
     if wrong_guesses > 0:
-        stats["missed_words"][text] = stats["missed_words"].get(text, 0) + wrong_guesses
+        _count_missed(stats, text, wrong_guesses)
+    sketch = stats["attempts_sketch"]
+    if sketch is not None:
+        evicted = sketch.add(text, attempts)
+        if evicted is not None:
+            del stats["attempts_per_word"][evicted]
     attempts_per_word = stats["attempts_per_word"].setdefault(text, {"rounds": 0, "attempts": 0})
     attempts_per_word["rounds"] += 1
-    attempts_per_word["attempts"] += attempts
+    if sketch is not None:
+        # Includes the count inherited from an evicted word, if any
+        attempts_per_word["attempts"] = sketch.counts[text]
+    else:
+        attempts_per_word["attempts"] += attempts
 
 
 def print_stats(stats: dict, title: str = "Session stats") -> None:
@@ -235,6 +301,8 @@ def print_stats(stats: dict, title: str = "Session stats") -> None:
     per_feature = stats["per_feature"]
     missed_words = stats["missed_words"]
     attempts_per_word = stats["attempts_per_word"]
+    missed_sketch = stats["missed_sketch"]
+    attempts_sketch = stats["attempts_sketch"]
     if total_rounds == 0:
         print("No rounds played.")
         return
@@ -252,11 +320,23 @@ def print_stats(stats: dict, title: str = "Session stats") -> None:
             continue
         accuracy = (correct / rounds) * 100
         print(f"- {feature}: {accuracy:.1f}% ({correct}/{rounds})")
-    if missed_words:
+    if missed_sketch is not None and missed_words:
+        # Bounded: read the top 5 straight off the sketch, no sort
+        print(f"Most missed words (tracking the top {missed_sketch.capacity}):")
+        for word, count, error in missed_sketch.top(5):
+            overcount = f" (at most {error} overcounted)" if error else ""
+            print(f"- {word}: {count}{overcount}")
+    elif missed_words:
         print("Most missed words:")
         for word, count in sorted(missed_words.items(), key=lambda item: item[1], reverse=True)[:5]:
             print(f"- {word}: {count}")
-    if attempts_per_word:
+    if attempts_sketch is not None and attempts_per_word:
+        print(f"Attempts per word (top 5 by total attempts, tracking the top {attempts_sketch.capacity}):")
+        for word, count, error in attempts_sketch.top(5):
+            rounds = attempts_per_word[word]["rounds"]
+            overcount = f" (at most {error} overcounted)" if error else ""
+            print(f"- {word}: {count} attempts over {rounds} rounds{overcount}")
+    elif attempts_per_word:
         print("Attempts per word (top 5 by avg attempts):")
         ordered = sorted(
             attempts_per_word.items(),
@@ -268,14 +348,41 @@ def print_stats(stats: dict, title: str = "Session stats") -> None:
             print(f"- {word}: {avg_word_attempts:.2f} avg over {data['rounds']} rounds")
 
 
-def build_missed_words_pool(words: list[dict], missed_words: dict[str, int]) -> list[dict]:
+def build_missed_words_pool(words: list[dict], missed_words: dict[str, int]) -> tuple[list[dict], FenwickSampler]:
+    """Distinct missed words and a sampler weighted by their miss counts"""
     pool: list[dict] = []
+    weights: list[int] = []
     for word in words:
         text = word.get("text", "<missing>")
         repeats = missed_words.get(text, 0)
         if repeats > 0:
-            pool.extend([word] * repeats)
-    return pool
+            pool.append(word)
+            weights.append(repeats)
+    return pool, FenwickSampler(weights)
+
+
+def review_credit(correct: bool, wrong_guesses: int) -> float:
+    """
+    Misses a finished review round makes up: one for a first-try correct
+    answer, half after wrong guesses, a quarter for a skip. Every round
+    lowers the total, so a review ends after at most 4x its misses.
+    """
+    if not correct:
+        return 0.25
+    return 0.5 if wrong_guesses else 1.0
+
+
+def run_review(missed_pool: list[dict], sampler: FenwickSampler, top_k: int | None, *round_args: Any) -> dict:
+    """Drill missed words, drawn by the misses each has left, until none are left or the learner quits"""
+    review_stats = init_stats(top_k)
+    while sampler.total > 0:
+        index = sampler.sample()
+        attempts, wrong_guesses, skipped, correct, feature, text, did_quit = run_round([missed_pool[index]], *round_args)
+        if did_quit:
+            break
+        update_stats(review_stats, attempts, wrong_guesses, skipped, correct, feature, text)
+        sampler.add(index, -min(sampler.weight(index), review_credit(correct, wrong_guesses)))
+    return review_stats
 
 
 def print_firestore_setup_notes() -> None:
@@ -356,13 +463,24 @@ def main() -> None:
         default="{clip_id}.mp4",
         help="Clip filename template (default: {clip_id}.mp4)",
     )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=None,
+        help="Track only the N most missed / most attempted words (optional)",
+    )
     args = parser.parse_args()
 
     base_dir = Path(__file__).resolve().parent
     if args.dataset == "json":
         json_path = (base_dir / args.json_path).resolve()
-        words = load_words(json_path)
-        print(f"Loaded {len(words)} words from {json_path.name}.")
+        loader = BackgroundWordLoader(json_path)
+        loader.wait_for_first_word()
+        words = loader.words
+        if loader.done.is_set():
+            print(f"Loaded {len(words)} words from {json_path.name}.")
+        else:
+            print(f"Loading words from {json_path.name} in the background...")
     else:
         try:
             words = load_words_firestore(
@@ -383,7 +501,7 @@ def main() -> None:
             return
         print(f"Loaded {len(words)} words from Firestore.")
 
-    stats = init_stats()
+    stats = init_stats(args.top_k)
 
     while True:
         attempts, wrong_guesses, skipped, correct, feature, text, did_quit = run_round(
@@ -403,25 +521,23 @@ def main() -> None:
     if stats["missed_words"]:
         review = input("Review missed words now? (y/n): ").strip().lower()
         if review in {"y", "yes"}:
-            missed_pool = build_missed_words_pool(words, stats["missed_words"])
+            missed_pool, sampler = build_missed_words_pool(words, stats["missed_words"])
             if not missed_pool:
                 print("No missed words available for review.")
                 return
-            random.shuffle(missed_pool)
-            print(f"Reviewing {len(missed_pool)} missed items (one pass)...")
-            review_stats = init_stats()
-            for word in missed_pool:
-                attempts, wrong_guesses, skipped, correct, feature, text, did_quit = run_round(
-                    [word],
-                    base_dir,
-                    args.clips_dir,
-                    args.clip_template,
-                    args.clip_url_field,
-                    args.open_clip,
-                )
-                if did_quit:
-                    break
-                update_stats(review_stats, attempts, wrong_guesses, skipped, correct, feature, text)
+            # Words come up in proportion to their remaining misses; a first-try
+            # correct answer pays one off, so a flawless review is one pass
+            print(f"Reviewing {int(sampler.total)} missed items across {len(missed_pool)} word(s)...")
+            review_stats = run_review(
+                missed_pool,
+                sampler,
+                args.top_k,
+                base_dir,
+                args.clips_dir,
+                args.clip_template,
+                args.clip_url_field,
+                args.open_clip,
+            )
             print_stats(review_stats, title="Review stats")
 
 
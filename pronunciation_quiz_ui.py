@@ -19,14 +19,17 @@ except Exception:
     pyttsx3 = None
 
 # NEW: Import services from abstraction layer
-from services import JSONWordDataSource, FileProgressTracker, WindowsAudioPlayer
+from services import JSONWordDataSource, DatabaseWordDataSource, FileProgressTracker, WindowsAudioPlayer
 
 # NEW: Load configuration from external file
 with open("config.json") as f:
     CONFIG = json.load(f)
 
 # NEW: Initialize service layer for future-proof architecture
-word_service = JSONWordDataSource(CONFIG["data"]["word_file"])
+if CONFIG["data"].get("word_source") == "database":
+    word_service = DatabaseWordDataSource(CONFIG["data"].get("database_file", "words.db"))
+else:
+    word_service = JSONWordDataSource(CONFIG["data"]["word_file"])
 progress_tracker = FileProgressTracker(CONFIG["progress"]["stats_file"])
 audio_player = WindowsAudioPlayer()
 
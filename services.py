@@ -5,6 +5,7 @@ This allows easy switching between JSON, database, API, etc. without changing ma
 
 import json
 import os
+import sqlite3
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
@@ -83,14 +84,39 @@ class APIWordDataSource(WordDataSource):
 
 
 class DatabaseWordDataSource(WordDataSource):
-    """Load words from database - for commercialized version"""
+    """Load words from a SQLite database (same schema as the web backend)"""
+    
     def __init__(self, db_connection_string: str):
         self.db_connection = db_connection_string
+        self.conn = sqlite3.connect(db_connection_string, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS words ("
+            "id INTEGER PRIMARY KEY, text TEXT NOT NULL, feature_id TEXT, data TEXT NOT NULL)"
+        )
+        self.conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_words_text ON words(text)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_words_feature_id ON words(feature_id)")
+        self.conn.commit()
     
     def get_all_words(self) -> List[Dict[str, Any]]:
-        # cursor.execute("SELECT * FROM words")
-        # return cursor.fetchall()
-        raise NotImplementedError("Database implementation pending")
+        """Load all words from the database"""
+        rows = self.conn.execute("SELECT data FROM words ORDER BY id").fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def get_word_by_id(self, word_id: str) -> Dict[str, Any]:
+        """Find word by text/id (indexed)"""
+        row = self.conn.execute("SELECT data FROM words WHERE text = ?", (word_id.casefold(),)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def save_word(self, word: Dict[str, Any]) -> None:
+        """Insert or update a word"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO words (text, feature_id, data) VALUES (?, ?, ?) "
+                "ON CONFLICT(text) DO UPDATE SET feature_id = excluded.feature_id, data = excluded.data",
+                (word.get("text", "").casefold(), word.get("feature_id"), json.dumps(word)),
+            )
 
 
 # ============================================================================
@@ -6,13 +6,16 @@ The core modules are completely independent of FastAPI.
 
 import os
 import json
-import random
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+from urllib.request import Request as UrlRequest, urlopen
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -24,14 +27,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import pure business logic (no web framework dependencies)
 from core.word_service import JSONWordDataSource
-from core.progress_service import FileProgressTracker
+from core.sqlite_word_source import SQLiteWordDataSource
+from core.binary_corpus import BinaryWordDataSource
+from core.sharded_corpus import ShardedWordDataSource
+from core.corpus_cache import text_key
+from core.corpus_index import CorpusIndex, pronunciation_key
+from core.rhyme_index import phonemes, rhyme_key
+from core.progress_service import FileProgressTracker, SessionProgressRegistry
+from core.sqlite_progress import SqliteProgressTracker
+from core.review_scheduler import ReviewScheduler
+from core.weighted_sampler import FenwickSampler
+from core.word_import import parse_payload, prepare_words
+from core.warmup import Warmup
 from core.pronunciation_engine import arpabet_to_ipa, generate_example_sentences
 from core.feature_engine import (
     detect_features,
     get_feature_info,
     get_all_features,
     get_feature_examples,
-    get_feature_summary
+    get_feature_summary,
+    get_features_version
 )
 import wikipedia
 import cmudict
@@ -66,25 +81,99 @@ if not CONFIG_PATH.exists():
 with open(CONFIG_PATH) as f:
     CONFIG = json.load(f)
 
+def _create_word_service(data_config: dict):
+    """Pick the word data source named by config.json data.word_source"""
+    source = data_config.get("word_source", "json")
+    if source == "database":
+        database_file = BASE_DIR / data_config.get("database_file", "words.db")
+        return SQLiteWordDataSource(str(database_file))
+    if source == "binary":
+        binary_file = BASE_DIR / data_config.get("binary_file", "words.bin")
+        return BinaryWordDataSource(str(binary_file))
+    if source == "sharded":
+        shard_dir = BASE_DIR / data_config.get("shard_dir", "words_shards")
+        return ShardedWordDataSource(str(shard_dir), workers=data_config.get("shard_workers"))
+    if source == "json":
+        return JSONWordDataSource(str(BASE_DIR / data_config["word_file"]))
+    raise ValueError(f"Unsupported data.word_source: {source}")
+
+
+def _create_progress_tracker(progress_config: dict):
+    """
+    Pick the quiz progress store named by config.json progress.tracking_method.
+    Both record per-session and global stats and batch their writes.
+    """
+    method = progress_config.get("tracking_method", "file")
+    flush_interval = progress_config.get("flush_interval_seconds", 5.0)
+    flush_every = progress_config.get("flush_every", 50)
+    # Words kept in most_missed; null keeps every word missed
+    missed_capacity = progress_config.get("most_missed_capacity")
+    if method == "sqlite":
+        database_file = BASE_DIR / progress_config.get("database_file", "user_stats.db")
+        return SqliteProgressTracker(
+            str(database_file), flush_interval=flush_interval, flush_every=flush_every, missed_capacity=missed_capacity
+        )
+    if method == "file":
+        compact_threshold = progress_config.get("compact_threshold", 1000)
+        # Every attempt also counts toward stats_file's global aggregate
+        return SessionProgressRegistry(
+            FileProgressTracker(str(BASE_DIR / progress_config["stats_file"]), compact_threshold, missed_capacity),
+            str(BASE_DIR / progress_config.get("session_dir", "session_stats")),
+            flush_interval=flush_interval,
+            flush_every=flush_every,
+            compact_threshold=compact_threshold,
+            missed_capacity=missed_capacity,
+        )
+    raise ValueError(f"Unsupported progress.tracking_method: {method}")
+
+
 # Initialize core services
-word_file = BASE_DIR / CONFIG["data"]["word_file"]
-stats_file = BASE_DIR / CONFIG["progress"]["stats_file"]
+word_service = _create_word_service(CONFIG["data"])
+# Per-learner and global quiz stats, written behind in batches
+session_progress = _create_progress_tracker(CONFIG["progress"])
+# Spaced-repetition cards per learner, saved through session_progress
+review_scheduler = ReviewScheduler(
+    session_progress,
+    relearn_seconds=CONFIG.get("review", {}).get("relearn_seconds", 60),
+)
 
-word_service = JSONWordDataSource(str(word_file))
-progress_tracker = FileProgressTracker(str(stats_file))
+# Secondary indexes (feature partitions, autocomplete, ...) over
+# word_service's word list; suggestions also cover CMU dictionary words
+corpus_index = CorpusIndex()
+
+# CMU Pronouncing Dictionary (ARPAbet lookup); see _cmu_dict()
+_cmu = None
+_cmu_lock = threading.Lock()
 
 # Session storage (maps session_id to current_word)
 sessions = {}
 
-# CMU Pronouncing Dictionary (ARPAbet lookup)
-CMU_DICT = cmudict.dict()
+# Feature focus per session (maps session_id to a list of feature_ids)
+session_features = {}
+
+# Sessions that never get two homophones in a row (maps session_id to bool)
+session_avoid_homophones = {}
+
+# When each session's current word was served (maps session_id to
+# time.monotonic()), for answer latency
+session_served_at = {}
+
+# Sessions in review mode: due words first, then new ones (maps session_id to bool)
+session_review = {}
+
+# Sessions reviewing their missed words: (feature focus, words, text key ->
+# index, FenwickSampler weighted by misses not yet made up) (maps session_id)
+session_missed = {}
+
+# Random draws tried for a word the learner has no card for yet
+_NEW_WORD_ATTEMPTS = 20
 
 
 def _fetch_dictionaryapi_ipa(word: str) -> Optional[str]:
     """Fetch IPA from dictionaryapi.dev, if available."""
     try:
         url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{quote(word)}"
-        req = Request(url, headers={"User-Agent": "PronunciationQuiz/1.0"})
+        req = UrlRequest(url, headers={"User-Agent": "PronunciationQuiz/1.0"})
         with urlopen(req, timeout=5) as response:
             data = json.loads(response.read().decode("utf-8"))
 
@@ -106,7 +195,7 @@ def _fetch_dictionaryapi_definition(word: str) -> Optional[str]:
     """Fetch a short definition from dictionaryapi.dev, if available."""
     try:
         url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{quote(word)}"
-        req = Request(url, headers={"User-Agent": "PronunciationQuiz/1.0"})
+        req = UrlRequest(url, headers={"User-Agent": "PronunciationQuiz/1.0"})
         with urlopen(req, timeout=5) as response:
             data = json.loads(response.read().decode("utf-8"))
 
@@ -125,6 +214,191 @@ def _fetch_dictionaryapi_definition(word: str) -> Optional[str]:
     except Exception:
         return None
 
+def _indexed_words():
+    """
+    Current word list, with corpus_index brought up to date
+
+    Endpoints that call this (or otherwise wait on the corpus or index
+    locks) are plain `def`, so FastAPI runs them in its threadpool and a
+    wait during warm-up doesn't stall /api/health or /api/ready.
+    """
+    words = word_service.get_all_words()
+    corpus_index.sync(words)
+    return words
+
+
+def _cmu_dict() -> dict:
+    """CMU dictionary, loaded by the warm-up (or by the first caller, if sooner)"""
+    global _cmu
+    with _cmu_lock:
+        if _cmu is None:
+            _cmu = cmudict.dict()
+            corpus_index.set_vocabulary(_cmu)
+        return _cmu
+
+
+# Indexes built at startup rather than on first use
+_WARM_INDEXES = CONFIG.get("warmup", {}).get(
+    "indexes", ["version", "suggest", "did_you_mean", "rhymes", "minimal_pairs"]
+)
+
+warmup = Warmup(
+    [("corpus", _indexed_words), ("cmudict", _cmu_dict)]
+    + [(name, lambda name=name: corpus_index.warm(name)) for name in _WARM_INDEXES]
+)
+
+
+@app.on_event("startup")
+async def start_warmup():
+    """Load the corpus, CMU data and indexes in the background; see /api/ready"""
+    warmup.start()
+    session_progress.start()
+
+
+@app.on_event("shutdown")
+async def flush_progress():
+    """Write buffered quiz attempts before the process exits"""
+    session_progress.close()
+
+
+def _not_modified(
+    request: Request, response: Response, content_hash: str, modified: Optional[float] = None
+) -> Optional[Response]:
+    """
+    Set ETag (and Last-Modified, given a stable mtime) and return a 304
+    response if the client's copy is current (If-None-Match wins over
+    If-Modified-Since), else None.
+    """
+    etag = f'"{content_hash}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if modified is not None:
+        headers["Last-Modified"] = formatdate(modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        current = "*" in tags or etag in tags
+    elif modified is not None:
+        try:
+            since = parsedate_to_datetime(request.headers["if-modified-since"]).timestamp()
+            current = int(modified) <= since
+        except (KeyError, TypeError, ValueError):
+            current = False
+    else:
+        current = False
+    return Response(status_code=304, headers=headers) if current else None
+
+
+def _parse_features(value: Optional[str]) -> list:
+    """Split a comma-separated feature filter ("t_flap,stress")"""
+    if not value:
+        return []
+    return [f.strip() for f in value.split(",") if f.strip()]
+
+
+def _missed_sampler(session_id: str, features: list) -> None:
+    """
+    Start a missed-words review: the learner's missed words (within
+    `features`) in a Fenwick tree weighted by miss count. Each answer then
+    moves its word's weight (see _update_missed), so draws follow progress.
+    """
+    missed = session_progress.get_stats(session_id)["most_missed"]
+    words, weights = [], []
+    for text, count in missed.items():
+        word = word_service.get_word_by_id(text)
+        if word is not None and count > 0 and (not features or word.get("feature_id") in features):
+            words.append(word)
+            weights.append(count)
+    positions = {text_key(word["text"]): index for index, word in enumerate(words)}
+    session_missed[session_id] = (list(features), words, positions, FenwickSampler(weights))
+
+
+def _update_missed(session_id: str, word: dict, correct: bool) -> None:
+    """
+    Reweight an answered word in the session's missed-words review: a
+    correct answer makes up one miss, a wrong one or a skip adds one
+    (bringing in words missed for the first time), O(log n).
+    """
+    entry = session_missed.get(session_id)
+    if entry is None:
+        return
+    features, words, positions, sampler = entry
+    key = text_key(word.get("text"))
+    index = positions.get(key)
+    if correct:
+        if index is not None:
+            sampler.add(index, -min(1, sampler.weight(index)))
+    elif index is not None:
+        sampler.add(index, 1)
+    elif not features or word.get("feature_id") in features:
+        positions[key] = sampler.append(1)
+        words.append(word)
+
+
+def _next_word(session_id: str, features: list, avoid: Optional[dict]) -> Tuple[Optional[dict], Optional[str]]:
+    """
+    The session's next word and where it came from: in missed-words mode
+    a word drawn by miss count ("missed"); in review mode the most overdue
+    scheduled word ("due"), else a word without a card yet ("new");
+    a random word when nothing was missed ("random") and outside both
+    modes (None).
+    """
+    if session_id in session_missed:
+        if session_missed[session_id][0] != list(features):
+            # Feature focus changed: rebuild for the new focus
+            _missed_sampler(session_id, features)
+        _, words, _, sampler = session_missed[session_id]
+        if sampler.total <= 0:
+            return corpus_index.sample(features, avoid=avoid), "random"
+        avoid_key = pronunciation_key(avoid.get("syllables")) if avoid else None
+        word = None
+        for _ in range(_NEW_WORD_ATTEMPTS):
+            word = words[sampler.sample()]
+            if not avoid_key or pronunciation_key(word.get("syllables")) != avoid_key:
+                break
+        return word, "missed"
+    if not session_review.get(session_id):
+        return corpus_index.sample(features, avoid=avoid), None
+    
+    avoid_key = pronunciation_key(avoid.get("syllables")) if avoid else None
+    candidates = {}
+    
+    def accept(text: str) -> bool:
+        word = word_service.get_word_by_id(text)
+        if word is None or (features and word.get("feature_id") not in features):
+            return False
+        if avoid_key and pronunciation_key(word.get("syllables")) == avoid_key:
+            return False
+        candidates[text] = word
+        return True
+    
+    due = review_scheduler.next_due(session_id, accept)
+    if due is not None:
+        return candidates[due], "due"
+    word = None
+    for _ in range(_NEW_WORD_ATTEMPTS):
+        word = corpus_index.sample(features, avoid=avoid)
+        if word is None or not review_scheduler.is_scheduled(session_id, word["text"]):
+            break
+    return word, "new"
+
+
+def _missed_word_count(session_id: str) -> int:
+    """Words the session still has misses to make up on"""
+    entry = session_missed.get(session_id)
+    if entry is None:
+        return 0
+    sampler = entry[3]
+    return sum(1 for index in range(len(sampler)) if sampler.weight(index) > 0)
+
+
+def _answer_latency_ms(session_id: str) -> Optional[int]:
+    """Milliseconds since the session's current word was served"""
+    served_at = session_served_at.get(session_id)
+    return round((time.monotonic() - served_at) * 1000) if served_at is not None else None
+
+
 # ============================================================================
 # DATA MODELS
 # ============================================================================
@@ -132,6 +406,8 @@ def _fetch_dictionaryapi_definition(word: str) -> Optional[str]:
 class SubmitAnswerRequest(BaseModel):
     session_id: str
     feature: str
+    # Feature(s) to draw the next word from; defaults to the session's focus
+    next_feature: Optional[str] = None
 
 
 class AddWordRequest(BaseModel):
@@ -152,6 +428,18 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/api/ready")
+async def ready(response: Response):
+    """
+    Readiness probe: 200 once the corpus, CMU data and indexes are loaded,
+    503 with per-step progress until then (or if a step failed)
+    """
+    status = warmup.status()
+    if not status["ready"]:
+        response.status_code = 503
+    return status
+
+
 @app.get("/api/config")
 async def get_config():
     """Get public configuration"""
@@ -167,17 +455,198 @@ async def get_config():
 # ============================================================================
 
 @app.get("/api/words")
-async def list_words():
-    """Get all available words"""
+def list_words(
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    feature_id: Optional[str] = None,
+    syllables: Optional[int] = Query(None, ge=0),
+    prefix: Optional[str] = None,
+):
+    """
+    List words in alphabetical order, one page at a time
+    
+    Args:
+        limit: Page size (max 1000)
+        after: Cursor - the `next_after` value from the previous page
+        fields: Comma-separated fields to return (e.g. "text,feature_id")
+        feature_id: Only words tagged with this feature
+        syllables: Only words with this many syllables
+        prefix: Only words starting with this text
+    
+    Sends the corpus version as an ETag; answers 304 when the client's
+    If-None-Match is still current.
+    """
+    try:
+        _indexed_words()
+        not_modified = _not_modified(request, response, corpus_index.version())
+        if not_modified:
+            return not_modified
+        words, total, next_after = corpus_index.page(
+            limit, after=after, feature_id=feature_id, syllable_count=syllables, prefix=prefix
+        )
+        
+        # Sources hold compact records; send plain dicts
+        field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        if field_list:
+            items = [{f: w[f] for f in field_list if f in w} for w in words]
+        else:
+            items = [dict(w) for w in words]
+        
+        return {
+            "count": len(items),
+            "total": total,
+            "next_after": next_after,
+            "words": items
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/words/suggest")
+def suggest_words(prefix: str, limit: int = Query(10, ge=1, le=100)):
+    """
+    Autocomplete a word from the corpus and the CMU dictionary
+    
+    Corpus words come first (ranked by their optional "frequency"), then
+    dictionary-only words, alphabetically within equal weight.
+    """
+    try:
+        _indexed_words()
+        _cmu_dict()
+        suggestions = corpus_index.suggest(prefix, limit)
+        return {
+            "prefix": prefix,
+            "count": len(suggestions),
+            "suggestions": [
+                {"text": text, "weight": weight, "source": "local" if in_corpus else "cmudict"}
+                for text, weight, in_corpus in suggestions
+            ]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/words/rhymes/{word}")
+def word_rhymes(word: str, offset: int = Query(0, ge=0), limit: int = Query(20, ge=1, le=200)):
+    """
+    List corpus words that rhyme with a word (same sounds from the last
+    stressed vowel on). The word may come from the corpus or the CMU dictionary.
+    """
+    try:
+        _indexed_words()
+        word_obj = word_service.get_word_by_id(word)
+        if word_obj:
+            syllables = word_obj.get("syllables") or []
+        elif word.lower() in _cmu_dict():
+            syllables = [" ".join(_cmu_dict()[word.lower()][0])]
+        else:
+            raise HTTPException(status_code=404, detail=f"Word '{word}' not found")
+        
+        rhymes, total = corpus_index.rhymes(syllables, offset, limit, exclude=word)
+        return {
+            "word": word,
+            "rhyme": " ".join(rhyme_key(phonemes(syllables))),
+            "offset": offset,
+            "total": total,
+            "words": [
+                {"text": w.get("text"), "syllables": w.get("syllables"), "feature_id": w.get("feature_id")}
+                for w in rhymes
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/words/{word}/minimal-pairs")
+def word_minimal_pairs(word: str, phoneme: Optional[str] = None):
+    """
+    List corpus words differing from a word in exactly one phoneme
+    (e.g. "bat" / "pat"). Pass `phoneme` (e.g. "R", "L", "T") to keep only
+    contrasts involving that sound.
+    """
     try:
-        words = word_service.get_all_words()
-        return {"count": len(words), "words": words}
+        _indexed_words()
+        word_obj = word_service.get_word_by_id(word)
+        if word_obj:
+            syllables = word_obj.get("syllables") or []
+        elif word.lower() in _cmu_dict():
+            syllables = [" ".join(_cmu_dict()[word.lower()][0])]
+        else:
+            raise HTTPException(status_code=404, detail=f"Word '{word}' not found")
+        
+        pairs = corpus_index.minimal_pairs(syllables, phoneme)
+        return {
+            "word": word,
+            "phonemes": " ".join(phonemes(syllables)),
+            "count": len(pairs),
+            "pairs": [
+                {
+                    "text": w.get("text"),
+                    "syllables": w.get("syllables"),
+                    "feature_id": w.get("feature_id"),
+                    "position": index,
+                    "contrast": [own, theirs]
+                }
+                for w, index, own, theirs in pairs
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/words/{word}/homophones")
+def word_homophones(word: str):
+    """List corpus words pronounced exactly like a word (same phonemes and stress)"""
+    try:
+        _indexed_words()
+        word_obj = word_service.get_word_by_id(word)
+        if word_obj:
+            syllables = word_obj.get("syllables") or []
+        elif word.lower() in _cmu_dict():
+            syllables = [" ".join(_cmu_dict()[word.lower()][0])]
+        else:
+            raise HTTPException(status_code=404, detail=f"Word '{word}' not found")
+        
+        homophones = corpus_index.homophones(syllables, exclude=word)
+        return {
+            "word": word,
+            "phonemes": " ".join(phonemes(syllables)),
+            "count": len(homophones),
+            "homophones": [
+                {"text": w.get("text"), "syllables": w.get("syllables"), "feature_id": w.get("feature_id")}
+                for w in homophones
+            ]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/corpus/stats")
+def corpus_stats():
+    """Get word corpus cache load time and reload counters"""
+    try:
+        _indexed_words()
+        return {
+            **word_service.get_cache_stats(),
+            "version": corpus_index.version(),
+            "feature_counts": corpus_index.feature_counts(),
+            "pronunciations": corpus_index.homophone_group_count(),
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/words/add")
-async def add_word(req: AddWordRequest):
+def add_word(req: AddWordRequest):
     """Add a new word to the quiz"""
     try:
         word_obj = {
@@ -190,38 +659,111 @@ async def add_word(req: AddWordRequest):
             word_obj["clip_id"] = req.clip_id
         
         word_service.save_word(word_obj)
+        corpus_index.add(word_obj, word_service.get_all_words())
         return {"status": "success", "word": word_obj}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _save_bulk(items: list) -> Tuple[list, list]:
+    """Validate and save parsed bulk items; returns (saved words, per-item results)"""
+    _indexed_words()
+    words, results = prepare_words(items, lambda text: word_service.get_word_by_id(text) is not None)
+    word_service.save_words(words)
+    corpus_index.add_many(words, word_service.get_all_words())
+    return words, results
+
+
+@app.post("/api/words/bulk")
+async def add_words_bulk(request: Request):
+    """
+    Add or replace many words at once
+    
+    Body: a JSON array of word objects, or NDJSON (one object per line),
+    each shaped like /api/words/add. A missing feature_id is filled in by
+    detect_features(). Valid words are saved in one write; invalid ones
+    are reported per item and skipped.
+    """
+    started = time.perf_counter()
+    try:
+        items = parse_payload(await request.body())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Body must be a JSON array or NDJSON: {e}")
+    try:
+        words, results = await run_in_threadpool(_save_bulk, items)
+        elapsed = time.perf_counter() - started
+        return {
+            "status": "success",
+            "received": len(items),
+            "saved": len(words),
+            "invalid": len(items) - len(words),
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "words_per_second": round(len(items) / elapsed) if elapsed > 0 else None,
+            "results": results,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # QUIZ ENDPOINTS
 # ============================================================================
 
 @app.post("/api/quiz/new-word")
-async def new_word(session_id: str = "default"):
+def new_word(
+    session_id: str = "default",
+    feature: Optional[str] = None,
+    avoid_homophones: bool = False,
+    review: bool = False,
+    missed: bool = False,
+):
     """
     Get a new random word
     REPLACES: Tkinter pick_random_word() function
+    
+    Pass `feature` (e.g. "t_flap" or "t_flap,stress") to practice only those
+    features; the focus is remembered for the session's next words. With
+    `avoid_homophones`, the session never gets two same-sounding words in a row.
+    With `review`, the session gets its due spaced-repetition words first,
+    then words it has not answered yet. With `missed`, it drills the words
+    it has missed, the most-missed most often.
     """
     try:
-        words = word_service.get_all_words()
+        words = _indexed_words()
         if not words:
             raise HTTPException(status_code=404, detail="No words available")
         
-        current_word = random.choice(words)
+        if review and missed:
+            raise HTTPException(status_code=400, detail="Choose either review or missed, not both")
+        features = _parse_features(feature)
+        previous_word = sessions.get(session_id) if avoid_homophones else None
+        session_avoid_homophones[session_id] = avoid_homophones
+        session_review[session_id] = review
+        if missed:
+            _missed_sampler(session_id, features)
+        else:
+            session_missed.pop(session_id, None)
+        current_word, source = _next_word(session_id, features, previous_word)
+        if current_word is None:
+            raise HTTPException(status_code=404, detail=f"No words available for feature '{feature}'")
         sessions[session_id] = current_word
+        session_served_at[session_id] = time.monotonic()
+        session_features[session_id] = features
         
         # Calculate IPA
         ipa = arpabet_to_ipa(" ".join(current_word["syllables"]))
         
-        return {
+        result = {
             "word": {
                 **current_word,
                 "ipa": ipa
             }
         }
+        if review:
+            result["review"] = {"source": source, **review_scheduler.get_stats(session_id)}
+        elif missed:
+            result["review"] = {"source": source, "missed_words": _missed_word_count(session_id)}
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -229,7 +771,7 @@ async def new_word(session_id: str = "default"):
 
 
 @app.post("/api/quiz/submit-answer")
-async def submit_answer(req: SubmitAnswerRequest):
+def submit_answer(req: SubmitAnswerRequest):
     """
     Submit an answer for the current word
     
@@ -254,16 +796,35 @@ async def submit_answer(req: SubmitAnswerRequest):
             correct = feature == correct_feature
             feedback = "✅ Correct!" if correct else "❌ Wrong! Try again."
         
-        # Save attempt to progress tracker
-        progress_tracker.save_attempt(word_text, correct, feature or "skip")
+        # Save attempt to progress tracker and reschedule the word
+        latency_ms = _answer_latency_ms(req.session_id)
+        session_progress.record(
+            req.session_id,
+            word_text,
+            feature or "skip",
+            correct_feature,
+            correct,
+            latency_ms=latency_ms,
+        )
+        review_scheduler.answer(req.session_id, word_text, correct, skipped=feature == "skip", latency_ms=latency_ms)
+        _update_missed(req.session_id, current_word, correct)
         
-        # Get next word
-        words = word_service.get_all_words()
-        next_word = random.choice(words)
+        # Get next word; a new focus is kept only if it has words
+        if req.next_feature is not None:
+            features = _parse_features(req.next_feature)
+        else:
+            features = session_features.get(req.session_id, [])
+        avoid = current_word if session_avoid_homophones.get(req.session_id) else None
+        _indexed_words()
+        next_word, source = _next_word(req.session_id, features, avoid)
+        if next_word is None:
+            raise HTTPException(status_code=404, detail=f"No words available for feature '{','.join(features)}'")
+        session_features[req.session_id] = features
         sessions[req.session_id] = next_word
+        session_served_at[req.session_id] = time.monotonic()
         next_ipa = arpabet_to_ipa(" ".join(next_word["syllables"]))
         
-        return {
+        result = {
             "correct": correct,
             "correct_feature": correct_feature,
             "guessed_feature": feature,
@@ -273,6 +834,11 @@ async def submit_answer(req: SubmitAnswerRequest):
                 "ipa": next_ipa
             }
         }
+        if session_review.get(req.session_id):
+            result["review"] = {"source": source, **review_scheduler.get_stats(req.session_id)}
+        elif req.session_id in session_missed:
+            result["review"] = {"source": source, "missed_words": _missed_word_count(req.session_id)}
+        return result
     except HTTPException:
         raise
     except Exception as e:
@@ -284,7 +850,7 @@ async def submit_answer(req: SubmitAnswerRequest):
 # ============================================================================
 
 @app.get("/api/pronunciation/ipa/{word}")
-async def get_ipa(word: str):
+def get_ipa(word: str):
     """Convert ARPAbet syllables to IPA"""
     try:
         word_obj = word_service.get_word_by_id(word)
@@ -300,9 +866,23 @@ async def get_ipa(word: str):
 
         cmu_key = word.lower()
         cmu_arpabet = None
-        if cmu_key in CMU_DICT:
-            phones = CMU_DICT[cmu_key][0]
+        cmu = _cmu_dict()
+        if cmu_key in cmu:
+            phones = cmu[cmu_key][0]
             cmu_arpabet = " ".join(phones)
+        else:
+            # Most misses are typos: answer from the local fuzzy index
+            # instead of waiting on dictionaryapi.dev
+            _indexed_words()
+            candidates = corpus_index.did_you_mean(word)
+            if candidates:
+                raise HTTPException(status_code=404, detail={
+                    "message": f"Word '{word}' not found",
+                    "did_you_mean": [
+                        {"text": text, "distance": distance, "source": "local" if in_corpus else "cmudict"}
+                        for text, distance, in_corpus in candidates
+                    ]
+                })
 
         dictionary_ipa = _fetch_dictionaryapi_ipa(word)
         if dictionary_ipa:
@@ -348,33 +928,41 @@ async def get_sentences(word: str, count: int = 5):
 # ============================================================================
 
 @app.get("/api/stats")
-async def get_stats():
+def get_stats(session_id: Optional[str] = None, top: Optional[int] = Query(None, ge=1, le=1000)):
     """
-    Get session statistics
+    Get statistics for one learner (`session_id`), or for everyone combined
+    
+    With `top`, also returns that many most missed words as top_missed:
+    word, count, and error (how far count may overstate the true count).
     
     REPLACES: Tkinter show_stats()
     """
     try:
-        stats = progress_tracker.get_stats()
+        stats = session_progress.get_stats(session_id or None)
         
         # Calculate accuracy
         accuracy = 0
         if stats["total_rounds"] > 0:
             accuracy = round((stats["correct"] / stats["total_rounds"]) * 100, 1)
         
-        return {
+        response = {
+            "session_id": session_id or None,
             "stats": stats,
-            "accuracy_percent": accuracy
+            "accuracy_percent": accuracy,
+            "buffer": session_progress.get_buffer_stats()
         }
+        if top is not None:
+            response["top_missed"] = session_progress.top_missed(session_id or None, top)
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/stats/reset")
-async def reset_stats():
-    """Reset all statistics"""
+def reset_stats(session_id: Optional[str] = None):
+    """Reset one learner's statistics, or the global aggregate"""
     try:
-        progress_tracker.reset()
+        session_progress.reset(session_id or None)
         return {"status": "success", "message": "Stats reset"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -495,11 +1083,14 @@ async def synthesize_audio(text: str, output_file: Optional[str] = None):
 # ============================================================================
 
 @app.get("/api/features")
-async def list_features():
+async def list_features(request: Request, response: Response):
     """
     Get a summary list of all American accent pronunciation features
     """
     try:
+        not_modified = _not_modified(request, response, *get_features_version())
+        if not_modified:
+            return not_modified
         return {
             "count": len(get_feature_summary()),
             "features": get_feature_summary()
@@ -509,7 +1100,7 @@ async def list_features():
 
 
 @app.get("/api/features/{feature_id}")
-async def get_feature(feature_id: str):
+async def get_feature(feature_id: str, request: Request, response: Response):
     """
     Get detailed information about a specific pronunciation feature
     Includes: explanation, rules, examples, common mistakes
@@ -518,6 +1109,9 @@ async def get_feature(feature_id: str):
         feature_info = get_feature_info(feature_id)
         if not feature_info:
             raise HTTPException(status_code=404, detail=f"Feature '{feature_id}' not found")
+        not_modified = _not_modified(request, response, *get_features_version())
+        if not_modified:
+            return not_modified
         
         return {
             "feature_id": feature_id,
@@ -575,12 +1169,15 @@ async def detect_word_features(word: str, syllables: list):
 
 
 @app.get("/api/features/guide/all")
-async def get_complete_feature_guide():
+async def get_complete_feature_guide(request: Request, response: Response):
     """
     Get the complete pronunciation feature guide with all details
     Perfect for generating documentation or a learning reference
     """
     try:
+        not_modified = _not_modified(request, response, *get_features_version())
+        if not_modified:
+            return not_modified
         all_features = get_all_features()
         return {
             "total_features": len(all_features),
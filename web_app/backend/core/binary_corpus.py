@@ -0,0 +1,473 @@
+"""
+Binary Corpus - Compact memory-mapped word corpus format
+No UI dependencies. The file is mmap'd read-only, so every worker process
+shares the same page-cache copy, and records are decoded only when read.
+
+File layout (little-endian):
+    header    magic, version, counts and section offsets (HEADER struct)
+    tokens    phoneme tokens ("AE1", "T", ...) joined by newlines; a token's
+              id is its position + 1, id 0 separates syllables
+    strings   deduplicated UTF-8 string table
+    phonemes  per-word token id sequences (u8, or u16 for >254 tokens)
+    records   fixed-width RECORD entries, one per word, in corpus order
+    hash      open-addressing table of record index + 1 keyed by FNV-1a
+              of the case-folded text (0 = empty slot)
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Sequence
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from .corpus_cache import text_key
+from .file_lock import file_lock
+from .word_journal import WordJournal
+from .word_service import WordDataSource
+
+
+MAGIC = b"PQWCORP\x00"
+FORMAT_VERSION = 1
+
+# magic, version, token width, word count, token count, hash slots,
+# then (offset, size) of tokens/strings/phonemes/records/hash sections
+HEADER = struct.Struct("<8sHHIII" + "QQ" * 5)
+
+# (offset, length) string refs for text, feature_id, clip_id,
+# ipa_pronunciation, original_pronunciation and extra fields (JSON),
+# then phoneme (offset, count) and presence flags
+RECORD = struct.Struct("<" + "IH" * 6 + "IH" + "B")
+
+HAS_FEATURE = 0x01
+HAS_CLIP = 0x02
+HAS_IPA = 0x04
+HAS_SYLLABLES = 0x08
+HAS_EXTRA = 0x10
+ORIGINAL_STR = 0x20
+ORIGINAL_BOOL = 0x40
+ORIGINAL_TRUE = 0x80
+
+KNOWN_FIELDS = ("text", "clip_id", "syllables", "original_pronunciation", "ipa_pronunciation", "feature_id")
+MAX_STRING_BYTES = 0xFFFF
+FNV_OFFSET = 0x811C9DC5
+FNV_PRIME = 0x01000193
+
+
+def fnv1a_32(data: bytes) -> int:
+    """Stable (process-independent) 32-bit hash for the on-disk index"""
+    h = FNV_OFFSET
+    for byte in data:
+        h = ((h ^ byte) * FNV_PRIME) & 0xFFFFFFFF
+    return h
+
+
+# ============================================================================
+# WRITER
+# ============================================================================
+
+def write_binary_corpus(words: Iterable[Dict[str, Any]], path: str) -> int:
+    """
+    Convert word dicts to the binary format at `path`.
+
+    Later entries with the same (case-folded) text replace earlier ones.
+    Written to a temp file and renamed, so readers never see a partial file.
+    Returns the number of records written.
+    """
+    unique: Dict[str, Dict[str, Any]] = {}
+    for word in words:
+        unique[text_key(word.get("text"))] = word
+    ordered = list(unique.values())
+
+    tokens: Dict[str, int] = {}
+    for word in ordered:
+        for syllable in word.get("syllables") or []:
+            for token in str(syllable).split():
+                if token not in tokens:
+                    tokens[token] = len(tokens) + 1
+    token_width = 1 if len(tokens) < 0xFF else 2
+    token_format = "B" if token_width == 1 else "H"
+
+    strings = bytearray()
+    string_refs: Dict[str, Tuple[int, int]] = {}
+
+    def add_string(value: str) -> Tuple[int, int]:
+        ref = string_refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            if len(encoded) > MAX_STRING_BYTES:
+                raise ValueError(f"String too long for binary corpus ({len(encoded)} bytes)")
+            ref = (len(strings), len(encoded))
+            strings.extend(encoded)
+            string_refs[value] = ref
+        return ref
+
+    phonemes = bytearray()
+    records = bytearray()
+    empty = (0, 0)
+    for word in ordered:
+        flags = 0
+        text_ref = add_string(str(word.get("text", "")))
+        feature_ref = clip_ref = ipa_ref = original_ref = extra_ref = empty
+        if word.get("feature_id") is not None:
+            flags |= HAS_FEATURE
+            feature_ref = add_string(str(word["feature_id"]))
+        if word.get("clip_id") is not None:
+            flags |= HAS_CLIP
+            clip_ref = add_string(str(word["clip_id"]))
+        if word.get("ipa_pronunciation") is not None:
+            flags |= HAS_IPA
+            ipa_ref = add_string(str(word["ipa_pronunciation"]))
+
+        original = word.get("original_pronunciation")
+        if isinstance(original, bool):
+            flags |= ORIGINAL_BOOL | (ORIGINAL_TRUE if original else 0)
+        elif original is not None:
+            flags |= ORIGINAL_STR
+            original_ref = add_string(str(original))
+
+        extra = {k: v for k, v in word.items() if k not in KNOWN_FIELDS}
+        if extra:
+            flags |= HAS_EXTRA
+            extra_ref = add_string(json.dumps(extra, ensure_ascii=False, separators=(",", ":")))
+
+        ids: List[int] = []
+        syllables = word.get("syllables")
+        if syllables is not None:
+            flags |= HAS_SYLLABLES
+            for i, syllable in enumerate(syllables):
+                if i:
+                    ids.append(0)
+                ids.extend(tokens[token] for token in str(syllable).split())
+        phoneme_offset = len(phonemes)
+        phonemes.extend(struct.pack(f"<{len(ids)}{token_format}", *ids))
+
+        records.extend(RECORD.pack(
+            *text_ref, *feature_ref, *clip_ref, *ipa_ref, *original_ref, *extra_ref,
+            phoneme_offset, len(ids), flags,
+        ))
+
+    slots = 1
+    while slots < max(len(ordered) * 2, 8):
+        slots <<= 1
+    table = [0] * slots
+    for index, word in enumerate(ordered):
+        slot = fnv1a_32(text_key(word.get("text")).encode("utf-8")) & (slots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = index + 1
+    hash_bytes = struct.pack(f"<{slots}I", *table)
+
+    token_bytes = "\n".join(tokens).encode("ascii")
+    sections = [token_bytes, bytes(strings), bytes(phonemes), bytes(records), hash_bytes]
+    offset = HEADER.size
+    layout = []
+    for section in sections:
+        layout.extend((offset, len(section)))
+        offset += len(section)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, token_width, len(ordered), len(tokens), slots, *layout)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for section in sections:
+            f.write(section)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(ordered)
+
+
+# ============================================================================
+# READER
+# ============================================================================
+
+class BinaryCorpusReader:
+    """Read-only, lazily decoding view over a memory-mapped corpus file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, token_width, self.word_count, token_count, self.hash_slots,
+         tokens_off, tokens_size, self._strings_off, _strings_size,
+         self._phonemes_off, _phonemes_size, self._records_off, _records_size,
+         self._hash_off, _hash_size) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a binary word corpus (v{FORMAT_VERSION}): {path}")
+
+        token_bytes = self._mm[tokens_off:tokens_off + tokens_size]
+        # Index 0 is the syllable separator
+        self._tokens = [""] + (token_bytes.decode("ascii").split("\n") if token_count else [])
+        self._token_width = token_width
+        self._token_format = "B" if token_width == 1 else "H"
+        self.size_bytes = len(self._mm)
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_off + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def text_at(self, index: int) -> str:
+        text_off, text_len = struct.unpack_from("<IH", self._mm, self._records_off + index * RECORD.size)
+        return self._string(text_off, text_len)
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """Decode one word record into the usual dict shape"""
+        if not 0 <= index < self.word_count:
+            raise IndexError(index)
+        (text_off, text_len, feature_off, feature_len, clip_off, clip_len,
+         ipa_off, ipa_len, original_off, original_len, extra_off, extra_len,
+         phoneme_off, phoneme_count, flags) = RECORD.unpack_from(self._mm, self._records_off + index * RECORD.size)
+
+        word: Dict[str, Any] = {"text": self._string(text_off, text_len)}
+        if flags & HAS_CLIP:
+            word["clip_id"] = self._string(clip_off, clip_len)
+        if flags & HAS_SYLLABLES:
+            ids = struct.unpack_from(f"<{phoneme_count}{self._token_format}", self._mm, self._phonemes_off + phoneme_off)
+            syllables: List[str] = []
+            current: List[str] = []
+            for token_id in ids:
+                if token_id == 0:
+                    syllables.append(" ".join(current))
+                    current = []
+                else:
+                    current.append(self._tokens[token_id])
+            if ids:
+                syllables.append(" ".join(current))
+            word["syllables"] = syllables
+        if flags & ORIGINAL_BOOL:
+            word["original_pronunciation"] = bool(flags & ORIGINAL_TRUE)
+        elif flags & ORIGINAL_STR:
+            word["original_pronunciation"] = self._string(original_off, original_len)
+        if flags & HAS_IPA:
+            word["ipa_pronunciation"] = self._string(ipa_off, ipa_len)
+        if flags & HAS_FEATURE:
+            word["feature_id"] = self._string(feature_off, feature_len)
+        if flags & HAS_EXTRA:
+            word.update(json.loads(self._string(extra_off, extra_len)))
+        return word
+
+    def find(self, text: str) -> Optional[int]:
+        """Record index for a word (case-insensitive), via the on-disk hash table"""
+        key = text_key(text)
+        mask = self.hash_slots - 1
+        slot = fnv1a_32(key.encode("utf-8")) & mask
+        while True:
+            (entry,) = struct.unpack_from("<I", self._mm, self._hash_off + slot * 4)
+            if entry == 0:
+                return None
+            if text_key(self.text_at(entry - 1)) == key:
+                return entry - 1
+            slot = (slot + 1) & mask
+
+
+class BinaryWordList(Sequence):
+    """Sequence view of the corpus; each item is decoded when accessed"""
+
+    def __init__(self, reader: BinaryCorpusReader, overrides: Dict[int, Dict[str, Any]], appended: List[Dict[str, Any]]):
+        self._reader = reader
+        self._overrides = overrides
+        self._appended = appended
+        self._base_len = len(reader)
+
+    def __len__(self) -> int:
+        return self._base_len + len(self._appended)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index >= self._base_len:
+            return self._appended[index - self._base_len]
+        override = self._overrides.get(index)
+        return override if override is not None else self._reader.record(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+# ============================================================================
+# DATA SOURCE
+# ============================================================================
+
+class BinaryWordDataSource(WordDataSource):
+    """
+    Serve words from a memory-mapped binary corpus.
+
+    Saves go to a WordJournal overlay; once it holds `compact_threshold`
+    entries the binary file is rebuilt in the background. A rebuild never
+    replaces a file that may be mapped (Windows refuses that): it writes
+    the next generation, `<file>.<n>`, which every process switches to on
+    its next read. Older generations are deleted once no longer current;
+    on Windows a file another process still maps is left for the next
+    compaction to remove. `file_path` itself is generation 0.
+    """
+
+    def __init__(self, file_path: str, compact_threshold: int = 500):
+        self.file_path = file_path
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Binary corpus not found: {file_path}")
+        self.compact_threshold = compact_threshold
+        self._journal = WordJournal(file_path)
+        self._lock = threading.RLock()
+        self._compacting = False
+        self.compaction_count = 0
+        self.load_count = 0
+        self.last_load_seconds = 0.0
+        self._signature = None
+        self._generation = 0
+        self._open()
+
+    def _generation_path(self, generation: int) -> str:
+        return self.file_path if generation == 0 else f"{self.file_path}.{generation}"
+
+    def _generations(self) -> List[int]:
+        """Generations on disk besides 0"""
+        directory = os.path.dirname(self.file_path) or "."
+        prefix = os.path.basename(self.file_path) + "."
+        return [
+            int(name[len(prefix):])
+            for name in os.listdir(directory)
+            if name.startswith(prefix) and name[len(prefix):].isdigit()
+        ]
+
+    def _stat_signature(self) -> Optional[Tuple[Any, ...]]:
+        try:
+            st = os.stat(self._generation_path(self._generation))
+        except FileNotFoundError:
+            # Superseded and deleted by another process's compaction
+            return None
+        newer = os.path.exists(self._generation_path(self._generation + 1))
+        return (self._generation, st.st_mtime_ns, st.st_size, newer, self._journal.signature())
+
+    def _open(self) -> None:
+        started = time.perf_counter()
+        self._generation = max(self._generations(), default=0)
+        self._signature = self._stat_signature()
+        self._reader = BinaryCorpusReader(self._generation_path(self._generation))
+        self._overrides: Dict[int, Dict[str, Any]] = {}
+        self._appended: List[Dict[str, Any]] = []
+        self._appended_positions: Dict[str, int] = {}
+        for word in self._journal.replay():
+            self._apply(word)
+        self._view = BinaryWordList(self._reader, self._overrides, self._appended)
+        self.load_count += 1
+        self.last_load_seconds = time.perf_counter() - started
+
+    def _refresh(self) -> None:
+        if self._stat_signature() != self._signature:
+            self._open()
+
+    def _apply(self, word: Dict[str, Any]) -> None:
+        key = text_key(word.get("text"))
+        index = self._reader.find(key)
+        if index is not None:
+            self._overrides[index] = word
+        elif key in self._appended_positions:
+            self._appended[self._appended_positions[key]] = word
+        else:
+            self._appended_positions[key] = len(self._appended)
+            self._appended.append(word)
+
+    def get_all_words(self) -> Sequence:
+        with self._lock:
+            self._refresh()
+            return self._view
+
+    def get_word_by_id(self, word_id: str) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            key = text_key(word_id)
+            index = self._reader.find(key)
+            if index is not None:
+                return self._overrides.get(index) or self._reader.record(index)
+            position = self._appended_positions.get(key)
+            return self._appended[position] if position is not None else None
+
+    def save_word(self, word: Dict[str, Any]) -> None:
+        self.save_words([word])
+    
+    def save_words(self, words: Iterable[Dict[str, Any]]) -> int:
+        """Journal a batch of words with one write + fsync"""
+        words = list(words)
+        if not words:
+            return 0
+        with self._lock, file_lock(self.file_path):
+            self._refresh()
+            self._journal.append_many(words)
+            # Fresh containers so views handed out earlier stay unchanged
+            self._overrides = dict(self._overrides)
+            self._appended = list(self._appended)
+            for word in words:
+                self._apply(word)
+            self._view = BinaryWordList(self._reader, self._overrides, self._appended)
+            self._signature = self._stat_signature()
+            needs_compaction = self._journal.entry_count >= self.compact_threshold and not self._compacting
+            if needs_compaction:
+                self._compacting = True
+
+        if needs_compaction:
+            threading.Thread(target=self._run_compaction, name="binary-corpus-compaction", daemon=True).start()
+        return len(words)
+
+    def _run_compaction(self) -> None:
+        try:
+            self.compact()
+        finally:
+            self._compacting = False
+
+    def compact(self) -> None:
+        """Rebuild the binary file with the journaled words folded in (skipped if another process is at it)"""
+        with file_lock(self.file_path + ".compaction", blocking=False) as acquired:
+            if not acquired:
+                return
+            with self._lock, file_lock(self.file_path):
+                self._refresh()
+                if not self._journal.has_entries():
+                    return
+                words = self._view
+                generation = self._generation + 1
+                self._journal.rotate()
+                self._signature = self._stat_signature()
+
+            # A new file rather than a replace of the mapped one; readers
+            # that open it meanwhile replay the rotated journal over it,
+            # which gives the same words
+            write_binary_corpus(words, self._generation_path(generation))
+            with self._lock, file_lock(self.file_path):
+                self._journal.discard_rotated()
+                self._open()
+            self._remove_old_generations()
+            self.compaction_count += 1
+
+    def _remove_old_generations(self) -> None:
+        """Delete superseded generation files (not generation 0, the configured file)"""
+        for generation in self._generations():
+            if generation < self._generation:
+                try:
+                    os.remove(self._generation_path(generation))
+                except OSError:
+                    # Still mapped by another process (Windows); next time
+                    pass
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "file": os.path.basename(self._generation_path(self._generation)),
+                "generation": self._generation,
+                "word_count": len(self._view),
+                "mapped_bytes": self._reader.size_bytes,
+                "journal_entries": self._journal.entry_count,
+                "load_count": self.load_count,
+                "reload_count": max(self.load_count - 1, 0),
+                "last_load_seconds": round(self.last_load_seconds, 4),
+                "compaction_count": self.compaction_count,
+                "compacting": self._compacting,
+            }
@@ -0,0 +1,202 @@
+"""
+Corpus Cache - Keep the word corpus resident in memory
+No UI dependencies. Loads the word file once and reloads it only when the
+file on disk changes (mtime/size) or the cache is explicitly invalidated.
+A case-folded text index gives constant-time lookups by word. When a
+WordJournal is attached, its entries are replayed on top of the file.
+Words are held as compact WordRecord objects rather than dicts.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+from .word_journal import WordJournal
+from .word_record import WordRecord
+
+
+# Re-reads before settling for a snapshot that changed while being read
+_LOAD_ATTEMPTS = 3
+
+
+def text_key(text: Any) -> str:
+    """Normalize a word's text for index lookups"""
+    return str(text or "").casefold()
+
+
+def _record_hook(obj: Dict[str, Any]) -> Any:
+    return WordRecord.from_dict(obj) if "text" in obj else obj
+
+
+class CorpusCache:
+    """In-memory copy of a JSON word file with change detection"""
+
+    def __init__(self, file_path: str, journal: Optional[WordJournal] = None):
+        self.file_path = file_path
+        self.journal = journal
+        self._lock = threading.RLock()
+        self._words: Optional[List[WordRecord]] = None
+        self._signature: Optional[Tuple[Any, ...]] = None
+        # text_key -> position in self._words
+        self._positions: Dict[str, int] = {}
+
+        # Observability counters
+        self.load_count = 0
+        self.save_count = 0
+        self.last_load_seconds = 0.0
+        self.total_load_seconds = 0.0
+        self.last_loaded_at: Optional[float] = None
+
+    def _stat_signature(self) -> Tuple[Any, ...]:
+        st = os.stat(self.file_path)
+        if self.journal is None:
+            return (st.st_mtime_ns, st.st_size)
+        return (st.st_mtime_ns, st.st_size, self.journal.signature())
+
+    def _load(self) -> None:
+        started = time.perf_counter()
+        for _ in range(_LOAD_ATTEMPTS):
+            signature = self._stat_signature()
+            words, positions = self._read()
+            # Another process may have appended, rotated or compacted while
+            # we read; only keep a snapshot nothing moved under
+            if self._stat_signature() == signature:
+                break
+        elapsed = time.perf_counter() - started
+
+        self._words = words
+        self._positions = positions
+        self._signature = signature
+        self.load_count += 1
+        self.last_load_seconds = elapsed
+        self.total_load_seconds += elapsed
+        self.last_loaded_at = time.time()
+
+    def _read(self) -> Tuple[List[WordRecord], Dict[str, int]]:
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            # Convert each word as soon as it is parsed, so the full list of
+            # dicts never exists alongside the records
+            words = json.load(f, object_hook=_record_hook)
+        if not isinstance(words, list):
+            raise ValueError(f"Expected a JSON array of word objects in {self.file_path}")
+        positions: Dict[str, int] = {}
+        for i, word in enumerate(words):
+            positions.setdefault(text_key(word.get("text")), i)
+        if self.journal is not None:
+            for word in self.journal.replay():
+                word = WordRecord.from_dict(word)
+                key = text_key(word.get("text"))
+                if key in positions:
+                    words[positions[key]] = word
+                else:
+                    positions[key] = len(words)
+                    words.append(word)
+        return words, positions
+
+    def get_words(self) -> List[WordRecord]:
+        """
+        Return the cached word list, reloading it if the file changed.
+
+        The returned list is shared; callers must not mutate it.
+        """
+        with self._lock:
+            if self._words is None or self._stat_signature() != self._signature:
+                self._load()
+            return self._words
+
+    def lookup(self, text: str) -> Optional[WordRecord]:
+        """Find a word by text in O(1), ignoring case"""
+        with self._lock:
+            words = self.get_words()
+            position = self._positions.get(text_key(text))
+            return words[position] if position is not None else None
+
+    def upsert(self, word: Dict[str, Any]) -> List[WordRecord]:
+        """
+        Insert or replace a word in memory and keep the index in sync.
+
+        Readers holding the previous list are unaffected (copy-on-write).
+        Does not re-check the file, so a journaled write is not re-read;
+        call mark_persisted() once the change is on disk.
+        """
+        return self.upsert_many([word])
+    
+    def upsert_many(self, new_words: Iterable[Dict[str, Any]]) -> List[WordRecord]:
+        """upsert() for a batch, copying the word list once; new words are appended in order"""
+        with self._lock:
+            if self._words is None:
+                self._load()
+            words = list(self._words)
+            for word in new_words:
+                word = WordRecord.from_dict(word)
+                key = text_key(word.get("text"))
+                position = self._positions.get(key)
+                if position is None:
+                    self._positions[key] = len(words)
+                    words.append(word)
+                else:
+                    words[position] = word
+                self.save_count += 1
+            self._words = words
+            return words
+
+    @property
+    def signature(self) -> Optional[Tuple[Any, ...]]:
+        """File stamp the cached words correspond to"""
+        return self._signature
+
+    def adopt(self, words: List[WordRecord], signature: Tuple[Any, ...]) -> None:
+        """
+        Take a word list loaded elsewhere (e.g. by a worker process) as if
+        _load() had read it at `signature`.
+        """
+        with self._lock:
+            positions: Dict[str, int] = {}
+            for i, word in enumerate(words):
+                positions.setdefault(text_key(word.get("text")), i)
+            self._words = words
+            self._positions = positions
+            self._signature = signature
+            self.load_count += 1
+            self.last_loaded_at = time.time()
+
+    def mark_persisted(self) -> None:
+        """Accept the current file state as matching memory (no re-parse)"""
+        with self._lock:
+            self._signature = self._stat_signature()
+
+    def mark_compacted(self) -> None:
+        """
+        Accept the file a compaction just wrote (no re-parse), unless the
+        live journal changed since the last stamp: another process appended
+        meanwhile, so leave the stamp stale and let the next access reload.
+        """
+        with self._lock:
+            current = self._stat_signature()
+            if self._signature is not None and current[2][1] == self._signature[2][1]:
+                self._signature = current
+
+    def invalidate(self) -> None:
+        """Force the next access to reload from disk"""
+        with self._lock:
+            self._words = None
+            self._signature = None
+            self._positions = {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Load timings and reload counters"""
+        with self._lock:
+            return {
+                "file": os.path.basename(self.file_path),
+                "journal_entries": self.journal.entry_count if self.journal is not None else 0,
+                "loaded": self._words is not None,
+                "word_count": len(self._words) if self._words is not None else 0,
+                "load_count": self.load_count,
+                "reload_count": max(self.load_count - 1, 0),
+                "save_count": self.save_count,
+                "last_load_seconds": round(self.last_load_seconds, 4),
+                "total_load_seconds": round(self.total_load_seconds, 4),
+                "last_loaded_at": self.last_loaded_at,
+            }
@@ -0,0 +1,614 @@
+"""
+Corpus Index - Secondary indexes over the word list of any WordDataSource
+No UI dependencies. Words are identified by their position in the list
+returned by get_all_words(); sources keep positions stable across saves
+(updates replace in place, new words are appended).
+"""
+
+import bisect
+import hashlib
+import itertools
+import json
+import random
+import threading
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
+
+from .corpus_cache import text_key
+from .fuzzy_index import FuzzyIndex, MAX_DISTANCE
+from .minimal_pairs import MinimalPairIndex
+from .prefix_trie import PrefixTrie
+from .rhyme_index import RhymeIndex, phonemes
+
+
+# Draws per sample() before settling for a homophone of the word to avoid
+_SAMPLE_ATTEMPTS = 32
+
+# Off-lock builds tried by warm() before building under the lock, in case
+# saves keep landing while it builds
+_WARM_ATTEMPTS = 3
+
+# Content hash arithmetic is modulo 2**128
+_HASH_MASK = (1 << 128) - 1
+
+
+def pronunciation_key(syllables: Optional[Sequence[str]]) -> str:
+    """Normalized phoneme sequence: syllable breaks and spacing removed, stress kept"""
+    return " ".join(phonemes(syllables or []))
+
+
+def _word_digest(word: Dict[str, Any]) -> int:
+    """128-bit hash of one word's canonical JSON"""
+    data = json.dumps(dict(word), sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=list)
+    return int.from_bytes(hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest(), "big")
+
+
+def _suggest_weight(word: Dict[str, Any]) -> float:
+    """Ranking weight for autocomplete: the word's optional "frequency", else 1"""
+    weight = word.get("frequency")
+    return float(weight) if isinstance(weight, (int, float)) else 1.0
+
+
+def _build_trie(words: Sequence[Dict[str, Any]], positions: Iterable[int], vocabulary: Iterable[str]) -> PrefixTrie:
+    items = [(text_key(word.get("text")), _suggest_weight(word)) for word in words]
+    items.extend((text_key(key), 0.0) for key in vocabulary)
+    return PrefixTrie(items)
+
+
+def _build_fuzzy(words: Sequence[Dict[str, Any]], positions: Iterable[int], vocabulary: Iterable[str]) -> FuzzyIndex:
+    corpus_keys = (text_key(word.get("text")) for word in words)
+    vocabulary_keys = (text_key(key) for key in vocabulary)
+    return FuzzyIndex(itertools.chain(corpus_keys, vocabulary_keys))
+
+
+def _build_rhymes(words: Sequence[Dict[str, Any]], positions: Iterable[int], vocabulary: Iterable[str]) -> RhymeIndex:
+    return RhymeIndex(
+        (position, text_key(words[position].get("text")), words[position].get("syllables"))
+        for position in positions
+    )
+
+
+def _build_pairs(words: Sequence[Dict[str, Any]], positions: Iterable[int], vocabulary: Iterable[str]) -> MinimalPairIndex:
+    return MinimalPairIndex((position, words[position].get("syllables")) for position in positions)
+
+
+def _build_content_hash(words: Sequence[Dict[str, Any]], positions: Iterable[int], vocabulary: Iterable[str]) -> int:
+    return sum(_word_digest(words[position]) for position in positions) & _HASH_MASK
+
+
+# warm() name -> (attribute, builder from (words, indexed positions, vocabulary))
+_LAZY_INDEXES = {
+    "suggest": ("_trie", _build_trie),
+    "did_you_mean": ("_fuzzy", _build_fuzzy),
+    "rhymes": ("_rhymes", _build_rhymes),
+    "minimal_pairs": ("_pairs", _build_pairs),
+    "version": ("_content_hash", _build_content_hash),
+}
+
+# Attributes _build() sets; sync() builds them on a scratch index and copies them over
+_BUILT_STATE = (
+    "_words", "_positions", "_by_feature", "_feature_of", "_slot_of", "_homophones",
+    "_pronunciation_of", "_sorted", "_sort_meta", "_trie", "_trie_added", "_fuzzy",
+    "_rhymes", "_pairs", "_content_hash",
+)
+
+
+class CorpusIndex:
+    """Indexes built at load time and maintained incrementally on save"""
+
+    def __init__(self, vocabulary: Iterable[str] = ()):
+        """
+        Args:
+            vocabulary: Extra words offered by suggest() and did_you_mean()
+                        after corpus words (e.g. the CMU dictionary keys)
+        """
+        self._lock = threading.RLock()
+        self._words: Optional[Sequence[Dict[str, Any]]] = None
+        self._positions: Dict[str, int] = {}
+        # feature_id -> word positions, plus the reverse mapping so a word
+        # can leave its partition in O(1) (swap with last, pop)
+        self._by_feature: Dict[str, List[int]] = {}
+        self._feature_of: Dict[int, str] = {}
+        self._slot_of: Dict[int, int] = {}
+        # Homophone groups: pronunciation_key -> word positions
+        self._homophones: Dict[str, List[int]] = {}
+        self._pronunciation_of: Dict[int, str] = {}
+        # Sorted text keys for listing: the whole corpus plus one list per
+        # feature_id, per syllable count and per (feature_id, syllable count),
+        # so any filter combination is a bisect range.
+        self._sorted: Dict[tuple, List[str]] = {}
+        self._sort_meta: Dict[int, Tuple[Optional[str], int]] = {}
+        # Autocomplete trie over corpus + vocabulary, built on first suggest();
+        # words saved since then are kept aside and merged into results.
+        self._vocabulary = vocabulary
+        self._trie: Optional[PrefixTrie] = None
+        self._trie_added: Dict[str, float] = {}
+        # Misspelling index over the same words, built on first did_you_mean()
+        self._fuzzy: Optional[FuzzyIndex] = None
+        # Reversed-phoneme rhyme index, built on first rhymes()
+        self._rhymes: Optional[RhymeIndex] = None
+        # Minimal-pair neighborhoods, built on first minimal_pairs()
+        self._pairs: Optional[MinimalPairIndex] = None
+        # Corpus version: the sum of every word's digest (mod 2**128), so a
+        # save adjusts it by the old and new digests instead of rehashing
+        # the corpus. Computed on first version() call.
+        self._content_hash: Optional[int] = None
+        # Bumped by every change, so an index built without the lock can
+        # tell whether it still matches when it is swapped in
+        self._generation = 0
+        self.build_count = 0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self, words: Sequence[Dict[str, Any]]) -> None:
+        """Rebuild if the source handed out a list we haven't indexed"""
+        with self._lock:
+            if words is self._words:
+                return
+            generation = self._generation
+        # Build aside so queries keep using the current indexes meanwhile
+        staged = CorpusIndex(self._vocabulary)
+        staged._build(words)
+        with self._lock:
+            if words is self._words:
+                return
+            if self._generation != generation:
+                # Changed while we built: our copy may be stale
+                self._build(words)
+                return
+            for name in _BUILT_STATE:
+                setattr(self, name, getattr(staged, name))
+            self._generation += 1
+            self.build_count += 1
+
+    def _build(self, words: Sequence[Dict[str, Any]]) -> None:
+        self._positions = {}
+        self._by_feature = {}
+        self._feature_of = {}
+        self._slot_of = {}
+        self._homophones = {}
+        self._pronunciation_of = {}
+        self._sorted = {}
+        self._sort_meta = {}
+        self._trie = None
+        self._trie_added = {}
+        self._fuzzy = None
+        self._rhymes = None
+        self._pairs = None
+        self._content_hash = None
+        for position, word in enumerate(words):
+            key = text_key(word.get("text"))
+            if key in self._positions:
+                continue
+            self._positions[key] = position
+            self._index_word(position, word)
+            meta = self._list_meta(word)
+            self._sort_meta[position] = meta
+            for list_key in self._list_keys(*meta):
+                self._sorted.setdefault(list_key, []).append(key)
+        for keys in self._sorted.values():
+            keys.sort()
+        self._words = words
+        self._generation += 1
+        self.build_count += 1
+
+    def add(self, word: Dict[str, Any], words: Sequence[Dict[str, Any]]) -> None:
+        """
+        Account for a save_word() without a rebuild.
+
+        `words` is the source's list after the save.
+        """
+        self.add_many([word], words)
+
+    def add_many(self, batch: Sequence[Dict[str, Any]], words: Sequence[Dict[str, Any]]) -> None:
+        """
+        Account for a save_words() without a rebuild.
+
+        `batch` holds distinct texts, in the order they were saved; `words`
+        is the source's list after the save.
+        """
+        with self._lock:
+            if self._words is None:
+                self._build(words)
+                return
+            keys = [text_key(word.get("text")) for word in batch]
+            new_count = sum(1 for key in keys if key not in self._positions)
+            if len(words) != len(self._words) + new_count:
+                # The source reloaded underneath us; positions may have moved
+                self._build(words)
+                return
+            # Replacements first, while the sorted lists are still sorted
+            for key, word in zip(keys, batch):
+                position = self._positions.get(key)
+                if position is None:
+                    continue
+                if self._content_hash is not None:
+                    self._content_hash -= _word_digest(self._words[position])
+                    self._content_hash += _word_digest(words[position])
+                old_pronunciation = self._pronunciation_of.get(position, "")
+                self._unindex_word(position)
+                self._unsort_word(position, key)
+                self._index_word(position, word)
+                self._sort_word(position, key, word)
+                if self._pronunciation_of.get(position, "") != old_pronunciation:
+                    self._repronounce(position, old_pronunciation.split(), word.get("syllables"))
+                self._add_to_lazy_indexes(key, word)
+            # Then new words, at the positions the source appended them to
+            next_position = len(self._words)
+            for key, word in zip(keys, batch):
+                if key in self._positions:
+                    continue
+                position = next_position
+                next_position += 1
+                self._positions[key] = position
+                if self._content_hash is not None:
+                    self._content_hash += _word_digest(words[position])
+                if self._rhymes is not None:
+                    self._rhymes.add(position, word.get("syllables"))
+                if self._pairs is not None:
+                    self._pairs.add(position, word.get("syllables"))
+                self._index_word(position, word)
+                # A batch appends and sorts each list once at the end
+                self._sort_word(position, key, word, insort=new_count == 1)
+                self._add_to_lazy_indexes(key, word)
+            if new_count > 1:
+                for sorted_keys in self._sorted.values():
+                    sorted_keys.sort()
+            if self._content_hash is not None:
+                self._content_hash &= _HASH_MASK
+            self._words = words
+            self._generation += 1
+
+    def _repronounce(self, position: int, old_syllables: Sequence[str], syllables: Sequence[str]) -> None:
+        """Move a word whose pronunciation changed within the phoneme indexes"""
+        if self._rhymes is not None:
+            self._rhymes.remove(position, old_syllables)
+            self._rhymes.add(position, syllables)
+        if self._pairs is not None:
+            self._pairs.remove(position)
+            self._pairs.add(position, syllables)
+
+    def _add_to_lazy_indexes(self, key: str, word: Dict[str, Any]) -> None:
+        if self._trie is not None:
+            self._trie_added[key] = _suggest_weight(word)
+        if self._fuzzy is not None:
+            self._fuzzy.add(key)
+
+    def _index_word(self, position: int, word: Dict[str, Any]) -> None:
+        pronunciation = pronunciation_key(word.get("syllables"))
+        if pronunciation:
+            self._pronunciation_of[position] = pronunciation
+            self._homophones.setdefault(pronunciation, []).append(position)
+
+        feature = word.get("feature_id")
+        if feature is None:
+            return
+        partition = self._by_feature.setdefault(feature, [])
+        self._feature_of[position] = feature
+        self._slot_of[position] = len(partition)
+        partition.append(position)
+
+    def _unindex_word(self, position: int) -> None:
+        pronunciation = self._pronunciation_of.pop(position, None)
+        if pronunciation is not None:
+            group = self._homophones[pronunciation]
+            group.remove(position)
+            if not group:
+                del self._homophones[pronunciation]
+
+        feature = self._feature_of.pop(position, None)
+        if feature is None:
+            return
+        partition = self._by_feature[feature]
+        slot = self._slot_of.pop(position)
+        last = partition.pop()
+        if last != position:
+            partition[slot] = last
+            self._slot_of[last] = slot
+        if not partition:
+            del self._by_feature[feature]
+
+    @staticmethod
+    def _list_meta(word: Dict[str, Any]) -> Tuple[Optional[str], int]:
+        return (word.get("feature_id"), len(word.get("syllables") or []))
+
+    @staticmethod
+    def _list_keys(feature: Optional[str], syllable_count: int) -> List[tuple]:
+        return [
+            ("all",),
+            ("feature", feature),
+            ("syllables", syllable_count),
+            ("feature_syllables", feature, syllable_count),
+        ]
+
+    def _sort_word(self, position: int, key: str, word: Dict[str, Any], insort: bool = True) -> None:
+        meta = self._list_meta(word)
+        self._sort_meta[position] = meta
+        for list_key in self._list_keys(*meta):
+            keys = self._sorted.setdefault(list_key, [])
+            if insort:
+                bisect.insort(keys, key)
+            else:
+                keys.append(key)
+
+    def _unsort_word(self, position: int, key: str) -> None:
+        meta = self._sort_meta.pop(position, None)
+        if meta is None:
+            return
+        for list_key in self._list_keys(*meta):
+            keys = self._sorted.get(list_key)
+            if not keys:
+                continue
+            i = bisect.bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                del keys[i]
+            if not keys:
+                del self._sorted[list_key]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def sample(
+        self,
+        features: Optional[Iterable[str]] = None,
+        avoid: Optional[Dict[str, Any]] = None,
+        dedupe: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Pick a random word, optionally restricted to one or more features.
+
+        With `dedupe`, every pronunciation is equally likely however many
+        spellings share it (a draw is kept with probability 1/group size,
+        counting only the spellings in the requested features).
+        Homophones of `avoid` (e.g. the previous word) are skipped when
+        anything else is available. O(1) expected for a single feature
+        (O(k) for k features); None if nothing matches.
+        """
+        with self._lock:
+            words = self._words
+            if not words:
+                return None
+
+            if features:
+                selected = set(features)
+                partitions = [self._by_feature[f] for f in selected if f in self._by_feature]
+                total = sum(len(p) for p in partitions)
+                if not total:
+                    return None
+            else:
+                partitions = None
+                total = len(words)
+
+            def draw() -> int:
+                pick = random.randrange(total)
+                if partitions is None:
+                    return pick
+                for partition in partitions:
+                    if pick < len(partition):
+                        return partition[pick]
+                    pick -= len(partition)
+                raise IndexError(pick)
+
+            avoid_key = None
+            if avoid is not None:
+                avoid_key = pronunciation_key(avoid.get("syllables")) or None
+
+            position = fallback = None
+            for _ in range(_SAMPLE_ATTEMPTS):
+                position = draw()
+                pronunciation = self._pronunciation_of.get(position)
+                if avoid_key is not None and pronunciation == avoid_key:
+                    continue
+                if fallback is None:
+                    fallback = position
+                if dedupe and pronunciation is not None:
+                    group = self._homophones[pronunciation]
+                    if partitions is None:
+                        size = len(group)
+                    else:
+                        # Only the spellings that can be drawn here count
+                        size = sum(1 for p in group if self._feature_of.get(p) in selected)
+                    if size > 1 and random.randrange(size):
+                        continue
+                return words[position]
+            # Only homophones of `avoid` (or unlucky draws): settle for something
+            return words[fallback if fallback is not None else position]
+
+    def homophones(self, syllables: Sequence[str], exclude: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Corpus words with exactly this pronunciation, alphabetically"""
+        with self._lock:
+            exclude_key = text_key(exclude) if exclude else None
+            group = self._homophones.get(pronunciation_key(syllables), [])
+            words = [self._words[p] for p in group]
+            words = [w for w in words if text_key(w.get("text")) != exclude_key]
+            return sorted(words, key=lambda w: text_key(w.get("text")))
+
+    def homophone_group_count(self) -> int:
+        """Number of distinct pronunciations in the corpus"""
+        with self._lock:
+            return len(self._homophones)
+
+    def page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        feature_id: Optional[str] = None,
+        syllable_count: Optional[int] = None,
+        prefix: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """
+        One page of words in text order, with optional filters.
+
+        `after` is the text of the last word on the previous page. Returns
+        (words, total matching, cursor for the next page or None). Cost is
+        O(log n + limit) whatever the corpus size.
+        """
+        with self._lock:
+            if feature_id is not None and syllable_count is not None:
+                list_key = ("feature_syllables", feature_id, syllable_count)
+            elif feature_id is not None:
+                list_key = ("feature", feature_id)
+            elif syllable_count is not None:
+                list_key = ("syllables", syllable_count)
+            else:
+                list_key = ("all",)
+            keys = self._sorted.get(list_key, [])
+
+            lo, hi = 0, len(keys)
+            if prefix:
+                prefix = text_key(prefix)
+                lo = bisect.bisect_left(keys, prefix)
+                # Keys with the prefix end before the prefix with its last
+                # character below U+10FFFF bumped (no such bound if it's all
+                # U+10FFFF)
+                stem = prefix.rstrip("\U0010ffff")
+                hi = bisect.bisect_left(keys, stem[:-1] + chr(ord(stem[-1]) + 1)) if stem else len(keys)
+            start = lo
+            if after is not None:
+                start = max(lo, bisect.bisect_right(keys, text_key(after)))
+            end = min(start + limit, hi)
+
+            page_keys = keys[start:end]
+            words = [self._words[self._positions[key]] for key in page_keys]
+            next_after = page_keys[-1] if page_keys and end < hi else None
+            return words, hi - lo, next_after
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Tuple[str, float, bool]]:
+        """
+        Autocomplete `prefix` over corpus words and the vocabulary.
+
+        Returns up to `limit` (text, weight, in_corpus) tuples, highest weight
+        first; vocabulary-only words have weight 0 and rank after corpus words.
+        """
+        with self._lock:
+            self._ensure("suggest")
+            prefix = text_key(prefix)
+            matches = self._trie.complete(prefix, limit)
+            if self._trie_added:
+                merged = dict(matches)
+                for key, weight in self._trie_added.items():
+                    if key.startswith(prefix):
+                        merged[key] = max(weight, merged.get(key, weight))
+                matches = sorted(merged.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+            return [(key, weight, key in self._positions) for key, weight in matches]
+
+    def did_you_mean(self, text: str, max_distance: int = MAX_DISTANCE, limit: int = 5) -> List[Tuple[str, int, bool]]:
+        """
+        Corpus and vocabulary words within `max_distance` edits of `text`.
+
+        Returns up to `limit` (text, distance, in_corpus) tuples, closest
+        first and corpus words before vocabulary-only ones.
+        """
+        with self._lock:
+            self._ensure("did_you_mean")
+            matches = [
+                (key, distance, key in self._positions)
+                for key, distance in self._fuzzy.search(text_key(text), max_distance, limit=len(self._fuzzy))
+            ]
+            matches.sort(key=lambda m: (m[1], not m[2], m[0]))
+            return matches[:limit]
+
+    def rhymes(
+        self,
+        syllables: Sequence[str],
+        offset: int = 0,
+        limit: int = 20,
+        exclude: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Corpus words rhyming with a pronunciation (last stressed vowel onward).
+
+        `exclude` is the text of the word the syllables belong to. Returns
+        (page of words, total rhymes).
+        """
+        with self._lock:
+            self._ensure("rhymes")
+            tokens = phonemes(syllables)
+            exclude_position = self._positions.get(text_key(exclude)) if exclude else None
+            positions, total = self._rhymes.rhymes(tokens, offset, limit, exclude_position)
+            return [self._words[position] for position in positions], total
+
+    def minimal_pairs(self, syllables: Sequence[str], phoneme: Optional[str] = None) -> List[Tuple[Dict[str, Any], int, str, str]]:
+        """
+        Corpus words whose phonemes differ from a pronunciation in exactly one
+        position (stress ignored).
+
+        Returns (word, phoneme index, own phoneme, their phoneme) tuples,
+        optionally only contrasts involving `phoneme` (e.g. "R").
+        """
+        with self._lock:
+            self._ensure("minimal_pairs")
+            tokens = [token.rstrip("012") for token in phonemes(syllables)]
+            wanted = phoneme.upper() if phoneme else None
+            pairs = []
+            for position, index in self._pairs.pairs_for(tokens):
+                word = self._words[position]
+                theirs = phonemes(word.get("syllables") or [])[index].rstrip("012")
+                if wanted and wanted not in (tokens[index], theirs):
+                    continue
+                pairs.append((word, index, tokens[index], theirs))
+            pairs.sort(key=lambda p: (p[1], p[3], text_key(p[0].get("text"))))
+            return pairs
+
+    # ------------------------------------------------------------------
+    # Lazily built indexes (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _ensure(self, name: str) -> None:
+        attribute, builder = _LAZY_INDEXES[name]
+        if getattr(self, attribute) is None:
+            setattr(self, attribute, builder(self._words or (), self._positions.values(), self._vocabulary))
+
+    def warm(self, name: str) -> None:
+        """
+        Build one lazily built index now instead of on first use: "suggest",
+        "did_you_mean", "rhymes", "minimal_pairs" or "version".
+
+        The build runs without the lock, on a snapshot, and is swapped in
+        only if nothing was saved meanwhile; queries aren't held up by it.
+        """
+        if name not in _LAZY_INDEXES:
+            raise ValueError(f"Unknown index: {name}")
+        attribute, builder = _LAZY_INDEXES[name]
+        for _ in range(_WARM_ATTEMPTS):
+            with self._lock:
+                if getattr(self, attribute) is not None:
+                    return
+                generation = self._generation
+                snapshot = (self._words or (), list(self._positions.values()), self._vocabulary)
+            built = builder(*snapshot)
+            with self._lock:
+                if self._generation == generation:
+                    if getattr(self, attribute) is None:
+                        setattr(self, attribute, built)
+                    return
+        with self._lock:
+            self._ensure(name)
+
+    def set_vocabulary(self, vocabulary: Iterable[str]) -> None:
+        """Replace the extra suggest()/did_you_mean() words (e.g. once loaded)"""
+        with self._lock:
+            self._vocabulary = vocabulary
+            self._generation += 1
+            self._trie = None
+            self._trie_added = {}
+            self._fuzzy = None
+
+    def feature_counts(self) -> Dict[str, int]:
+        """Number of words per feature_id"""
+        with self._lock:
+            return {feature: len(positions) for feature, positions in self._by_feature.items()}
+
+    def version(self) -> str:
+        """
+        Content hash of the indexed corpus.
+
+        Depends only on the set of words, not on their order or on how
+        often the corpus was reloaded, so every worker process serving the
+        same corpus reports the same version.
+        """
+        with self._lock:
+            self._ensure("version")
+            return f"{self._content_hash:032x}"
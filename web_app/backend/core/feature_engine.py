@@ -3,8 +3,11 @@ American Accent Feature Detection and Educational Engine
 Provides detection rules, examples, and explanations for each pronunciation feature
 """
 
+import hashlib
+import json
+import os
 import re
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 # ============================================================================
@@ -426,3 +429,21 @@ def get_feature_summary() -> List[Dict[str, str]]:
         }
         for fid, fdata in FEATURE_DEFINITIONS.items()
     ]
+
+
+# Cached by get_features_version()
+_features_version: Optional[Tuple[str, float]] = None
+
+
+def get_features_version() -> Tuple[str, float]:
+    """
+    (content hash, last-modified time) of FEATURE_DEFINITIONS.
+    The definitions only change when this file is edited, so the hash is
+    computed once and the time is the file's mtime.
+    """
+    global _features_version
+    if _features_version is None:
+        data = json.dumps(FEATURE_DEFINITIONS, sort_keys=True, ensure_ascii=False)
+        digest = hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+        _features_version = (digest, os.path.getmtime(__file__))
+    return _features_version
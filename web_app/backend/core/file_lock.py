@@ -0,0 +1,86 @@
+"""
+File Lock - Cross-process advisory locking and atomic JSON replacement
+No UI dependencies. Locks live on a sidecar "<file>.lock" so the data file
+itself can be swapped by rename while locked. POSIX uses flock(), Windows
+msvcrt.locking() (exclusive only). Locks are per open file, so two threads
+of one process exclude each other too; never nest the same lock.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def lock_path(path: str) -> str:
+    return path + ".lock"
+
+
+@contextmanager
+def file_lock(path: str, shared: bool = False, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold the advisory lock for `path` for the duration of the block.
+
+    Yields True once acquired. With blocking=False, yields False instead of
+    waiting when another holder has it.
+    """
+    fd = os.open(lock_path(path), os.O_RDWR | os.O_CREAT, 0o644)
+    acquired = False
+    try:
+        if fcntl is not None:
+            flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            try:
+                fcntl.flock(fd, flags if blocking else flags | fcntl.LOCK_NB)
+                acquired = True
+            except BlockingIOError:
+                pass
+        else:
+            while not acquired:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                    acquired = True
+                except OSError:
+                    if not blocking:
+                        break
+                    time.sleep(0.01)
+        yield acquired
+    finally:
+        if acquired and fcntl is None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+def _fsync_directory(path: str) -> None:
+    """Make a rename in this directory durable (no-op where unsupported)"""
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path: str, data: Any, **dump_kwargs: Any) -> None:
+    """
+    Replace `path` with `data` as JSON so readers see the old or the new
+    file, never a partial one: write "<path>.tmp", fsync, rename over.
+
+    Callers serialize writers with file_lock(path); the temp name is fixed.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_directory(path)
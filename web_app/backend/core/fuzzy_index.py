@@ -0,0 +1,157 @@
+"""
+Fuzzy Index - "Did you mean" lookup for misspelled words
+No UI dependencies. A deletion-neighborhood index: every word is filed
+under the hashes of itself and each string obtained by deleting one
+character, kept as two parallel sorted arrays rather than a dict of strings.
+Two words within one edit always share such a string, so a distance-1
+query is len(query) + 1 lookups; distance 2 adds the query's two-character
+deletions and a targeted one-edit expansion (see _probes). Candidates are
+then confirmed with a bounded Levenshtein distance.
+"""
+
+import bisect
+from array import array
+from typing import Dict, Iterable, List, Set, Tuple
+
+MAX_DISTANCE = 2
+
+
+def _neighborhood(word: str) -> Set[str]:
+    """The word plus every one-character deletion of it"""
+    return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def bounded_levenshtein(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance of a and b, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) > len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        # Only cells within `limit` of the diagonal can stay under the limit
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        current = [limit + 1] * (len(b) + 1)
+        if lo == 1:
+            current[0] = i
+        row_min = current[0] if lo == 1 else limit + 1
+        for j in range(lo, hi + 1):
+            cost = previous[j - 1] + (ca != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return limit + 1
+        previous = current
+    return min(previous[len(b)], limit + 1)
+
+
+class FuzzyIndex:
+    """Edit-distance lookup (up to MAX_DISTANCE) over a fixed word list"""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._words: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._alphabet: Set[str] = set()
+        hashes = array("q")
+        owners = array("I")
+        for word in words:
+            if not word or word in self._ids:
+                continue
+            word_id = self._register(word)
+            for variant in _neighborhood(word):
+                hashes.append(hash(variant))
+                owners.append(word_id)
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self._hashes = array("q", (hashes[i] for i in order))
+        self._owners = array("I", (owners[i] for i in order))
+        # Words added after construction; the arrays stay read-only
+        self._added: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._hashes) + sum(len(ids) for ids in self._added.values())
+
+    def _register(self, word: str) -> int:
+        word_id = len(self._words)
+        self._words.append(word)
+        self._ids[word] = word_id
+        self._alphabet.update(word)
+        return word_id
+
+    def add(self, word: str) -> None:
+        if not word or word in self._ids:
+            return
+        word_id = self._register(word)
+        for variant in _neighborhood(word):
+            self._added.setdefault(hash(variant), []).append(word_id)
+
+    def _lookup(self, variant: str, into: Set[int]) -> None:
+        key = hash(variant)
+        i = bisect.bisect_left(self._hashes, key)
+        while i < len(self._hashes) and self._hashes[i] == key:
+            into.add(self._owners[i])
+            i += 1
+        if self._added:
+            into.update(self._added.get(key, ()))
+
+    def _probes(self, query: str, max_distance: int) -> Set[str]:
+        """
+        Strings to look up so that every word within max_distance is found.
+
+        A word w within the distance shares a string with the query once a
+        deletions are taken from the query and b from w. The index holds
+        b <= 1, so the query side supplies up to two deletions. The only
+        alignments needing b == 2 are covered by applying one of w's edits
+        to the query first: two insertions or a substitution plus an
+        insertion (probe the query with one insertion or substitution), or
+        two substitutions at i < j (substitute at i, then delete at j).
+        """
+        probes = {query}
+        if max_distance == 0:
+            return probes
+        deletions = _neighborhood(query)
+        probes |= deletions
+        if max_distance == 1:
+            return probes
+        for deletion in deletions:
+            probes |= _neighborhood(deletion)
+        for i in range(len(query) + 1):
+            left, right = query[:i], query[i:]
+            for char in self._alphabet:
+                probes.add(left + char + right)
+                if right and char != right[0]:
+                    substituted = left + char
+                    tail = right[1:]
+                    probes.add(substituted + tail)
+                    probes.update(substituted + tail[:j] + tail[j + 1:] for j in range(len(tail)))
+        return probes
+
+    def search(self, query: str, max_distance: int = MAX_DISTANCE, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Words within `max_distance` edits of `query`, closest first.
+
+        Returns (word, distance) pairs; the query itself is included at
+        distance 0 if indexed.
+        """
+        max_distance = max(0, min(max_distance, MAX_DISTANCE))
+        candidates: Set[int] = set()
+        for probe in self._probes(query, max_distance):
+            self._lookup(probe, candidates)
+
+        matches = []
+        for word_id in candidates:
+            word = self._words[word_id]
+            distance = bounded_levenshtein(query, word, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, word))
+        matches.sort()
+        return [(word, distance) for distance, word in matches[:limit]]
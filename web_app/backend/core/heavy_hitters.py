@@ -0,0 +1,163 @@
+"""
+Heavy Hitters - Bounded top-K counting (Space-Saving)
+No UI dependencies. Counts at most `capacity` distinct items: when a new
+item arrives and the table is full, it replaces the item with the lowest
+count and inherits that count as its possible overestimate (`error`). Any
+item whose true count exceeds total / capacity is guaranteed to be kept,
+and a kept item's count is exact to within its error.
+
+Counts live in a "stream summary": a doubly linked list of buckets, one
+per distinct count, in ascending order. A +1 moves an item to the next
+bucket and eviction takes from the first, both O(1); top(n) walks from the
+last bucket, so it never sorts.
+"""
+
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class _Bucket:
+    __slots__ = ("count", "items", "prev", "next")
+
+    def __init__(self, count: int):
+        self.count = count
+        # Used as an ordered set: the oldest item in a bucket is evicted first
+        self.items: Dict[Hashable, None] = {}
+        self.prev: Optional["_Bucket"] = None
+        self.next: Optional["_Bucket"] = None
+
+
+class SpaceSaving:
+    """
+    Space-Saving sketch over at most `capacity` items.
+
+    `counts` and `errors` are plain dicts (item -> count, item -> maximum
+    overcount) kept in step with the buckets, so they can be stored as JSON
+    and passed back to the constructor.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        counts: Optional[Dict[Hashable, int]] = None,
+        errors: Optional[Dict[Hashable, int]] = None,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        self._bucket_of: Dict[Hashable, _Bucket] = {}
+        self._first: Optional[_Bucket] = None
+        self._last: Optional[_Bucket] = None
+        if counts:
+            errors = errors or {}
+            # One sort when loading; every later update keeps the order
+            ordered = sorted(counts.items(), key=lambda item: item[1])[-capacity:]
+            for item, count in ordered:
+                if count > 0:
+                    self.counts[item] = count
+                    self.errors[item] = errors.get(item, 0)
+                    self._place(item, count, self._last)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.counts
+
+    @property
+    def min_count(self) -> int:
+        """Upper bound on the count of any item not in the sketch"""
+        if len(self.counts) < self.capacity or self._first is None:
+            return 0
+        return self._first.count
+
+    def _place(self, item: Hashable, count: int, after: Optional[_Bucket]) -> None:
+        """Put item in the bucket for `count`, searching forward from `after`"""
+        bucket = after
+        if bucket is None and self._first is not None and self._first.count <= count:
+            bucket = self._first
+        if bucket is not None:
+            while bucket.next is not None and bucket.next.count <= count:
+                bucket = bucket.next
+        if bucket is not None and bucket.count == count:
+            target = bucket
+        else:
+            target = _Bucket(count)
+            # Link target after `bucket` (or at the front when None)
+            target.prev = bucket
+            target.next = bucket.next if bucket is not None else self._first
+            if target.next is not None:
+                target.next.prev = target
+            else:
+                self._last = target
+            if bucket is not None:
+                bucket.next = target
+            else:
+                self._first = target
+        target.items[item] = None
+        self._bucket_of[item] = target
+
+    def _unlink_if_empty(self, bucket: _Bucket) -> None:
+        if bucket.items:
+            return
+        if bucket.prev is not None:
+            bucket.prev.next = bucket.next
+        else:
+            self._first = bucket.next
+        if bucket.next is not None:
+            bucket.next.prev = bucket.prev
+        else:
+            self._last = bucket.prev
+
+    def add(self, item: Hashable, weight: int = 1) -> Optional[Hashable]:
+        """
+        Count `weight` more occurrences of item, O(1) for weight 1. Returns
+        the item evicted to make room, if any.
+        """
+        if weight <= 0:
+            return None
+        victim = None
+        bucket = self._bucket_of.get(item)
+        if bucket is not None:
+            count = self.counts[item] + weight
+        elif len(self.counts) < self.capacity:
+            count = weight
+            self.errors[item] = 0
+        else:
+            # Replace the oldest item with the lowest count
+            bucket = self._first
+            victim = next(iter(bucket.items))
+            del bucket.items[victim]
+            del self._bucket_of[victim]
+            del self.counts[victim]
+            del self.errors[victim]
+            count = bucket.count + weight
+            self.errors[item] = bucket.count
+        self.counts[item] = count
+        if bucket is not None:
+            bucket.items.pop(item, None)
+            self._place(item, count, bucket)
+            self._unlink_if_empty(bucket)
+        else:
+            self._place(item, count, None)
+        return victim
+
+    def iter_top(self) -> Iterator[Tuple[Hashable, int, int]]:
+        """(item, count, error), highest count first; ties oldest first"""
+        bucket = self._last
+        while bucket is not None:
+            for item in bucket.items:
+                yield item, bucket.count, self.errors[item]
+            bucket = bucket.prev
+
+    def top(self, n: int) -> List[Tuple[Hashable, int, int]]:
+        """The n highest counts without sorting: O(n + buckets visited)"""
+        result = []
+        if n <= 0:
+            return result
+        for entry in self.iter_top():
+            result.append(entry)
+            if len(result) >= n:
+                break
+        return result
@@ -0,0 +1,88 @@
+"""
+JSON Stream - Incremental reader for large word files
+No UI dependencies. Yields the elements of a top-level JSON array one at a
+time, holding only a small window of the file in memory.
+"""
+
+import json
+from typing import Any, Iterator
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+# What may follow an item inside the array
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_json_array(file_path: str, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Stream the items of a JSON array file.
+
+    Memory stays bounded by the chunk size plus the largest single item,
+    instead of the whole file plus every parsed object.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace() -> None:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return
+
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != "[":
+            raise ValueError(f"Expected a JSON array of word objects in {file_path}")
+        pos += 1
+
+        expect_item = True
+        count = 0
+        while True:
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise ValueError(f"Unexpected end of file in {file_path}")
+            char = buffer[pos]
+            if char == "]":
+                if expect_item and count:
+                    raise ValueError(f"Trailing ',' in {file_path}")
+                return
+            if char == ",":
+                if expect_item:
+                    raise ValueError(f"Unexpected ',' in {file_path}")
+                pos += 1
+                expect_item = True
+                continue
+            if not expect_item:
+                raise ValueError(f"Expected ',' or ']' in {file_path}")
+
+            while True:
+                try:
+                    item, end = _DECODER.raw_decode(buffer, pos)
+                    # A number or literal is only complete once a delimiter
+                    # follows: "1" may be the start of "1.5" or "1e5", and
+                    # raw_decode stops at a trailing "1." or "1e" too.
+                    if eof or char in '{["' or (end < len(buffer) and buffer[end] in _DELIMITERS):
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                if not fill():
+                    item, end = _DECODER.raw_decode(buffer, pos)
+                    break
+            pos = end
+            expect_item = False
+            count += 1
+            yield item
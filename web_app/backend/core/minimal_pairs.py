@@ -0,0 +1,166 @@
+"""
+Minimal Pairs - Words whose phonemes differ in exactly one position
+No UI dependencies. Every pronunciation (stress ignored) is filed under
+one hashed key per position, with that position wildcarded ("K * T" for
+"K AE T"). Words sharing a key differ at most at the wildcard, so the pairs
+of a word are a handful of lookups instead of a comparison with every other
+word. Keys are kept as two parallel sorted arrays, like FuzzyIndex.
+"""
+
+import bisect
+from array import array
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .rhyme_index import phoneme_code, phonemes
+
+_WILDCARD = "*"
+
+
+def encode_phonemes(tokens: Sequence[str]) -> str:
+    """One character per phoneme, stress removed"""
+    return "".join(phoneme_code(token.rstrip("012")) for token in tokens)
+
+
+def _wildcard_keys(encoded: str) -> Iterator[Tuple[int, int]]:
+    for i in range(len(encoded)):
+        yield i, hash(encoded[:i] + _WILDCARD + encoded[i + 1:])
+
+
+class MinimalPairIndex:
+    """One-position-wildcard neighborhoods over word pronunciations"""
+
+    def __init__(self, entries: Iterable[Tuple[int, Sequence[str]]]):
+        """
+        Args:
+            entries: (position, syllables) for every word
+        """
+        # Stress-free pronunciation (code string) per position
+        self._encoded: List[Optional[str]] = []
+        hashes = array("q")
+        owners = array("I")
+        for position, syllables in entries:
+            encoded = self._register(position, syllables)
+            for _, key in _wildcard_keys(encoded):
+                hashes.append(key)
+                owners.append(position)
+        order = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self._hashes = array("q", (hashes[i] for i in order))
+        self._owners = array("I", (owners[i] for i in order))
+        # Words added after construction: key hash -> positions
+        self._added = {}
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._hashes) + sum(len(p) for p in self._added.values())
+
+    def _register(self, position: int, syllables: Sequence[str]) -> str:
+        encoded = encode_phonemes(phonemes(syllables or []))
+        if position >= len(self._encoded):
+            self._encoded.extend([None] * (position + 1 - len(self._encoded)))
+        self._encoded[position] = encoded
+        return encoded
+
+    def add(self, position: int, syllables: Sequence[str]) -> None:
+        encoded = self._register(position, syllables)
+        for _, key in _wildcard_keys(encoded):
+            self._added.setdefault(key, []).append(position)
+
+    def remove(self, position: int) -> None:
+        """Drop a word's keys (e.g. before re-adding it with a new pronunciation)"""
+        encoded = self._encoded[position] if position < len(self._encoded) else None
+        if encoded is None:
+            return
+        self._encoded[position] = None
+        for _, key in _wildcard_keys(encoded):
+            added = self._added.get(key)
+            if added and position in added:
+                added.remove(position)
+                if not added:
+                    del self._added[key]
+                continue
+            i = bisect.bisect_left(self._hashes, key)
+            while i < len(self._hashes) and self._hashes[i] == key:
+                if self._owners[i] == position:
+                    del self._hashes[i]
+                    del self._owners[i]
+                    break
+                i += 1
+
+    def _owners_of(self, key: int) -> Iterator[int]:
+        i = bisect.bisect_left(self._hashes, key)
+        while i < len(self._hashes) and self._hashes[i] == key:
+            yield self._owners[i]
+            i += 1
+        yield from self._added.get(key, ())
+
+    def _differs_only_at(self, position: int, encoded: str, index: int) -> bool:
+        other = self._encoded[position] if position < len(self._encoded) else None
+        return (
+            other is not None
+            and len(other) == len(encoded)
+            and other[index] != encoded[index]
+            and other[:index] == encoded[:index]
+            and other[index + 1:] == encoded[index + 1:]
+        )
+
+    def pairs_for(self, tokens: Sequence[str]) -> List[Tuple[int, int]]:
+        """
+        Minimal pairs of a pronunciation.
+
+        Returns (position, phoneme index) for every indexed word that differs
+        from `tokens` in exactly one phoneme; homophones are not pairs.
+        """
+        return self._pairs_of(encode_phonemes(tokens))
+
+    def _pairs_of(self, encoded: str) -> List[Tuple[int, int]]:
+        pairs = []
+        for index, key in _wildcard_keys(encoded):
+            for position in self._owners_of(key):
+                if self._differs_only_at(position, encoded, index):
+                    pairs.append((position, index))
+        return pairs
+
+    def iter_pairs(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Every minimal pair in the index once, as (position a, position b,
+        phoneme index), by walking runs of equal keys in the sorted arrays.
+        """
+        yield from self._iter_base_pairs()
+        # Pairs involving words added later
+        added_positions = {p for positions in self._added.values() for p in positions}
+        for position in sorted(added_positions):
+            for other, index in self._pairs_of(self._encoded[position]):
+                if other not in added_positions or other < position:
+                    yield other, position, index
+
+    def _iter_base_pairs(self) -> Iterator[Tuple[int, int, int]]:
+        hashes, owners = self._hashes, self._owners
+        n = len(hashes)
+        start = 0
+        while start < n:
+            end = start + 1
+            while end < n and hashes[end] == hashes[start]:
+                end += 1
+            if end - start > 1:
+                for i in range(start, end):
+                    a = owners[i]
+                    encoded = self._encoded[a]
+                    for j in range(i + 1, end):
+                        b = owners[j]
+                        index = self._mismatch(encoded, self._encoded[b])
+                        if index is not None:
+                            yield a, b, index
+            start = end
+
+    @staticmethod
+    def _mismatch(a: str, b: str) -> Optional[int]:
+        """The single differing index of two equal-length codes, else None"""
+        if len(a) != len(b):
+            return None
+        index = None
+        for i, (x, y) in enumerate(zip(a, b)):
+            if x != y:
+                if index is not None:
+                    return None
+                index = i
+        return index
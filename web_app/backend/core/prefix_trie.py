@@ -0,0 +1,121 @@
+"""
+Prefix Trie - Array-backed autocomplete index
+No UI dependencies. Built once from (key, weight) pairs and then read-only.
+Nodes live in flat arrays in breadth-first order (children of a node are
+contiguous, one label character per node), and every node covers a
+contiguous range of the sorted key list, so a completion is a walk of
+len(prefix) steps followed by a top-N over that range.
+"""
+
+import heapq
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+_ROOT_LABEL = "\0"
+
+
+class PrefixTrie:
+    """Read-only prefix trie with weighted top-N completion"""
+
+    def __init__(self, items: Iterable[Tuple[str, float]], top_k: int = 16, scan_limit: int = 256):
+        """
+        Args:
+            items: (key, weight) pairs; duplicate keys keep the highest weight
+            top_k: Completions cached per node for large subtrees (0 to skip)
+            scan_limit: Subtrees up to this many keys are ranked on demand
+        """
+        best: Dict[str, float] = {}
+        for key, weight in items:
+            if key and (key not in best or weight > best[key]):
+                best[key] = weight
+        self._keys: List[str] = sorted(best)
+        self._weights = array("d", (best[key] for key in self._keys))
+        self._top_k = top_k
+
+        # Node arrays; node 0 is the root
+        self._lo = array("I", [0])
+        self._hi = array("I", [len(self._keys)])
+        self._first_child = array("I", [0])
+        self._child_count = array("I", [0])
+        labels = [_ROOT_LABEL]
+
+        keys = self._keys
+        node = 0
+        depth_of = [0]
+        while node < len(self._lo):
+            lo, hi, depth = self._lo[node], self._hi[node], depth_of[node]
+            self._first_child[node] = len(self._lo)
+            i = lo
+            # A key equal to this node's prefix sorts first and has no child
+            if i < hi and len(keys[i]) == depth:
+                i += 1
+            while i < hi:
+                char = keys[i][depth]
+                j = i + 1
+                while j < hi and keys[j][depth] == char:
+                    j += 1
+                self._lo.append(i)
+                self._hi.append(j)
+                self._first_child.append(0)
+                self._child_count.append(0)
+                labels.append(char)
+                depth_of.append(depth + 1)
+                self._child_count[node] += 1
+                i = j
+            node += 1
+        self._labels = "".join(labels)
+
+        # Precomputed rankings for the few nodes with large subtrees
+        self._top: Dict[int, Tuple[int, ...]] = {}
+        for node in range(len(self._lo)):
+            lo, hi = self._lo[node], self._hi[node]
+            if top_k and hi - lo > scan_limit:
+                self._top[node] = tuple(self._rank(lo, hi, top_k))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._lo)
+
+    def _rank(self, lo: int, hi: int, limit: int) -> List[int]:
+        # Stable: equal weights stay in alphabetical order
+        return heapq.nlargest(limit, range(lo, hi), key=self._weights.__getitem__)
+
+    def _find(self, prefix: str) -> int:
+        node = 0
+        for char in prefix:
+            first = self._first_child[node]
+            node = self._labels.find(char, first, first + self._child_count[node])
+            if node < 0:
+                return -1
+        return node
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """Up to `limit` keys starting with `prefix`, highest weight first"""
+        if limit <= 0:
+            return []
+        node = self._find(prefix)
+        if node < 0:
+            return []
+        top = self._top.get(node)
+        if top is not None and limit <= self._top_k:
+            positions = top[:limit]
+        else:
+            positions = self._rank(self._lo[node], self._hi[node], limit)
+        return [(self._keys[i], self._weights[i]) for i in positions]
+
+    def count(self, prefix: str) -> int:
+        """Number of keys starting with `prefix`"""
+        lo, hi = self.span(prefix)
+        return hi - lo
+
+    def span(self, prefix: str) -> Tuple[int, int]:
+        """Range [lo, hi) of sorted key indexes starting with `prefix`"""
+        node = self._find(prefix)
+        return (0, 0) if node < 0 else (self._lo[node], self._hi[node])
+
+    def key_at(self, index: int) -> str:
+        """Key at a sorted position (see span())"""
+        return self._keys[index]
@@ -3,10 +3,82 @@ Progress Tracking Service - Track user quiz performance
 No UI dependencies. Pure business logic.
 """
 
+import copy
+import hashlib
+import heapq
 import json
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from collections import OrderedDict
+from operator import itemgetter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .file_lock import atomic_write_json, file_lock
+from .heavy_hitters import SpaceSaving
+
+# (word, correct, feature) as passed to save_attempt()
+Attempt = Tuple[str, bool, str]
+
+# Snapshot key naming the journal generation that continues it
+_GENERATION_KEY = "_journal_generation"
+# Snapshot key holding each bounded most_missed entry's possible overcount
+_MISSED_ERRORS_KEY = "_most_missed_errors"
+
+
+def _init_stats() -> Dict[str, Any]:
+    return {
+        "total_rounds": 0,
+        "correct": 0,
+        "skipped": 0,
+        "attempts_per_word": {},
+        "per_feature": {},
+        "most_missed": {}
+    }
+
+
+def _apply_attempt(
+    stats: Dict[str, Any], word: str, correct: bool, feature: str, missed: Optional[SpaceSaving] = None
+) -> None:
+    stats["total_rounds"] += 1
+    
+    if correct:
+        stats["correct"] += 1
+        feat_key = feature if feature != "skip" else "skip"
+        stats["per_feature"][feat_key] = stats["per_feature"].get(feat_key, 0) + 1
+    elif missed is not None:
+        # stats["most_missed"] is missed.counts, kept in step by the sketch
+        missed.add(word)
+    else:
+        stats["most_missed"][word] = stats["most_missed"].get(word, 0) + 1
+
+
+def _bound_missed(
+    stats: Dict[str, Any], capacity: Optional[int], errors: Optional[Dict[str, int]] = None
+) -> Optional[SpaceSaving]:
+    """
+    With a capacity, swap stats["most_missed"] for the counts of a
+    Space-Saving sketch holding at most `capacity` words (the most missed
+    ones, when loading a larger dict) and return the sketch; else None.
+    """
+    if not capacity:
+        return None
+    missed = SpaceSaving(capacity, stats.get("most_missed"), errors)
+    stats["most_missed"] = missed.counts
+    return missed
+
+
+def _top_missed(stats: Dict[str, Any], missed: Optional[SpaceSaving], n: int) -> List[Dict[str, Any]]:
+    """
+    The n most missed words as {"word", "count", "error"}; `count` may
+    overstate the true count by up to `error` (always 0 when unbounded).
+    """
+    if missed is not None:
+        entries = missed.top(n)
+    else:
+        largest = heapq.nlargest(n, stats["most_missed"].items(), key=itemgetter(1))
+        entries = [(word, count, 0) for word, count in largest]
+    return [{"word": word, "count": count, "error": error} for word, count, error in entries]
 
 
 class ProgressTracker(ABC):
@@ -17,11 +89,20 @@ class ProgressTracker(ABC):
         """Record an answer attempt"""
         pass
     
+    def save_attempts(self, attempts: Iterable[Attempt]) -> None:
+        """Record several attempts; trackers override this to store them in one write"""
+        for word, correct, feature in attempts:
+            self.save_attempt(word, correct, feature)
+    
     @abstractmethod
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics"""
         pass
     
+    def top_missed(self, n: int) -> List[Dict[str, Any]]:
+        """The n most missed words, most missed first"""
+        return _top_missed(self.get_stats(), None, n)
+    
     @abstractmethod
     def reset(self) -> None:
         """Clear all stats"""
@@ -29,85 +110,478 @@ class ProgressTracker(ABC):
 
 
 class FileProgressTracker(ProgressTracker):
-    """Save progress to JSON file"""
+    """
+    Save progress to a JSON snapshot plus an append-only attempt journal.
+    
+    Each batch of attempts is appended to the journal as one compact JSON
+    line per attempt (single write + fsync, under a file lock), so a write
+    costs the same however large most_missed grows. Once the journal holds
+    `compact_threshold` entries the stats are written to the snapshot
+    atomically and a new journal generation starts. The snapshot names its
+    generation, so attempts folded into it are never replayed twice, even
+    after a crash mid-compaction. Other processes' appends are picked up by
+    replaying only the journal's new tail.
+    
+    With `missed_capacity`, most_missed keeps only that many words in a
+    Space-Saving sketch (see heavy_hitters), so a long-lived tracker's
+    stats stop growing with every distinct word missed.
+    """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, compact_threshold: int = 1000, missed_capacity: Optional[int] = None):
         self.file_path = file_path
+        self.compact_threshold = compact_threshold
+        self.missed_capacity = missed_capacity
+        self._missed: Optional[SpaceSaving] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._generation = 0
+        # Bytes of the current journal already applied to self.stats
+        self._journal_offset = 0
+        self.journal_entries = 0
+        self.compaction_count = 0
         self._load_or_init()
     
+    def _stat_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _journal_path(self, generation: Optional[int] = None) -> str:
+        return f"{self.file_path}.{self._generation if generation is None else generation}.journal"
+    
+    def _refresh(self) -> None:
+        """Reload if another process replaced the snapshot, else replay new journal lines"""
+        if self._stat_signature() != self._signature:
+            self._load_or_init()
+        else:
+            self._replay_tail()
+    
     def _init_stats(self) -> Dict[str, Any]:
-        return {
-            "total_rounds": 0,
-            "correct": 0,
-            "skipped": 0,
-            "attempts_per_word": {},
-            "per_feature": {},
-            "most_missed": {}
-        }
+        return _init_stats()
     
     def _load_or_init(self):
+        self._signature = self._stat_signature()
+        stats = None
         if os.path.exists(self.file_path):
             try:
                 with open(self.file_path, "r", encoding="utf-8") as f:
-                    self.stats = json.load(f)
+                    stats = json.load(f)
             except (json.JSONDecodeError, IOError):
-                self.stats = self._init_stats()
-        else:
-            self.stats = self._init_stats()
+                pass
+        if not isinstance(stats, dict):
+            stats = self._init_stats()
+        # Snapshots written before the journal existed have no generation
+        self._generation = stats.pop(_GENERATION_KEY, 0)
+        errors = stats.pop(_MISSED_ERRORS_KEY, None)
+        self.stats = stats
+        self._missed = _bound_missed(stats, self.missed_capacity, errors)
+        self._journal_offset = 0
+        self.journal_entries = 0
+        self._replay_tail()
+    
+    def _replay_tail(self) -> None:
+        """Apply journal lines appended since the last replay"""
+        path = self._journal_path()
+        try:
+            if os.path.getsize(path) <= self._journal_offset:
+                return
+            with open(path, "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Stop at the last newline: a line still being appended is read next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Blank, or a partial line left by a crash mid-append
+                continue
+            if isinstance(entry, dict) and "w" in entry:
+                _apply_attempt(self.stats, entry["w"], bool(entry.get("c")), entry.get("f"), self._missed)
+                self.journal_entries += 1
+        self._journal_offset += end
     
     def save_attempt(self, word: str, correct: bool, feature: str) -> None:
-        self.stats["total_rounds"] += 1
-        
-        if correct:
-            self.stats["correct"] += 1
-            feat_key = feature if feature != "skip" else "skip"
-            self.stats["per_feature"][feat_key] = self.stats["per_feature"].get(feat_key, 0) + 1
-        else:
-            self.stats["most_missed"][word] = self.stats["most_missed"].get(word, 0) + 1
-        
+        self.save_attempts([(word, correct, feature)])
+    
+    def save_attempts(self, attempts: Iterable[Attempt]) -> None:
+        """Journal a batch of attempts with one locked append + fsync"""
+        lines = [
+            json.dumps({"w": word, "c": int(correct), "f": feature}, ensure_ascii=False, separators=(",", ":"))
+            for word, correct, feature in attempts
+        ]
+        if not lines:
+            return
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        with file_lock(self.file_path):
+            # Catch up first, so the replay below covers exactly our lines
+            self._refresh()
+            with open(self._journal_path(), "a+b") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Terminate a torn line so this entry starts cleanly
+                        data = b"\n" + data
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._replay_tail()
+            if self.journal_entries >= self.compact_threshold:
+                self._compact()
+    
+    def _compact(self) -> None:
+        """Write the stats as a new-generation snapshot and drop the old journal"""
+        # Caller holds file_lock(self.file_path)
+        old_journal = self._journal_path()
+        self._generation += 1
         self._save()
+        self._journal_offset = 0
+        self.journal_entries = 0
+        if os.path.exists(old_journal):
+            os.remove(old_journal)
+        self._remove_stale_journals()
+        self.compaction_count += 1
+    
+    def _remove_stale_journals(self) -> None:
+        """Delete journals of older generations left by a crash mid-compaction"""
+        directory = os.path.dirname(self.file_path) or "."
+        prefix = os.path.basename(self.file_path) + "."
+        for name in os.listdir(directory):
+            generation = name[len(prefix):-len(".journal")]
+            if name.startswith(prefix) and name.endswith(".journal") and generation.isdigit():
+                if int(generation) < self._generation:
+                    os.remove(os.path.join(directory, name))
     
     def _save(self):
-        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(self.stats, f, indent=2, ensure_ascii=False)
+        # Caller holds file_lock(self.file_path)
+        snapshot = {**self.stats, _GENERATION_KEY: self._generation}
+        if self._missed is not None:
+            snapshot[_MISSED_ERRORS_KEY] = self._missed.errors
+        atomic_write_json(self.file_path, snapshot, indent=2, ensure_ascii=False)
+        self._signature = self._stat_signature()
     
     def get_stats(self) -> Dict[str, Any]:
+        self._refresh()
         return self.stats.copy()
     
+    def top_missed(self, n: int) -> List[Dict[str, Any]]:
+        self._refresh()
+        return _top_missed(self.stats, self._missed, n)
+    
     def reset(self) -> None:
-        self.stats = self._init_stats()
-        self._save()
+        with file_lock(self.file_path):
+            self._refresh()
+            self.stats = self._init_stats()
+            self._missed = _bound_missed(self.stats, self.missed_capacity)
+            self._compact()
 
 
 class LocalProgressTracker(ProgressTracker):
     """Store progress in memory (session only)"""
     
-    def __init__(self):
-        self.stats = self._init_stats()
+    def __init__(self, missed_capacity: Optional[int] = None):
+        self.missed_capacity = missed_capacity
+        self.reset()
     
     def _init_stats(self) -> Dict[str, Any]:
-        return {
-            "total_rounds": 0,
-            "correct": 0,
-            "skipped": 0,
-            "attempts_per_word": {},
-            "per_feature": {},
-            "most_missed": {}
-        }
+        return _init_stats()
     
     def save_attempt(self, word: str, correct: bool, feature: str) -> None:
-        self.stats["total_rounds"] += 1
-        
-        if correct:
-            self.stats["correct"] += 1
-            feat_key = feature if feature != "skip" else "skip"
-            self.stats["per_feature"][feat_key] = self.stats["per_feature"].get(feat_key, 0) + 1
-        else:
-            self.stats["most_missed"][word] = self.stats["most_missed"].get(word, 0) + 1
+        _apply_attempt(self.stats, word, correct, feature, self._missed)
     
     def get_stats(self) -> Dict[str, Any]:
         return self.stats.copy()
     
+    def top_missed(self, n: int) -> List[Dict[str, Any]]:
+        return _top_missed(self.stats, self._missed, n)
+    
     def reset(self) -> None:
         self.stats = self._init_stats()
+        self._missed = _bound_missed(self.stats, self.missed_capacity)
+
+
+class SessionProgressStore(ABC):
+    """
+    Base class for per-learner plus global progress stores.
+    
+    Attempts are buffered by record() and written in batches by flush(),
+    which a background thread also runs every `flush_interval` seconds once
+    start() has been called. A session_id of None means the global stats.
+    """
+    
+    def __init__(self, flush_interval: float, flush_every: int):
+        self.flush_interval = flush_interval
+        self.flush_every = max(flush_every, 1)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.flush_count = 0
+    
+    @abstractmethod
+    def record(
+        self,
+        session_id: Optional[str],
+        word: str,
+        guessed_feature: str,
+        correct_feature: Optional[str],
+        correct: bool,
+        latency_ms: Optional[int] = None,
+    ) -> None:
+        """Buffer an answer attempt"""
+        pass
+    
+    @abstractmethod
+    def flush(self) -> int:
+        """Write pending attempts and cards; returns the attempts written"""
+        pass
+    
+    @abstractmethod
+    def get_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """One learner's stats, or the global stats when session_id is None"""
+        pass
+    
+    @abstractmethod
+    def top_missed(self, session_id: Optional[str], n: int) -> List[Dict[str, Any]]:
+        """
+        One learner's (or everyone's) n most missed words, most missed first,
+        as {"word", "count", "error"}; count may overstate by up to error
+        """
+        pass
+    
+    @abstractmethod
+    def reset(self, session_id: Optional[str] = None) -> None:
+        """Clear one learner's stats, or the global stats when session_id is None"""
+        pass
+    
+    @abstractmethod
+    def save_cards(self, session_id: str, cards: Dict[str, Dict[str, Any]]) -> None:
+        """Buffer changed review cards (word -> card); written with the next flush"""
+        pass
+    
+    @abstractmethod
+    def load_cards(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        """A learner's review cards"""
+        pass
+    
+    @abstractmethod
+    def get_buffer_stats(self) -> Dict[str, Any]:
+        """Pending and flush counters"""
+        pass
+    
+    def start(self) -> None:
+        """Start the background flusher (no-op if already running)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="progress-flush", daemon=True)
+            self._thread.start()
+    
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+    
+    def close(self) -> None:
+        """Stop the flusher and write everything still pending"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+        self._wake.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+
+class SessionProgressRegistry(SessionProgressStore):
+    """
+    Per-learner progress with write-behind batching.
+    
+    Each session_id gets its own FileProgressTracker in `session_dir`, and
+    every attempt also counts toward the global `aggregate` tracker. Attempts
+    are buffered in memory and written in batches - when `flush_every` are
+    pending, every `flush_interval` seconds, and on close() - so an answer
+    costs no disk write. Reading stats flushes first, so it includes pending
+    attempts. A crash can
+    lose at most the attempts since the last flush. Review cards (see
+    review_scheduler) are buffered and flushed the same way, into a
+    `.cards.json` file next to each session's stats.
+    """
+    
+    def __init__(
+        self,
+        aggregate: ProgressTracker,
+        session_dir: str,
+        flush_interval: float = 5.0,
+        flush_every: int = 50,
+        max_sessions: int = 1000,
+        compact_threshold: int = 1000,
+        missed_capacity: Optional[int] = None,
+    ):
+        """
+        Args:
+            aggregate: Tracker holding every learner's attempts combined
+            session_dir: Directory for the per-session stats files
+            flush_interval: Seconds between background flushes
+            flush_every: Pending attempts that trigger a flush right away
+            max_sessions: Idle session trackers kept in memory
+            compact_threshold: Journal size at which a session's stats are snapshotted
+            missed_capacity: Words kept in each session's most_missed (None: all)
+        """
+        super().__init__(flush_interval, flush_every)
+        self.aggregate = aggregate
+        self.session_dir = session_dir
+        self.max_sessions = max_sessions
+        self.compact_threshold = compact_threshold
+        self.missed_capacity = missed_capacity
+        # Serializes flushes so batches reach the files in order
+        self._flush_lock = threading.Lock()
+        self._trackers: "OrderedDict[str, FileProgressTracker]" = OrderedDict()
+        self._pending: Dict[str, List[Attempt]] = {}
+        self._pending_total: List[Attempt] = []
+        self._pending_cards: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    
+    def _session_path(self, session_id: str, suffix: str = ".json") -> str:
+        # Session ids come from clients: hash them into a safe file name
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.session_dir, f"session_{digest}{suffix}")
+    
+    def _tracker(self, session_id: str) -> FileProgressTracker:
+        # Caller holds self._lock
+        tracker = self._trackers.get(session_id)
+        if tracker is None:
+            tracker = self._trackers[session_id] = FileProgressTracker(
+                self._session_path(session_id), self.compact_threshold, self.missed_capacity
+            )
+        self._trackers.move_to_end(session_id)
+        if len(self._trackers) > self.max_sessions:
+            for old_id in list(self._trackers):
+                if len(self._trackers) <= self.max_sessions:
+                    break
+                if old_id not in self._pending and old_id != session_id:
+                    del self._trackers[old_id]
+        return tracker
+    
+    def record(
+        self,
+        session_id: Optional[str],
+        word: str,
+        guessed_feature: str,
+        correct_feature: Optional[str],
+        correct: bool,
+        latency_ms: Optional[int] = None,
+    ) -> None:
+        """
+        Buffer an attempt; without a session_id it only counts toward the
+        aggregate. The stats files keep no per-attempt detail, so
+        correct_feature and latency_ms are not stored (see SqliteProgressTracker).
+        """
+        attempt = (word, correct, guessed_feature)
+        with self._lock:
+            if session_id:
+                self._tracker(session_id)
+                self._pending.setdefault(session_id, []).append(attempt)
+            self._pending_total.append(attempt)
+            due = len(self._pending_total) >= self.flush_every
+        if due:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+    
+    def flush(self) -> int:
+        """Write pending attempts: one write per session plus one to the aggregate"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                total, self._pending_total = self._pending_total, []
+                cards, self._pending_cards = self._pending_cards, {}
+                trackers = {session_id: self._tracker(session_id) for session_id in pending}
+            if not total and not cards:
+                return 0
+            if pending or cards:
+                os.makedirs(self.session_dir, exist_ok=True)
+            for session_id, attempts in pending.items():
+                trackers[session_id].save_attempts(attempts)
+            for session_id, changed in cards.items():
+                self._write_cards(session_id, changed)
+            if total:
+                self.aggregate.save_attempts(total)
+            self.flush_count += 1
+            return len(total)
+    
+    def _read_cards(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        path = self._session_path(session_id, ".cards.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cards = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return cards if isinstance(cards, dict) else {}
+    
+    def _write_cards(self, session_id: str, changed: Dict[str, Dict[str, Any]]) -> None:
+        path = self._session_path(session_id, ".cards.json")
+        with file_lock(path):
+            # Merge with cards other processes saved for this learner
+            cards = self._read_cards(session_id)
+            cards.update(changed)
+            atomic_write_json(path, cards, ensure_ascii=False, separators=(",", ":"))
+    
+    def save_cards(self, session_id: str, cards: Dict[str, Dict[str, Any]]) -> None:
+        """Buffer changed review cards (word -> card); written with the next flush"""
+        with self._lock:
+            self._pending_cards.setdefault(session_id, {}).update(cards)
+    
+    def load_cards(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        """A learner's review cards, including ones not yet flushed"""
+        with self._flush_lock, self._lock:
+            cards = self._read_cards(session_id)
+            cards.update(self._pending_cards.get(session_id, {}))
+        return cards
+    
+    def get_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """One learner's stats, or the aggregate when session_id is None"""
+        # Flush rather than replaying pending attempts onto a copy, which
+        # would let a bounded most_missed outgrow its capacity
+        self.flush()
+        with self._flush_lock, self._lock:
+            tracker = self.aggregate if session_id is None else self._tracker(session_id)
+            return copy.deepcopy(tracker.get_stats())
+    
+    def top_missed(self, session_id: Optional[str], n: int) -> List[Dict[str, Any]]:
+        """One learner's (or everyone's) n most missed words, without sorting when bounded"""
+        self.flush()
+        with self._flush_lock, self._lock:
+            tracker = self.aggregate if session_id is None else self._tracker(session_id)
+            return tracker.top_missed(n)
+    
+    def reset(self, session_id: Optional[str] = None) -> None:
+        """Clear one learner's stats, or the aggregate when session_id is None"""
+        with self._flush_lock, self._lock:
+            if session_id is None:
+                self._pending_total = []
+                self.aggregate.reset()
+            else:
+                self._pending.pop(session_id, None)
+                tracker = self._tracker(session_id)
+                # Don't create files for a session that never answered
+                if tracker.get_stats()["total_rounds"]:
+                    tracker.reset()
+    
+    def get_buffer_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sessions_cached": len(self._trackers),
+                "sessions_pending": len(self._pending),
+                "pending_attempts": len(self._pending_total),
+                "pending_cards": sum(len(cards) for cards in self._pending_cards.values()),
+                "flush_count": self.flush_count,
+                "flush_interval_seconds": self.flush_interval,
+                "flush_every": self.flush_every,
+            }
@@ -0,0 +1,211 @@
+"""
+Review Scheduler - Spaced repetition (SM-2) with per-learner due queues
+No UI dependencies. Every answered word gets a card (ease, interval,
+repetitions, due time) per learner. Each learner's cards sit in a min-heap
+keyed by due time, so rescheduling a word and finding the next due one are
+both O(log n). Cards are loaded from and saved through the progress store
+(SessionProgressRegistry or SqliteProgressTracker), which batches writes
+like it does for attempts.
+"""
+
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .corpus_cache import text_key
+
+DAY_SECONDS = 86400.0
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+# Correct answers faster than this count as effortless recall (quality 5)
+FAST_ANSWER_MS = 3000
+
+# Due words passed over in one next_due() call (e.g. outside the session's
+# feature focus) before giving up and serving a new word instead
+_MAX_SKIPPED = 50
+
+
+def answer_quality(correct: bool, skipped: bool = False, latency_ms: Optional[int] = None) -> int:
+    """SM-2 recall grade (0-5) for a quiz answer"""
+    if skipped:
+        return 0
+    if not correct:
+        return 1
+    if latency_ms is not None and latency_ms <= FAST_ANSWER_MS:
+        return 5
+    return 4
+
+
+def sm2_update(
+    card: Optional[Dict[str, Any]],
+    quality: int,
+    now: float,
+    relearn_seconds: float = 60.0,
+) -> Dict[str, Any]:
+    """
+    Next state of a card after an answer graded `quality` (0-5).
+
+    Standard SM-2 intervals (1 day, 6 days, then interval x ease) for
+    grades of 3 and up. A lapse restarts the repetitions and brings the
+    word back after `relearn_seconds` rather than SM-2's full day, so it
+    is drilled again in the same sitting.
+    """
+    ease = card["ease"] if card else DEFAULT_EASE
+    repetitions = card["reps"] if card else 0
+    interval = card["interval"] if card else 0.0
+
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        repetitions = 0
+        interval = 0.0
+        due = now + relearn_seconds
+    else:
+        repetitions += 1
+        if repetitions == 1:
+            interval = 1 * DAY_SECONDS
+        elif repetitions == 2:
+            interval = 6 * DAY_SECONDS
+        else:
+            interval = round(interval * ease)
+        due = now + interval
+    return {"ease": round(ease, 4), "interval": interval, "reps": repetitions, "due": due}
+
+
+class LearnerSchedule:
+    """
+    One learner's cards and their due-time heap.
+
+    Rescheduling pushes a new heap entry and leaves the old one in place;
+    entries whose due time no longer matches the card are dropped when
+    they reach the top (lazy deletion), and the heap is rebuilt once stale
+    entries outnumber live ones.
+    """
+
+    def __init__(self, cards: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.cards: Dict[str, Dict[str, Any]] = dict(cards or {})
+        self._heap: List[Tuple[float, str]] = [(card["due"], word) for word, card in self.cards.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __contains__(self, word: str) -> bool:
+        return text_key(word) in self.cards
+
+    def schedule(self, word: str, card: Dict[str, Any]) -> None:
+        """Set a word's card and queue it at its due time (O(log n))"""
+        word = text_key(word)
+        self.cards[word] = card
+        heapq.heappush(self._heap, (card["due"], word))
+        if len(self._heap) > 2 * len(self.cards) + 16:
+            self._heap = [(c["due"], w) for w, c in self.cards.items()]
+            heapq.heapify(self._heap)
+
+    def _prune(self) -> None:
+        heap = self._heap
+        while heap:
+            due, word = heap[0]
+            card = self.cards.get(word)
+            if card is not None and card["due"] == due:
+                return
+            heapq.heappop(heap)
+
+    def next_due(self, now: float, accept: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """
+        Earliest word due by `now` that `accept` allows, without dequeuing it
+        (it stays due until answered). O(log n), plus O(log n) per due word
+        that `accept` passes over.
+        """
+        skipped = []
+        found = None
+        self._prune()
+        while self._heap and self._heap[0][0] <= now and len(skipped) < _MAX_SKIPPED:
+            entry = self._heap[0]
+            if accept is None or accept(entry[1]):
+                found = entry[1]
+                break
+            skipped.append(heapq.heappop(self._heap))
+            self._prune()
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def next_due_at(self) -> Optional[float]:
+        """When the earliest card falls due (None without cards)"""
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+
+class ReviewScheduler:
+    """
+    Learners' schedules, loaded on first use from the progress store.
+
+    `store` provides load_cards(session_id) and save_cards(session_id,
+    cards). At most `max_learners` schedules stay in memory; an evicted
+    learner is reloaded from the store next time.
+    """
+
+    def __init__(self, store: Any, relearn_seconds: float = 60.0, max_learners: int = 1000):
+        self.store = store
+        self.relearn_seconds = relearn_seconds
+        self.max_learners = max_learners
+        self._lock = threading.Lock()
+        self._learners: "OrderedDict[str, LearnerSchedule]" = OrderedDict()
+
+    def _schedule(self, session_id: str) -> LearnerSchedule:
+        # Caller holds self._lock
+        schedule = self._learners.get(session_id)
+        if schedule is None:
+            schedule = self._learners[session_id] = LearnerSchedule(self.store.load_cards(session_id))
+            while len(self._learners) > self.max_learners:
+                self._learners.popitem(last=False)
+        self._learners.move_to_end(session_id)
+        return schedule
+
+    def answer(
+        self,
+        session_id: str,
+        word: str,
+        correct: bool,
+        skipped: bool = False,
+        latency_ms: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Grade an answer, reschedule the word and queue the card for saving"""
+        now = time.time() if now is None else now
+        quality = answer_quality(correct, skipped, latency_ms)
+        with self._lock:
+            schedule = self._schedule(session_id)
+            card = sm2_update(schedule.cards.get(text_key(word)), quality, now, self.relearn_seconds)
+            schedule.schedule(word, card)
+        self.store.save_cards(session_id, {text_key(word): card})
+        return card
+
+    def next_due(
+        self,
+        session_id: str,
+        accept: Optional[Callable[[str], bool]] = None,
+        now: Optional[float] = None,
+    ) -> Optional[str]:
+        """Text of the learner's most overdue word that `accept` allows, if any"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._schedule(session_id).next_due(now, accept)
+
+    def is_scheduled(self, session_id: str, word: str) -> bool:
+        with self._lock:
+            return word in self._schedule(session_id)
+
+    def get_stats(self, session_id: str, now: Optional[float] = None) -> Dict[str, Any]:
+        """Card count and when the next review falls due"""
+        now = time.time() if now is None else now
+        with self._lock:
+            schedule = self._schedule(session_id)
+            next_due_at = schedule.next_due_at()
+            return {
+                "cards": len(schedule),
+                "next_due_in_seconds": round(max(next_due_at - now, 0.0), 1) if next_due_at is not None else None,
+            }
@@ -0,0 +1,163 @@
+"""
+Rhyme Index - Perfect-rhyme lookup over ARPAbet pronunciations
+No UI dependencies. Every pronunciation is encoded one character per
+phoneme (stressed vowels get their own characters, stress 1 and 2 alike)
+and stored reversed in a PrefixTrie. The reversed rhyme key of a word - its
+last stressed vowel onward - is then a prefix shared by exactly the words
+that rhyme with it, so a query is a trie walk plus a slice.
+"""
+
+import bisect
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .prefix_trie import PrefixTrie
+from .pronunciation_engine import ARPABET_TO_IPA
+
+# phoneme (stress marked with "'") -> code character; unstressed and stressed
+# forms of a vowel sit next to each other
+_CODES: Dict[str, str] = {}
+for _i, _phoneme in enumerate(sorted(ARPABET_TO_IPA)):
+    _CODES[_phoneme] = chr(0x100 + 2 * _i)
+    _CODES[_phoneme + "'"] = chr(0x101 + 2 * _i)
+
+
+def phonemes(syllables: Sequence[str]) -> List[str]:
+    """Flatten syllables ("T AE1", ...) into ARPAbet tokens"""
+    return " ".join(syllables).upper().split()
+
+
+def _normalize(token: str) -> str:
+    base = token.rstrip("012")
+    return base + "'" if token[-1:] in ("1", "2") else base
+
+
+def phoneme_code(token: str) -> str:
+    """One-character code for an ARPAbet token (stress 1/2 marked, 0 dropped)"""
+    name = _normalize(token)
+    code = _CODES.get(name)
+    if code is None:
+        # Phonemes outside ARPABET_TO_IPA still get a stable code
+        code = _CODES[name] = chr(0x1000 + len(_CODES))
+    return code
+
+
+def rhyme_key(tokens: Sequence[str]) -> List[str]:
+    """Tokens from the last stressed vowel (else last vowel) to the end"""
+    start = None
+    for i, token in enumerate(tokens):
+        if token[-1:] in ("1", "2"):
+            start = i
+    if start is None:
+        for i, token in enumerate(tokens):
+            if token[-1:].isdigit():
+                start = i
+    return list(tokens[start:]) if start is not None else list(tokens)
+
+
+def _encode_reversed(tokens: Sequence[str]) -> str:
+    return "".join(phoneme_code(token) for token in reversed(tokens))
+
+
+class RhymeIndex:
+    """Word positions grouped by pronunciation under a reversed-phoneme trie"""
+
+    def __init__(self, entries: Iterable[Tuple[int, str, Sequence[str]]]):
+        """
+        Args:
+            entries: (position, text, syllables) for every word
+        """
+        groups: Dict[str, List[Tuple[str, int]]] = {}
+        for position, text, syllables in entries:
+            tokens = phonemes(syllables or [])
+            if tokens:
+                groups.setdefault(_encode_reversed(tokens), []).append((text, position))
+        self._trie = PrefixTrie(((key, 0.0) for key in groups), top_k=0)
+        # Positions per trie key (alphabetical by text), and the running
+        # count before each key, so a page starts with one bisect
+        self._groups: List[array] = []
+        self._starts = array("I", [0])
+        for i in range(len(self._trie)):
+            members = sorted(groups[self._trie.key_at(i)])
+            self._groups.append(array("I", (position for _, position in members)))
+            self._starts.append(self._starts[-1] + len(members))
+        # Words added after construction: (encoded pronunciation, position)
+        self._added: List[Tuple[str, int]] = []
+
+    def __len__(self) -> int:
+        return self._starts[-1] + len(self._added)
+
+    def add(self, position: int, syllables: Sequence[str]) -> None:
+        tokens = phonemes(syllables or [])
+        if tokens:
+            self._added.append((_encode_reversed(tokens), position))
+
+    def remove(self, position: int, syllables: Sequence[str]) -> None:
+        """Drop a word indexed under `syllables` (e.g. before re-adding it with new ones)"""
+        tokens = phonemes(syllables or [])
+        if not tokens:
+            return
+        encoded = _encode_reversed(tokens)
+        if (encoded, position) in self._added:
+            self._added.remove((encoded, position))
+            return
+        lo, hi = self._trie.span(encoded)
+        if lo == hi or self._trie.key_at(lo) != encoded or position not in self._groups[lo]:
+            return
+        # An emptied group stays in the trie; its start equals the next one's
+        self._groups[lo].remove(position)
+        for key in range(lo + 1, len(self._starts)):
+            self._starts[key] -= 1
+
+    def _base_item(self, index: int) -> int:
+        key = bisect.bisect_right(self._starts, index) - 1
+        return self._groups[key][index - self._starts[key]]
+
+    def rhymes(
+        self,
+        tokens: Sequence[str],
+        offset: int = 0,
+        limit: int = 20,
+        exclude: Optional[int] = None,
+    ) -> Tuple[List[int], int]:
+        """
+        Positions of words rhyming with a pronunciation, one page at a time.
+
+        `exclude` is the position of the word `tokens` belongs to, left out
+        of the results. Returns (positions, total rhymes). Base words come
+        alphabetically per pronunciation; words added later come last.
+        """
+        if not tokens:
+            return [], 0
+        prefix = _encode_reversed(rhyme_key(tokens))
+        lo, hi = self._trie.span(prefix)
+        base_lo, base_hi = self._starts[lo], self._starts[hi]
+        added = [position for encoded, position in self._added if encoded.startswith(prefix)]
+        size = base_hi - base_lo + len(added)
+
+        # Where the excluded word sits in this result list, if it's there
+        skip = None
+        if exclude is not None:
+            own = _encode_reversed(tokens)
+            own_lo, own_hi = self._trie.span(own)
+            if own_lo < own_hi and self._trie.key_at(own_lo) == own:
+                group = self._groups[own_lo]
+                for i, position in enumerate(group):
+                    if position == exclude:
+                        skip = self._starts[own_lo] + i - base_lo
+                        break
+            if skip is None and exclude in added:
+                skip = base_hi - base_lo + added.index(exclude)
+
+        total = size - (1 if skip is not None else 0)
+        start = offset + (1 if skip is not None and offset >= skip else 0)
+        page = []
+        index = start
+        while index < size and len(page) < limit:
+            if index != skip:
+                if index < base_hi - base_lo:
+                    page.append(self._base_item(base_lo + index))
+                else:
+                    page.append(added[index - (base_hi - base_lo)])
+            index += 1
+        return page, total
@@ -0,0 +1,260 @@
+"""
+Sharded Corpus - Word corpus split across several JSON files
+No UI dependencies. A shard directory holds one JSON word array per shard
+(grouped by first letter or by a stable hash of the text) and a small
+manifest.json listing the shard files (not their sizes, which every save
+changes). Each shard is served by its own JSONWordDataSource, so it keeps
+its own journal, lock and change detection and is re-read on its own after
+an edit. Shards are parsed in parallel by a process pool at cold start.
+"""
+
+import json
+import multiprocessing
+import os
+import string
+import threading
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .corpus_cache import CorpusCache, text_key
+from .file_lock import atomic_write_json, file_lock
+from .word_journal import WordJournal
+from .word_service import JSONWordDataSource, WordDataSource
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_FORMAT = 1
+SCHEMES = ("letter", "hash")
+
+# Shard for words that don't start with a-z under the "letter" scheme
+_OTHER_KEY = "_"
+
+
+def shard_key(text: Any, scheme: str, shard_count: int) -> str:
+    """Shard a word belongs to: its first letter, or its hash bucket as 2+ digits"""
+    key = text_key(text)
+    if scheme == "letter":
+        first = key[:1]
+        return first if first and first in string.ascii_lowercase else _OTHER_KEY
+    if scheme == "hash":
+        # crc32, unlike hash(), is the same in every process and run
+        return f"{zlib.crc32(key.encode('utf-8')) % shard_count:02d}"
+    raise ValueError(f"Unknown shard scheme: {scheme}")
+
+
+def _shard_file(key: str) -> str:
+    return f"words_{key}.json"
+
+
+def _write_manifest(directory: str, scheme: str, shard_count: int, keys: Iterable[str]) -> None:
+    atomic_write_json(os.path.join(directory, MANIFEST_FILE), {
+        "format": MANIFEST_FORMAT,
+        "scheme": scheme,
+        "shard_count": shard_count,
+        "shards": [{"key": key, "file": _shard_file(key)} for key in sorted(keys)],
+    }, indent=2)
+
+
+def write_shards(
+    words: Iterable[Dict[str, Any]],
+    directory: str,
+    scheme: str = "letter",
+    shard_count: int = 16,
+) -> Dict[str, int]:
+    """
+    Write words as a shard directory.
+
+    A word repeated in the input keeps its last occurrence. Shards are
+    written before the manifest, so a reader never sees a manifest that
+    lists a missing shard. Returns the number of words per shard key.
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"Unknown shard scheme: {scheme}")
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for word in words:
+        key = shard_key(word.get("text"), scheme, shard_count)
+        groups.setdefault(key, {})[text_key(word.get("text"))] = word
+
+    os.makedirs(directory, exist_ok=True)
+    counts = {}
+    for key in sorted(groups):
+        group = list(groups[key].values())
+        atomic_write_json(os.path.join(directory, _shard_file(key)), group, indent=2, ensure_ascii=False, default=dict)
+        counts[key] = len(group)
+    _write_manifest(directory, scheme, shard_count, counts)
+    return counts
+
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Shard manifest not found: {path}")
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("scheme") not in SCHEMES:
+        raise ValueError(f"Unsupported shard manifest: {path}")
+    return manifest
+
+
+def _load_shard(path: str) -> Tuple[list, Tuple[Any, ...], float]:
+    """Worker: parse one shard (file + journal) and return it with its stamp"""
+    cache = CorpusCache(path, journal=WordJournal(path))
+    words = cache.get_words()
+    return words, cache.signature, cache.last_load_seconds
+
+
+class ShardedWordDataSource(WordDataSource):
+    """
+    Words from a shard directory, presented as one list.
+
+    The merged list starts as the shards concatenated in manifest order;
+    words saved later are replaced in place or appended, like the other
+    sources. A shard changed by another process is re-read alone and the
+    merged list is rebuilt from the shards.
+    """
+
+    def __init__(self, directory: str, workers: Optional[int] = None, compact_threshold: int = 500):
+        """
+        Args:
+            directory: Shard directory containing manifest.json
+            workers: Loader processes for the cold start (default: CPU count;
+                     1 parses in this process)
+            compact_threshold: Journal size at which a shard is compacted
+        """
+        self.directory = directory
+        manifest = read_manifest(directory)
+        self.scheme = manifest["scheme"]
+        self.shard_count = manifest["shard_count"]
+        self.workers = workers or os.cpu_count() or 1
+        self._shards: Dict[str, JSONWordDataSource] = {
+            shard["key"]: JSONWordDataSource(os.path.join(directory, shard["file"]), compact_threshold)
+            for shard in manifest["shards"]
+        }
+        self._compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        # Merged view: the list handed out, each shard's list it was built
+        # from, and text_key -> position
+        self._view: Optional[List[Dict[str, Any]]] = None
+        self._parts: Dict[str, Any] = {}
+        self._positions: Dict[str, int] = {}
+        self.load_count = 0
+        self.last_load_seconds = 0.0
+
+    def _shard_for(self, text: Any, create: bool = False) -> Optional[JSONWordDataSource]:
+        key = shard_key(text, self.scheme, self.shard_count)
+        shard = self._shards.get(key)
+        if shard is None and create:
+            # First word for this letter/bucket: start an empty shard
+            path = os.path.join(self.directory, _shard_file(key))
+            if not os.path.exists(path):
+                atomic_write_json(path, [])
+            shard = self._shards[key] = JSONWordDataSource(path, self._compact_threshold)
+            manifest_path = os.path.join(self.directory, MANIFEST_FILE)
+            with file_lock(manifest_path):
+                # Keep shards another process has added since we started
+                keys = {entry["key"] for entry in read_manifest(self.directory)["shards"]} | set(self._shards)
+                _write_manifest(self.directory, self.scheme, self.shard_count, keys)
+        return shard
+
+    def _load_all(self) -> None:
+        """Cold start: parse every shard, in parallel when there are workers"""
+        started = time.perf_counter()
+        keys = list(self._shards)
+        workers = min(self.workers, len(keys))
+        if workers > 1:
+            paths = [self._shards[key].file_path for key in keys]
+            # forkserver/spawn: never fork a process that is running server threads
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method)) as pool:
+                for key, (words, signature, _) in zip(keys, pool.map(_load_shard, paths)):
+                    self._shards[key].adopt(words, signature)
+        self._merge()
+        self.load_count += 1
+        self.last_load_seconds = time.perf_counter() - started
+
+    def _merge(self) -> None:
+        """Concatenate the shards' lists and their text indexes"""
+        view: List[Dict[str, Any]] = []
+        positions: Dict[str, int] = {}
+        parts = {}
+        for key, shard in self._shards.items():
+            words = shard.get_all_words()
+            parts[key] = words
+            for word in words:
+                positions.setdefault(text_key(word.get("text")), len(view))
+                view.append(word)
+        self._view = view
+        self._positions = positions
+        self._parts = parts
+
+    def _refresh(self) -> None:
+        if self._view is None:
+            self._load_all()
+            return
+        # Each shard re-reads itself only if its own file changed
+        if any(shard.get_all_words() is not self._parts.get(key) for key, shard in self._shards.items()):
+            self._merge()
+
+    def get_all_words(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._refresh()
+            return self._view
+
+    def get_word_by_id(self, word_id: str) -> Dict[str, Any]:
+        shard = self._shard_for(word_id)
+        return shard.get_word_by_id(word_id) if shard is not None else None
+
+    def save_word(self, word: Dict[str, Any]) -> None:
+        self.save_words([word])
+
+    def save_words(self, words: Iterable[Dict[str, Any]]) -> int:
+        """Journal each shard's part of the batch with one write per shard"""
+        words = list(words)
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for word in words:
+            groups.setdefault(shard_key(word.get("text"), self.scheme, self.shard_count), []).append(word)
+        with self._lock:
+            self._refresh()
+            view = list(self._view)
+            external_change = False
+            for key, group in groups.items():
+                shard = self._shard_for(group[0].get("text"), create=True)
+                before = self._parts.get(key) or []
+                texts = list(dict.fromkeys(text_key(word.get("text")) for word in group))
+                new_count = sum(1 for text in texts if text not in self._positions)
+                shard.save_words(group)
+                after = shard.get_all_words()
+                if len(after) != len(before) + new_count:
+                    # Another process wrote this shard too; rebuild below
+                    external_change = True
+                self._parts[key] = after
+                for text in texts:
+                    record = shard.get_word_by_id(text)
+                    position = self._positions.get(text)
+                    if position is None:
+                        self._positions[text] = len(view)
+                        view.append(record)
+                    else:
+                        view[position] = record
+            self._view = view
+            if external_change:
+                self._merge()
+        return len(words)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            shard_stats = {key: shard.get_cache_stats() for key, shard in self._shards.items()}
+            return {
+                "directory": os.path.basename(self.directory.rstrip(os.sep)),
+                "scheme": self.scheme,
+                "shards": len(self._shards),
+                "workers": self.workers,
+                "word_count": len(self._view) if self._view is not None else 0,
+                "load_count": self.load_count,
+                "last_load_seconds": round(self.last_load_seconds, 4),
+                # Shards re-read after the cold start, e.g. after another process's edit
+                "shard_reload_count": sum(max(s["load_count"] - 1, 0) for s in shard_stats.values()),
+                "journal_entries": sum(s["journal_entries"] for s in shard_stats.values()),
+                "compaction_count": sum(s["compaction_count"] for s in shard_stats.values()),
+            }
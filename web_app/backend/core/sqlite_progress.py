@@ -0,0 +1,251 @@
+"""
+SQLite Progress Tracker - Every quiz attempt stored as a row
+No UI dependencies. Attempts are buffered in memory and inserted in
+batches (one executemany per flush) into a WAL-mode database, so several
+uvicorn workers can write and read it at once. Stats are aggregate queries
+over covering indexes instead of a stats file rewritten on each answer.
+Review cards (see review_scheduler) are kept in a second table and
+flushed in the same transactions.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .progress_service import SessionProgressStore, _init_stats
+
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS attempts (
+        id INTEGER PRIMARY KEY,
+        session_id TEXT,
+        word TEXT NOT NULL,
+        guessed_feature TEXT NOT NULL,
+        correct_feature TEXT,
+        correct INTEGER NOT NULL,
+        latency_ms INTEGER,
+        created_at REAL NOT NULL
+    )
+    """,
+    # Cover the stats queries, so they never read the table itself
+    "CREATE INDEX IF NOT EXISTS idx_attempts_session ON attempts(session_id, correct, word, guessed_feature)",
+    "CREATE INDEX IF NOT EXISTS idx_attempts_correct ON attempts(correct, word, guessed_feature)",
+    """
+    CREATE TABLE IF NOT EXISTS review_cards (
+        session_id TEXT NOT NULL,
+        word TEXT NOT NULL,
+        ease REAL NOT NULL,
+        interval REAL NOT NULL,
+        reps INTEGER NOT NULL,
+        due REAL NOT NULL,
+        PRIMARY KEY (session_id, word)
+    ) WITHOUT ROWID
+    """,
+)
+
+INSERT_SQL = (
+    "INSERT INTO attempts (session_id, word, guessed_feature, correct_feature, correct, latency_ms, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+TOTALS_SQL = "SELECT COUNT(*), COALESCE(SUM(correct), 0) FROM attempts"
+TOTALS_BY_SESSION_SQL = TOTALS_SQL + " WHERE session_id = ?"
+PER_FEATURE_SQL = "SELECT guessed_feature, COUNT(*) FROM attempts WHERE correct = 1 GROUP BY guessed_feature"
+PER_FEATURE_BY_SESSION_SQL = (
+    "SELECT guessed_feature, COUNT(*) FROM attempts WHERE session_id = ? AND correct = 1 GROUP BY guessed_feature"
+)
+MISSED_SQL = "SELECT word, COUNT(*) FROM attempts WHERE correct = 0 GROUP BY word"
+MISSED_BY_SESSION_SQL = "SELECT word, COUNT(*) FROM attempts WHERE session_id = ? AND correct = 0 GROUP BY word"
+# The log is exact, so the most missed words are a query; bounding it keeps
+# responses small
+TOP_MISSED_SUFFIX = " ORDER BY COUNT(*) DESC, word LIMIT ?"
+UPSERT_CARD_SQL = (
+    "INSERT INTO review_cards (session_id, word, ease, interval, reps, due) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(session_id, word) DO UPDATE SET "
+    "ease = excluded.ease, interval = excluded.interval, reps = excluded.reps, due = excluded.due"
+)
+SELECT_CARDS_SQL = "SELECT word, ease, interval, reps, due FROM review_cards WHERE session_id = ?"
+
+
+class SqliteProgressTracker(SessionProgressStore):
+    """
+    Attempt log in a SQLite database, with per-session and global stats.
+
+    record() buffers an attempt; the buffer is inserted when `flush_every`
+    rows are pending, every `flush_interval` seconds once start() has run,
+    on close(), and before any stats query. A crash can lose at most the
+    attempts since the last flush. With `missed_capacity`, most_missed lists
+    only that many words, the most missed first.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        flush_interval: float = 1.0,
+        flush_every: int = 200,
+        busy_timeout_ms: int = 5000,
+        missed_capacity: Optional[int] = None,
+    ):
+        """
+        Args:
+            db_path: SQLite database file
+            flush_interval: Seconds between background flushes
+            flush_every: Pending attempts that trigger a flush right away
+            busy_timeout_ms: How long to wait for another process's write lock
+            missed_capacity: Words returned in most_missed (None: all)
+        """
+        super().__init__(flush_interval, flush_every)
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.missed_capacity = missed_capacity
+        # Held while using the connection; flushes and queries take turns
+        self._db_lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[Any, ...]] = []
+        self._pending_cards: Dict[Tuple[str, str], Tuple[Any, ...]] = {}
+        self.last_flush_seconds = 0.0
+
+        with self._db_lock:
+            conn = self._connection()
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False,
+                cached_statements=64,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Stop the flusher, write everything still pending and close the database"""
+        super().close()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(
+        self,
+        session_id: Optional[str],
+        word: str,
+        guessed_feature: str,
+        correct_feature: Optional[str],
+        correct: bool,
+        latency_ms: Optional[int] = None,
+    ) -> None:
+        """Buffer one attempt"""
+        row = (session_id, word, guessed_feature, correct_feature, int(correct), latency_ms, time.time())
+        with self._lock:
+            self._pending.append(row)
+            due = len(self._pending) >= self.flush_every
+        if due:
+            if self._thread is not None:
+                self._wake.set()
+            else:
+                self.flush()
+
+    def flush(self) -> int:
+        """Insert pending attempts and upsert pending cards in one transaction"""
+        with self._db_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                cards, self._pending_cards = self._pending_cards, {}
+            if not rows and not cards:
+                return 0
+            started = time.perf_counter()
+            conn = self._connection()
+            with conn:
+                conn.executemany(INSERT_SQL, rows)
+                conn.executemany(UPSERT_CARD_SQL, cards.values())
+            self.flush_count += 1
+            self.last_flush_seconds = time.perf_counter() - started
+            return len(rows)
+
+    def save_cards(self, session_id: str, cards: Dict[str, Dict[str, Any]]) -> None:
+        """Buffer changed review cards (word -> card); written with the next flush"""
+        with self._lock:
+            for word, card in cards.items():
+                self._pending_cards[(session_id, word)] = (
+                    session_id, word, card["ease"], card["interval"], card["reps"], card["due"]
+                )
+
+    def load_cards(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        """A learner's review cards"""
+        self.flush()
+        with self._db_lock:
+            rows = self._connection().execute(SELECT_CARDS_SQL, (session_id,)).fetchall()
+        return {
+            word: {"ease": ease, "interval": interval, "reps": reps, "due": due}
+            for word, ease, interval, reps, due in rows
+        }
+
+    def _missed_rows(self, session_id: Optional[str], limit: Optional[int]) -> List[Tuple[str, int]]:
+        # Caller holds self._db_lock
+        sql, params = (MISSED_SQL, ()) if session_id is None else (MISSED_BY_SESSION_SQL, (session_id,))
+        if limit:
+            sql, params = sql + TOP_MISSED_SUFFIX, params + (limit,)
+        return self._connection().execute(sql, params).fetchall()
+
+    def get_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """One learner's stats, or everyone's when session_id is None"""
+        self.flush()
+        if session_id is None:
+            queries, params = (TOTALS_SQL, PER_FEATURE_SQL), ()
+        else:
+            queries, params = (TOTALS_BY_SESSION_SQL, PER_FEATURE_BY_SESSION_SQL), (session_id,)
+        with self._db_lock:
+            conn = self._connection()
+            total, correct = conn.execute(queries[0], params).fetchone()
+            per_feature = dict(conn.execute(queries[1], params).fetchall())
+            most_missed = dict(self._missed_rows(session_id, self.missed_capacity))
+        stats = _init_stats()
+        stats["total_rounds"] = total
+        stats["correct"] = correct
+        stats["per_feature"] = per_feature
+        stats["most_missed"] = most_missed
+        return stats
+
+    def top_missed(self, session_id: Optional[str], n: int) -> List[Dict[str, Any]]:
+        """One learner's (or everyone's) n most missed words; counts are exact"""
+        self.flush()
+        with self._db_lock:
+            rows = self._missed_rows(session_id, n)
+        return [{"word": word, "count": count, "error": 0} for word, count in rows]
+
+    def reset(self, session_id: Optional[str] = None) -> None:
+        """Delete one learner's attempts, or every attempt when session_id is None"""
+        with self._db_lock:
+            with self._lock:
+                if session_id is None:
+                    self._pending = []
+                else:
+                    self._pending = [row for row in self._pending if row[0] != session_id]
+            conn = self._connection()
+            with conn:
+                if session_id is None:
+                    conn.execute("DELETE FROM attempts")
+                else:
+                    conn.execute("DELETE FROM attempts WHERE session_id = ?", (session_id,))
+
+    def get_buffer_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending)
+            pending_cards = len(self._pending_cards)
+        return {
+            "pending_attempts": pending,
+            "pending_cards": pending_cards,
+            "flush_count": self.flush_count,
+            "last_flush_seconds": round(self.last_flush_seconds, 4),
+            "flush_interval_seconds": self.flush_interval,
+            "flush_every": self.flush_every,
+        }
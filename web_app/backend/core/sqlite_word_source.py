@@ -0,0 +1,194 @@
+"""
+SQLite Word Data Source - Words stored in a SQLite database
+No UI dependencies. Uses WAL mode so several uvicorn workers can read
+while one of them writes. Each process holds one connection, serialized
+by a lock.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Iterable, Optional
+
+from .corpus_cache import text_key
+from .json_stream import iter_json_array
+from .word_record import WordRecord
+from .word_service import WordDataSource
+
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS words (
+        id INTEGER PRIMARY KEY,
+        text TEXT NOT NULL,
+        feature_id TEXT,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_words_text ON words(text)",
+    "CREATE INDEX IF NOT EXISTS idx_words_feature_id ON words(feature_id)",
+)
+
+# Statements are kept constant so sqlite3's per-connection cache reuses
+# the prepared form instead of re-parsing SQL on every call.
+SELECT_ALL_SQL = "SELECT data FROM words ORDER BY id"
+SELECT_BY_TEXT_SQL = "SELECT data FROM words WHERE text = ?"
+UPSERT_SQL = (
+    "INSERT INTO words (text, feature_id, data) VALUES (?, ?, ?) "
+    "ON CONFLICT(text) DO UPDATE SET feature_id = excluded.feature_id, data = excluded.data"
+)
+
+
+def _row_params(word: Dict[str, Any]) -> tuple:
+    return (
+        text_key(word.get("text")),
+        word.get("feature_id"),
+        json.dumps(word, ensure_ascii=False, separators=(",", ":"), default=dict),
+    )
+
+
+class SQLiteWordDataSource(WordDataSource):
+    """Load/save words from a SQLite database file"""
+
+    def __init__(self, db_path: str, busy_timeout_ms: int = 5000):
+        self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # get_all_words() result, reused until another connection writes;
+        # our own writes are applied to it in place (copy-on-write)
+        self._words: Optional[List[WordRecord]] = None
+        # text_key -> position in self._words
+        self._positions: Dict[str, int] = {}
+        self._words_version = None
+        self.load_count = 0
+        self.save_count = 0
+        self.last_load_seconds = 0.0
+
+        with self._lock:
+            conn = self._connection()
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_ms / 1000,
+                check_same_thread=False,
+                cached_statements=64,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._conn = conn
+        return self._conn
+
+    def _version(self) -> int:
+        # data_version moves only when *another* connection commits; our
+        # own writes are applied to the cached list by _upsert_cached()
+        return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def get_all_words(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            version = self._version()
+            if self._words is None or version != self._words_version:
+                started = time.perf_counter()
+                rows = self._connection().execute(SELECT_ALL_SQL).fetchall()
+                words = [WordRecord.from_dict(json.loads(row[0])) for row in rows]
+                positions: Dict[str, int] = {}
+                for i, word in enumerate(words):
+                    positions.setdefault(text_key(word.get("text")), i)
+                self._words = words
+                self._positions = positions
+                self._words_version = version
+                self.load_count += 1
+                self.last_load_seconds = time.perf_counter() - started
+            return self._words
+
+    def _upsert_cached(self, new_words: Iterable[Dict[str, Any]]) -> None:
+        """
+        Apply our own committed writes to the cached list without a reload.
+        Copy-on-write, so readers holding the previous list are unaffected;
+        new rows get the highest ids, so appending keeps ORDER BY id.
+        """
+        # Caller holds self._lock
+        if self._words is None:
+            return
+        words = list(self._words)
+        for word in new_words:
+            word = WordRecord.from_dict(word)
+            key = text_key(word.get("text"))
+            position = self._positions.get(key)
+            if position is None:
+                self._positions[key] = len(words)
+                words.append(word)
+            else:
+                words[position] = word
+            self.save_count += 1
+        self._words = words
+
+    def get_word_by_id(self, word_id: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._connection().execute(SELECT_BY_TEXT_SQL, (text_key(word_id),)).fetchone()
+        return WordRecord.from_dict(json.loads(row[0])) if row else None
+
+    def save_word(self, word: Dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(UPSERT_SQL, _row_params(word))
+            self._upsert_cached([word])
+
+    def save_words(self, words: Iterable[Dict[str, Any]], batch_size: int = 5000) -> int:
+        """Upsert many words with batched executemany calls in one transaction"""
+        count = 0
+        batch = []
+        with self._lock:
+            # Only keep the words for the cache if there is one (a streamed
+            # import into a fresh source holds one batch at a time)
+            saved: Optional[List[Dict[str, Any]]] = [] if self._words is not None else None
+            conn = self._connection()
+            with conn:
+                for word in words:
+                    batch.append(_row_params(word))
+                    if saved is not None:
+                        saved.append(word)
+                    if len(batch) >= batch_size:
+                        conn.executemany(UPSERT_SQL, batch)
+                        count += len(batch)
+                        batch = []
+                if batch:
+                    conn.executemany(UPSERT_SQL, batch)
+                    count += len(batch)
+            if saved:
+                self._upsert_cached(saved)
+        return count
+
+    def import_json_files(self, paths: Iterable[str], batch_size: int = 5000) -> Dict[str, int]:
+        """
+        One-shot import of word JSON arrays (e.g. the Firestore exports).
+
+        Files are applied in order, so a word present in several files keeps
+        the record from the last one.
+        """
+        imported = {}
+        for path in paths:
+            # Streamed, so only one batch of rows is in memory at a time
+            imported[path] = self.save_words(iter_json_array(path), batch_size=batch_size)
+        return imported
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count = self._connection().execute("SELECT COUNT(*) FROM words").fetchone()[0]
+        return {
+            "file": os.path.basename(self.db_path),
+            "word_count": count,
+            "load_count": self.load_count,
+            "reload_count": max(self.load_count - 1, 0),
+            "save_count": self.save_count,
+            "last_load_seconds": round(self.last_load_seconds, 4),
+        }
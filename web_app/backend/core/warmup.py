@@ -0,0 +1,78 @@
+"""
+Warm-up - Slow startup steps run in the background with progress
+No UI dependencies. The server answers requests right away while the steps
+(corpus parse, index builds, dictionary load) run in order on a daemon
+thread; status() tells a readiness probe how far they got. A failed step
+is recorded and the rest still run, but the instance never reports ready.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class Warmup:
+    """Named startup steps, run once in order on a background thread"""
+
+    def __init__(self, steps: Sequence[Tuple[str, Callable[[], Any]]]):
+        self._steps = list(steps)
+        self._lock = threading.Lock()
+        self._state: Dict[str, Dict[str, Any]] = {name: {"status": "pending"} for name, _ in self._steps}
+        self._thread: Optional[threading.Thread] = None
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def start(self) -> None:
+        """Begin warming in the background (no-op if already started)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._started = time.perf_counter()
+            self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the steps have run; returns whether all succeeded"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.ready
+
+    def _run(self) -> None:
+        for name, step in self._steps:
+            self._set(name, status="running")
+            started = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                self._set(name, status="failed", seconds=round(time.perf_counter() - started, 3), error=str(e))
+            else:
+                self._set(name, status="done", seconds=round(time.perf_counter() - started, 3))
+        with self._lock:
+            self._finished = time.perf_counter()
+
+    def _set(self, name: str, **state: Any) -> None:
+        with self._lock:
+            self._state[name] = state
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return all(state["status"] == "done" for state in self._state.values())
+
+    def status(self) -> Dict[str, Any]:
+        """Overall readiness plus each step's status and duration"""
+        with self._lock:
+            steps: List[Dict[str, Any]] = [{"name": name, **self._state[name]} for name, _ in self._steps]
+            if self._started is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self._finished or time.perf_counter()) - self._started
+        done = sum(1 for step in steps if step["status"] == "done")
+        return {
+            "ready": done == len(steps),
+            "failed": any(step["status"] == "failed" for step in steps),
+            "completed": done,
+            "total": len(steps),
+            "elapsed_seconds": round(elapsed, 3),
+            "steps": steps,
+        }
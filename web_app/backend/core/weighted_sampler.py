@@ -0,0 +1,122 @@
+"""
+Weighted Sampler - Draw indexes in proportion to their weights
+No UI dependencies. Two structures over positions 0..n-1, both using
+memory proportional to n (one slot per distinct item, however large the
+weights):
+- AliasSampler: Walker/Vose alias table; O(n) build, O(1) draws, fixed weights
+- FenwickSampler: Fenwick (binary indexed) tree; O(log n) draws, weight
+  updates and appends
+"""
+
+import random
+from typing import Iterable, List, Sequence
+
+
+class AliasSampler:
+    """Walker's alias method for weights that don't change"""
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0 or min(weights) < 0:
+            raise ValueError("AliasSampler needs non-negative weights with a positive sum")
+        self.total = total
+        # Vose: scale to mean 1, then pair each light column with a heavy one
+        scaled = [w * n / total for w in weights]
+        self._probability = [1.0] * n
+        self._alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            light = small.pop()
+            heavy = large.pop()
+            self._probability[light] = scaled[light]
+            self._alias[light] = heavy
+            scaled[heavy] -= 1.0 - scaled[light]
+            (small if scaled[heavy] < 1.0 else large).append(heavy)
+        # Leftovers are 1.0 up to rounding error and keep probability 1
+
+    def __len__(self) -> int:
+        return len(self._alias)
+
+    def sample(self, rng: random.Random = random) -> int:
+        """One index, O(1)"""
+        column = rng.randrange(len(self._alias))
+        return column if rng.random() < self._probability[column] else self._alias[column]
+
+
+class FenwickSampler:
+    """Prefix-sum tree for weights that change between draws"""
+
+    def __init__(self, weights: Iterable[float] = ()):
+        self._weights: List[float] = list(weights)
+        n = len(self._weights)
+        # 1-based tree, built in O(n) by pushing each node into its parent
+        self._tree = [0.0] + self._weights
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                self._tree[parent] += self._tree[i]
+        self.total = float(sum(self._weights))
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def _prefix(self, i: int) -> float:
+        """Sum of the first i weights"""
+        total = 0.0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def append(self, weight: float) -> int:
+        """Add a position with `weight` and return its index, O(log n)"""
+        if weight < 0:
+            raise ValueError("weights must be non-negative")
+        i = len(self._weights) + 1
+        # Node i covers positions (i - lowbit(i), i]
+        self._tree.append(weight + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        self._weights.append(weight)
+        self.total += weight
+        return i - 1
+
+    def weight(self, index: int) -> float:
+        return self._weights[index]
+
+    def add(self, index: int, delta: float) -> None:
+        """Change one weight by `delta`, O(log n)"""
+        if self._weights[index] + delta < 0:
+            raise ValueError("weights must be non-negative")
+        self._weights[index] += delta
+        self.total += delta
+        i = index + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def set(self, index: int, weight: float) -> None:
+        self.add(index, weight - self._weights[index])
+
+    def sample(self, rng: random.Random = random) -> int:
+        """One index, O(log n); ValueError if every weight is zero"""
+        if self.total <= 0:
+            raise ValueError("no positive weights to sample from")
+        target = rng.random() * self.total
+        # Walk down the implicit tree: find the last prefix sum <= target
+        position = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and self._tree[nxt] <= target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        # Float rounding can land on (or past) a zero-weight slot; step back
+        # to the nearest position that has weight
+        index = min(position, len(self._weights) - 1)
+        while self._weights[index] <= 0 and index > 0:
+            index -= 1
+        while self._weights[index] <= 0:
+            index += 1
+        return index
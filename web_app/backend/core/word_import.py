@@ -0,0 +1,134 @@
+"""
+Word Import - Validation for bulk word uploads
+No UI dependencies. Parses a JSON array or NDJSON body, checks every item
+in one pass, fills in feature_id with detect_features() where it is
+missing, and returns the words ready for WordDataSource.save_words()
+together with one result entry per item.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .corpus_cache import text_key
+from .feature_engine import FEATURE_DEFINITIONS, detect_features
+from .pronunciation_engine import ARPABET_TO_IPA
+
+# Feature ids used by the quiz data on top of the guide's FEATURE_DEFINITIONS
+QUIZ_FEATURES = {"stress", "rhythm", "assimilation", "t_flap", "intonation"}
+
+_FEATURE_ORDER = list(FEATURE_DEFINITIONS)
+
+
+def word_problems(word: Any, require_feature: bool = True) -> List[str]:
+    """Reasons a word entry is unusable (empty list if it is fine)"""
+    if not isinstance(word, dict):
+        return ["not an object"]
+    problems = []
+    text = word.get("text")
+    if not isinstance(text, str) or not text.strip():
+        problems.append("missing text")
+    syllables = word.get("syllables")
+    if not isinstance(syllables, list) or not syllables:
+        problems.append("missing syllables")
+    elif not all(isinstance(s, str) for s in syllables):
+        problems.append("non-string syllable")
+    else:
+        for syllable in syllables:
+            for token in syllable.split():
+                if token.rstrip("012") not in ARPABET_TO_IPA:
+                    problems.append("unknown phoneme")
+                    break
+            else:
+                continue
+            break
+    feature = word.get("feature_id")
+    if feature is None and not require_feature:
+        pass
+    elif not isinstance(feature, str):
+        problems.append("missing feature_id")
+    elif feature not in FEATURE_DEFINITIONS and feature not in QUIZ_FEATURES:
+        problems.append("unknown feature_id")
+    return problems
+
+
+def detect_feature_id(text: str, syllables: List[str]) -> Optional[str]:
+    """The first detected feature in guide order, as `corpus_tools.py retag` picks it"""
+    detected = detect_features(text, syllables)
+    return min(detected, key=_FEATURE_ORDER.index) if detected else None
+
+
+def parse_payload(body: bytes) -> List[Tuple[Any, Optional[str]]]:
+    """
+    Items of an upload as (item, parse error).
+
+    A body starting with "[" is one JSON array and a syntax error rejects it
+    whole (ValueError). Anything else is NDJSON: one item per non-blank
+    line, and a bad line only fails that item.
+    """
+    text = body.decode("utf-8-sig")
+    if text.lstrip().startswith("["):
+        return [(item, None) for item in json.loads(text)]
+    items = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            items.append((json.loads(line), None))
+        except json.JSONDecodeError as e:
+            items.append((None, f"invalid JSON: {e.msg}"))
+    return items
+
+
+def prepare_words(
+    items: Sequence[Tuple[Any, Optional[str]]],
+    exists: Callable[[str], bool],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Validate parsed items and build the word records to save.
+
+    `exists(text)` tells whether the corpus already has a word. Returns
+    (words, results), with one result per item in input order; its "status"
+    is "added", "updated" or "invalid" (with "errors"). A text repeated in
+    the upload is invalid after its first occurrence.
+    """
+    words = []
+    results = []
+    first_index: Dict[str, int] = {}
+    for index, (item, error) in enumerate(items):
+        result: Dict[str, Any] = {"index": index}
+        if isinstance(item, dict) and isinstance(item.get("text"), str):
+            result["text"] = item["text"].strip().lower()
+        problems = [error] if error else word_problems(item, require_feature=False)
+
+        key = text_key(result.get("text"))
+        if not problems and key in first_index:
+            problems.append(f"duplicate of item {first_index[key]}")
+        feature_id = item.get("feature_id") if not problems else None
+        detected = False
+        if not problems and feature_id is None:
+            feature_id = detect_feature_id(result["text"], item["syllables"])
+            detected = True
+            if feature_id is None:
+                problems.append("no feature detected; pass feature_id")
+
+        if problems:
+            result["status"] = "invalid"
+            result["errors"] = problems
+            results.append(result)
+            continue
+
+        first_index[key] = index
+        word = {
+            "text": result["text"],
+            "syllables": item["syllables"],
+            "feature_id": feature_id,
+            "original_pronunciation": item.get("original_pronunciation") or " ".join(item["syllables"]),
+        }
+        if item.get("clip_id"):
+            word["clip_id"] = item["clip_id"]
+        words.append(word)
+        result["status"] = "updated" if exists(word["text"]) else "added"
+        result["feature_id"] = feature_id
+        result["feature_detected"] = detected
+        results.append(result)
+    return words, results
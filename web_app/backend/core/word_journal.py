@@ -0,0 +1,116 @@
+"""
+Word Journal - Append-only log of word upserts
+No UI dependencies. Each saved word is one JSON line, fsync'd on append.
+The journal is replayed on top of the main corpus file at load time and
+folded back into it by compaction.
+"""
+
+import json
+import os
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+
+class WordJournal:
+    """Append-only NDJSON journal that sits next to a corpus file"""
+
+    def __init__(self, corpus_path: str):
+        self.path = corpus_path + ".journal"
+        # Journal being folded into the corpus by an in-flight compaction
+        self.rotated_path = self.path + ".compacting"
+        self.entry_count = self._count_entries(self.path)
+
+    @staticmethod
+    def _count_entries(path: str) -> int:
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            return sum(1 for line in f if line.strip())
+
+    @staticmethod
+    def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def signature(self) -> Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]]]:
+        """Change-detection stamp covering both journal files"""
+        return (self._file_signature(self.rotated_path), self._file_signature(self.path))
+
+    def append(self, word: Dict[str, Any]) -> None:
+        """Durably record one word (single write + fsync)"""
+        self.append_many([word])
+    
+    def append_many(self, words: Iterable[Dict[str, Any]]) -> int:
+        """Durably record several words with a single write + fsync"""
+        lines = [json.dumps(word, ensure_ascii=False, separators=(",", ":"), default=dict) for word in words]
+        if not lines:
+            return 0
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        # Callers hold the corpus file_lock, so appends from several processes
+        # never interleave
+        with open(self.path, "a+b") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Terminate a torn line so this entry starts cleanly
+                    data = b"\n" + data
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.entry_count += len(lines)
+        return len(lines)
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield journaled words oldest first; torn lines are skipped.
+
+        Also refreshes entry_count, which other processes' appends or
+        compactions may have changed.
+        """
+        live_entries = 0
+        for path in (self.rotated_path, self.path):
+            try:
+                f = open(path, "r", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            with f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if path == self.path:
+                        live_entries += 1
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Crash mid-append left a partial line
+                        continue
+                    if isinstance(entry, dict):
+                        yield entry
+        self.entry_count = live_entries
+
+    def has_entries(self) -> bool:
+        """Anything (live or rotated) not yet folded into the corpus"""
+        return any(os.path.exists(p) and os.path.getsize(p) > 0 for p in (self.rotated_path, self.path))
+
+    def rotate(self) -> None:
+        """Set the live journal aside for compaction and start a fresh one"""
+        if os.path.exists(self.path):
+            if os.path.exists(self.rotated_path):
+                # Left over from an interrupted compaction; keep its entries
+                with open(self.path, "rb") as src, open(self.rotated_path, "ab") as dst:
+                    dst.write(src.read())
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.rotated_path)
+        self.entry_count = 0
+
+    def discard_rotated(self) -> None:
+        """Drop the rotated journal once the corpus file contains it"""
+        if os.path.exists(self.rotated_path):
+            os.remove(self.rotated_path)
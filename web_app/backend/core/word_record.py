@@ -0,0 +1,121 @@
+"""
+Word Record - Compact in-memory representation of a corpus word
+No UI dependencies. A __slots__ object instead of a six-key dict, with
+phoneme tokens interned and syllable strings shared through one pool, so
+"T AE1" is stored once for the whole corpus. Records behave like a
+read-only mapping, so code written against word dicts keeps working;
+convert with dict(record) / record.to_dict() at the API boundary.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+class _Missing:
+    """Marker for absent fields; unpickles as the module's singleton"""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+
+# syllable string -> shared instance (built from interned tokens)
+_SYLLABLE_POOL: Dict[str, str] = {}
+
+FIELDS = ("text", "clip_id", "syllables", "original_pronunciation", "ipa_pronunciation", "feature_id")
+
+
+def pooled_syllable(syllable: str) -> str:
+    """Return the shared instance of a syllable string"""
+    shared = _SYLLABLE_POOL.get(syllable)
+    if shared is None:
+        shared = sys.intern(" ".join(sys.intern(token) for token in syllable.split()))
+        _SYLLABLE_POOL[syllable] = shared
+        _SYLLABLE_POOL.setdefault(shared, shared)
+    return shared
+
+
+def syllable_pool_size() -> int:
+    """Number of distinct shared syllable strings"""
+    return len(set(_SYLLABLE_POOL.values()))
+
+
+class WordRecord(Mapping):
+    """Read-only word entry backed by __slots__"""
+
+    __slots__ = ("text", "clip_id", "_syllables", "original_pronunciation", "ipa_pronunciation", "feature_id", "extra")
+
+    def __init__(self, text, clip_id=_MISSING, syllables=_MISSING, original_pronunciation=_MISSING,
+                 ipa_pronunciation=_MISSING, feature_id=_MISSING, extra=None):
+        self.text = text
+        self.clip_id = sys.intern(clip_id) if isinstance(clip_id, str) else clip_id
+        if syllables is _MISSING or syllables is None:
+            self._syllables = syllables
+        else:
+            self._syllables: Tuple[str, ...] = tuple(
+                pooled_syllable(s) if isinstance(s, str) else s for s in syllables
+            )
+        self.original_pronunciation = original_pronunciation
+        self.ipa_pronunciation = ipa_pronunciation
+        self.feature_id = sys.intern(feature_id) if isinstance(feature_id, str) else feature_id
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, word: Mapping) -> "WordRecord":
+        if isinstance(word, WordRecord):
+            return word
+        extra = {k: v for k, v in word.items() if k not in FIELDS} or None
+        return cls(
+            word.get("text", _MISSING),
+            word.get("clip_id", _MISSING),
+            word.get("syllables", _MISSING),
+            word.get("original_pronunciation", _MISSING),
+            word.get("ipa_pronunciation", _MISSING),
+            word.get("feature_id", _MISSING),
+            extra,
+        )
+
+    def _value(self, key: str) -> Any:
+        if key == "syllables":
+            syllables = self._syllables
+            # A fresh list, so callers can't mutate the shared tuple
+            return list(syllables) if isinstance(syllables, tuple) else syllables
+        if key in FIELDS:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        return _MISSING
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._value(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if key == "syllables":
+                if self._syllables is not _MISSING:
+                    yield key
+            elif getattr(self, key) is not _MISSING:
+                yield key
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self}
+
+    def __reduce__(self):
+        # Rebuilt through __init__, so an unpickled record (e.g. from a
+        # shard loader process) shares this process's syllable pool
+        return (WordRecord, (self.text, self.clip_id, self._syllables, self.original_pronunciation,
+                             self.ipa_pronunciation, self.feature_id, self.extra))
+
+    def __repr__(self) -> str:
+        return f"WordRecord({self.to_dict()!r})"
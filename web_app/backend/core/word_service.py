@@ -3,10 +3,14 @@ Word Data Service - Abstraction for word data sources
 No UI dependencies. Pure data access abstraction.
 """
 
-import json
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
+
+from .corpus_cache import CorpusCache
+from .file_lock import atomic_write_json, file_lock
+from .word_journal import WordJournal
 
 
 class WordDataSource(ABC):
@@ -26,38 +30,113 @@ class WordDataSource(ABC):
     def save_word(self, word: Dict[str, Any]) -> None:
         """Persist a word"""
         pass
+    
+    def save_words(self, words: Iterable[Dict[str, Any]]) -> int:
+        """Persist many words; sources override this to commit them in one write"""
+        count = 0
+        for word in words:
+            self.save_word(word)
+            count += 1
+        return count
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Load/reload counters, if the source keeps any"""
+        return {}
 
 
 class JSONWordDataSource(WordDataSource):
-    """Load/save words from JSON file"""
+    """
+    Load/save words from JSON file, served from an in-memory cache.
     
-    def __init__(self, file_path: str):
+    Saves are appended to a journal next to the file; once it holds
+    `compact_threshold` entries it is folded into the file in the background.
+    Appends and compactions take file locks, so several worker processes
+    can share one corpus file.
+    """
+    
+    def __init__(self, file_path: str, compact_threshold: int = 500):
         self.file_path = file_path
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Word file not found: {file_path}")
+        self.compact_threshold = compact_threshold
+        self._journal = WordJournal(file_path)
+        self._cache = CorpusCache(file_path, journal=self._journal)
+        self._write_lock = threading.Lock()
+        # Only one process folds the journal at a time
+        self._compaction_lock_path = file_path + ".compaction"
+        self._compacting = False
+        self.compaction_count = 0
     
     def get_all_words(self) -> List[Dict[str, Any]]:
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return self._cache.get_words()
+    
+    def adopt(self, words: List[Dict[str, Any]], signature: Tuple[Any, ...]) -> None:
+        """Use words parsed by another process instead of reading the file (see CorpusCache.adopt)"""
+        self._cache.adopt(words, signature)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Corpus load time, reload counters and journal state"""
+        stats = self._cache.get_stats()
+        stats["compaction_count"] = self.compaction_count
+        stats["compacting"] = self._compacting
+        return stats
     
     def get_word_by_id(self, word_id: str) -> Dict[str, Any]:
-        for word in self.get_all_words():
-            if word.get("text") == word_id.lower():
-                return word
-        return None
+        return self._cache.lookup(word_id)
     
     def save_word(self, word: Dict[str, Any]) -> None:
-        words = self.get_all_words()
-        found = False
-        
-        for i, w in enumerate(words):
-            if w.get("text") == word.get("text").lower():
-                words[i] = word
-                found = True
-                break
-        
-        if not found:
-            words.append(word)
+        self.save_words([word])
+    
+    def save_words(self, words: Iterable[Dict[str, Any]]) -> int:
+        """Journal a batch of words with one write + fsync"""
+        words = list(words)
+        if not words:
+            return 0
+        with self._write_lock, file_lock(self.file_path):
+            # Pick up other processes' saves before our own append changes the stamp
+            self._cache.get_words()
+            self._journal.append_many(words)
+            self._cache.upsert_many(words)
+            self._cache.mark_persisted()
+            needs_compaction = self._journal.entry_count >= self.compact_threshold
         
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(words, f, indent=2, ensure_ascii=False)
+        if needs_compaction:
+            self._compact_in_background()
+        return len(words)
+    
+    def _compact_in_background(self) -> None:
+        with self._write_lock:
+            if self._compacting:
+                return
+            self._compacting = True
+        threading.Thread(target=self._run_compaction, name="word-journal-compaction", daemon=True).start()
+    
+    def _run_compaction(self) -> None:
+        try:
+            self.compact()
+        finally:
+            self._compacting = False
+    
+    def compact(self) -> None:
+        """Fold the journal into the main JSON file (skipped if another process is at it)"""
+        with file_lock(self._compaction_lock_path, blocking=False) as acquired:
+            if not acquired:
+                return
+            with self._write_lock, file_lock(self.file_path):
+                # Copy-on-write list: this snapshot won't change under us
+                words = self._cache.get_words()
+                if not self._journal.has_entries():
+                    # Another process compacted since we decided to
+                    return
+                self._journal.rotate()
+                self._cache.mark_persisted()
+            
+            # Saves keep appending to the fresh journal meanwhile; readers
+            # see the old file or the new one, and replaying the rotated
+            # journal over either gives the same words.
+            atomic_write_json(self.file_path, words, indent=2, ensure_ascii=False, default=dict)
+            with self._write_lock, file_lock(self.file_path):
+                self._journal.discard_rotated()
+                # Stamps only if no other process appended since the rotate
+                self._cache.mark_compacted()
+            self.compaction_count += 1
@@ -0,0 +1,81 @@
+"""
+Benchmark: bulk word import vs one /api/words/add call per word
+Posts generated words to a temporary copy of the full corpus through the
+FastAPI app (TestClient, no network) and reports throughput in words per
+second: one request per word, then a single /api/words/bulk request as a
+JSON array and as NDJSON.
+
+Usage (from web_app/):
+    python benchmarks/bench_bulk_import.py
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi.testclient import TestClient
+
+import api.main as api
+from core.word_service import JSONWordDataSource
+
+SOURCE_FILE = Path(__file__).resolve().parents[2] / "all_words_firestore.json"
+SINGLE_WORDS = 200
+BULK_WORDS = 20_000
+ONSETS = ["B", "D", "G", "K", "P", "T", "S", "F", "M", "N"]
+CODAS = ["N", "M", "K", "T", "L", "R"]
+
+
+def generated_words(prefix: str, count: int, with_feature: bool):
+    for i in range(count):
+        word = {
+            "text": f"{prefix}{i}",
+            "syllables": [f"{ONSETS[i % 10]} AE1 {CODAS[i % 6]}", f"T IH0 {CODAS[(i // 6) % 6]}"],
+        }
+        if with_feature:
+            word["feature_id"] = "stress"
+        yield word
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp(prefix="bench_bulk_")
+    path = f"{tmp_dir}/words.json"
+    shutil.copy(SOURCE_FILE, path)
+    api.word_service = JSONWordDataSource(path, compact_threshold=10**9)
+    client = TestClient(api.app)
+    print(f"{len(api._indexed_words())} words in corpus\n")
+
+    started = time.perf_counter()
+    for word in generated_words("singleword", SINGLE_WORDS, with_feature=True):
+        assert client.post("/api/words/add", json=word).status_code == 200
+    single = SINGLE_WORDS / (time.perf_counter() - started)
+    print(f"/api/words/add x{SINGLE_WORDS}: {single:,.0f} words/s")
+
+    runs = [
+        ("JSON array", "arrayword", "application/json", lambda words: json.dumps(words)),
+        ("NDJSON", "ndjsonword", "application/x-ndjson", lambda words: "\n".join(map(json.dumps, words))),
+    ]
+    for name, prefix, content_type, encode in runs:
+        # Half the words rely on detect_features() for their feature_id
+        words = list(generated_words(prefix, BULK_WORDS, with_feature=False))
+        for word in words[::2]:
+            word["feature_id"] = "stress"
+        body = encode(words)
+        started = time.perf_counter()
+        response = client.post("/api/words/bulk", content=body, headers={"Content-Type": content_type})
+        elapsed = time.perf_counter() - started
+        assert response.status_code == 200 and response.json()["saved"] == BULK_WORDS
+        print(f"/api/words/bulk {name} x{BULK_WORDS}: {BULK_WORDS / elapsed:,.0f} words/s "
+              f"({elapsed:.2f}s, {BULK_WORDS / elapsed / single:.0f}x)")
+
+    shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: "did you mean" lookup - linear scan vs. FuzzyIndex
+Times misspelled-word queries at edit distance 1 and 2 against a 130k-word
+list (the corpus plus CMU dictionary words, as indexed by CorpusIndex,
+padded with suffixed copies).
+
+Usage (from web_app/):
+    python benchmarks/bench_fuzzy.py
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.fuzzy_index import FuzzyIndex, bounded_levenshtein
+
+import cmudict
+
+SOURCE_FILE = Path(__file__).resolve().parents[2] / "all_words_firestore.json"
+SIZE = 130_000
+QUERIES = 500
+SCAN_QUERIES = 20
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+
+def make_words(size):
+    with open(SOURCE_FILE, "r", encoding="utf-8") as f:
+        words = {word["text"].casefold() for word in json.load(f)}
+    words.update(cmudict.dict())
+    words = sorted(words)
+    base = list(words)
+    i = 0
+    while len(words) < size:
+        words.append(f"{base[i % len(base)]}_{i // len(base) + 1}")
+        i += 1
+    return words[:size]
+
+
+def typo(word, edits, rng):
+    """Apply `edits` random substitutions, deletions or insertions"""
+    chars = list(word)
+    for _ in range(edits):
+        i = rng.randrange(len(chars))
+        op = rng.choice("sdi") if len(chars) > 1 else "i"
+        if op == "s":
+            chars[i] = rng.choice(LETTERS)
+        elif op == "d":
+            del chars[i]
+        else:
+            chars.insert(i, rng.choice(LETTERS))
+    return "".join(chars)
+
+
+def scan_search(words, query, max_distance):
+    """Compare against every word (what a lookup without an index costs)"""
+    return [w for w in words if bounded_levenshtein(query, w, max_distance) <= max_distance]
+
+
+def time_per_query(fn, queries):
+    started = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - started) / len(queries)
+
+
+def main():
+    rng = random.Random(42)
+    words = make_words(SIZE)
+
+    started = time.perf_counter()
+    index = FuzzyIndex(words)
+    build = time.perf_counter() - started
+    print(f"{len(index)} words, {index.entry_count} index entries, built in {build:.2f}s\n")
+
+    print(f"{'distance':>8} | {'scan (ms/query)':>16} | {'index (ms/query)':>17} | {'speedup':>8}")
+    print("-" * 60)
+    for distance in (1, 2):
+        queries = [typo(rng.choice(words[:100_000]), distance, rng) for _ in range(QUERIES)]
+        scan = time_per_query(lambda q: scan_search(words, q, distance), queries[:SCAN_QUERIES])
+        indexed = time_per_query(lambda q: index.search(q, distance), queries)
+        print(f"{distance:>8} | {scan * 1e3:>16.1f} | {indexed * 1e3:>17.3f} | {scan / indexed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: bounded most_missed tracking
+Feeds a Zipf-distributed stream of misses over a 130k-word vocabulary to
+the unbounded dict that most_missed used to be, and to SpaceSaving sketches
+of a few capacities: per-miss update time, top-5 query time (sorting the
+dict vs walking the sketch), memory held, and how many of the true top 10
+each sketch reports.
+
+Usage (from web_app/):
+    python benchmarks/bench_heavy_hitters.py
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from bisect import bisect_left
+from itertools import accumulate
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.heavy_hitters import SpaceSaving
+
+VOCABULARY = 130_000
+MISSES = 500_000
+CAPACITIES = [100, 1_000, 10_000]
+QUERIES = 20
+
+
+def zipf_stream(rng):
+    """MISSES words, the rank-r word drawn with probability proportional to 1/r"""
+    cumulative = list(accumulate(1.0 / rank for rank in range(1, VOCABULARY + 1)))
+    words = [f"word{i}" for i in range(VOCABULARY)]
+    rng.shuffle(words)
+    total = cumulative[-1]
+    return [words[min(bisect_left(cumulative, rng.random() * total), VOCABULARY - 1)] for _ in range(MISSES)]
+
+
+def count_dict(stream):
+    counts = {}
+    for word in stream:
+        counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+def count_sketch(stream, capacity):
+    sketch = SpaceSaving(capacity)
+    for word in stream:
+        sketch.add(word)
+    return sketch
+
+
+def timed(build):
+    """Per-miss update time (untraced) and the memory a second build holds"""
+    started = time.perf_counter()
+    build()
+    update_us = (time.perf_counter() - started) / MISSES * 1e6
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, update_us, memory
+
+
+def query_us(top5):
+    started = time.perf_counter()
+    for _ in range(QUERIES):
+        top5()
+    return (time.perf_counter() - started) / QUERIES * 1e6
+
+
+def main():
+    stream = zipf_stream(random.Random(5))
+    print(f"{MISSES:,} misses over a {VOCABULARY:,}-word vocabulary (Zipf)\n")
+    print(f"{'structure':<22} {'entries':>8} {'memory':>10} {'update':>8} {'top 5':>10} {'true top 10 found':>18}")
+
+    counts, update_us, memory = timed(lambda: count_dict(stream))
+    top5_us = query_us(lambda: sorted(counts.items(), key=lambda item: item[1], reverse=True)[:5])
+    true_top = {word for word, _ in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:10]}
+    print(f"{'dict + sorted':<22} {len(counts):>8,} {memory / 1024:>8,.0f}KB {update_us:>6.2f}µs "
+          f"{top5_us:>8,.0f}µs {'10/10':>18}")
+
+    for capacity in CAPACITIES:
+        sketch, update_us, memory = timed(lambda: count_sketch(stream, capacity))
+        top5_us = query_us(lambda: sketch.top(5))
+        found = len(true_top & {word for word, _, _ in sketch.top(10)})
+        print(f"{f'SpaceSaving({capacity:,})':<22} {len(sketch):>8,} {memory / 1024:>8,.0f}KB {update_us:>6.2f}µs "
+              f"{top5_us:>8,.1f}µs {f'{found}/10':>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: word lookup by text - linear scan vs. CorpusCache hash index
+Compares the old get_word_by_id scan against the case-folded index at
+corpus sizes of 300, 10k and 130k words.
+
+Usage (from web_app/):
+    python benchmarks/bench_lookup.py
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.corpus_cache import CorpusCache
+
+SOURCE_FILE = Path(__file__).resolve().parents[2] / "all_words_firestore.json"
+SIZES = [300, 10_000, 130_000]
+QUERIES = 2_000
+
+
+def make_corpus(base_words, size):
+    """Take `size` words, padding with suffixed copies when the source is smaller"""
+    words = list(base_words[:size])
+    i = 0
+    while len(words) < size:
+        clone = dict(base_words[i % len(base_words)])
+        clone["text"] = f"{clone['text']}_{i // len(base_words) + 1}"
+        words.append(clone)
+        i += 1
+    return words
+
+
+def scan_lookup(words, word_id):
+    """The pre-index get_word_by_id implementation"""
+    for word in words:
+        if word.get("text") == word_id.lower():
+            return word
+    return None
+
+
+def time_per_query(fn, queries):
+    started = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - started) / len(queries)
+
+
+def main():
+    with open(SOURCE_FILE, "r", encoding="utf-8") as f:
+        base_words = json.load(f)
+
+    print(f"{'words':>8} | {'scan (us/query)':>16} | {'index (us/query)':>17} | {'speedup':>8}")
+    print("-" * 60)
+    for size in SIZES:
+        words = make_corpus(base_words, size)
+        # Half hits spread over the corpus, half misses (worst case for a scan)
+        hits = [random.choice(words)["text"].upper() for _ in range(QUERIES // 2)]
+        misses = [f"zz-missing-{i}" for i in range(QUERIES // 2)]
+        queries = hits + misses
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as tmp:
+            json.dump(words, tmp)
+        try:
+            cache = CorpusCache(tmp.name)
+            cache.get_words()
+
+            scan_queries = queries if size <= 10_000 else queries[::20]
+            scan = time_per_query(lambda q: scan_lookup(words, q), scan_queries)
+            index = time_per_query(cache.lookup, queries)
+        finally:
+            os.unlink(tmp.name)
+
+        print(f"{size:>8} | {scan * 1e6:>16.1f} | {index * 1e6:>17.2f} | {scan / index:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
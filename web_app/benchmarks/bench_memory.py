@@ -0,0 +1,61 @@
+"""
+Benchmark: resident memory of the loaded corpus - dicts vs. WordRecord
+Loads all_words_firestore.json in a fresh subprocess per representation
+and reports the growth in resident set size (VmRSS, Linux) once the
+parse buffers have been released.
+
+Usage (from web_app/):
+    python benchmarks/bench_memory.py
+"""
+
+import gc
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+SOURCE_FILE = Path(__file__).resolve().parents[2] / "all_words_firestore.json"
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def measure(mode: str) -> None:
+    from core.word_record import WordRecord, syllable_pool_size
+
+    gc.collect()
+    before = rss_mb()
+    started = time.perf_counter()
+    with open(SOURCE_FILE, "r", encoding="utf-8") as f:
+        if mode == "records":
+            # Same path as CorpusCache: each dict becomes a record as it is parsed
+            words = json.load(f, object_hook=WordRecord.from_dict)
+        else:
+            words = json.load(f)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    after = rss_mb()
+    extra = f", {syllable_pool_size()} pooled syllables" if mode == "records" else ""
+    print(f"{mode:>8}: {len(words)} words, +{after - before:.1f} MB RSS, load {elapsed:.2f}s{extra}")
+
+
+def main():
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+        return
+    for mode in ("dicts", "records"):
+        subprocess.run([sys.executable, __file__, mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
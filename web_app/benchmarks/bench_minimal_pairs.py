@@ -0,0 +1,84 @@
+"""
+Benchmark: minimal-pair index over the full CMU-derived corpus
+Builds MinimalPairIndex from all_words_firestore.json and reports build
+time, resident memory added by the index (VmRSS, Linux), the number of
+pairs, and per-word query time against a length-bucketed pairwise scan.
+
+Usage (from web_app/):
+    python benchmarks/bench_minimal_pairs.py
+"""
+
+import gc
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.minimal_pairs import MinimalPairIndex, encode_phonemes
+from core.rhyme_index import phonemes
+
+SOURCE_FILE = Path(__file__).resolve().parents[2] / "all_words_firestore.json"
+QUERIES = 2_000
+SCAN_QUERIES = 20
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def scan_pairs(encoded, by_length, code):
+    """Compare against every word of the same length (no index)"""
+    return [
+        position for position in by_length.get(len(code), ())
+        if sum(a != b for a, b in zip(code, encoded[position])) == 1
+    ]
+
+
+def main():
+    with open(SOURCE_FILE, "r", encoding="utf-8") as f:
+        words = json.load(f)
+    entries = [(position, word.get("syllables")) for position, word in enumerate(words)]
+
+    gc.collect()
+    before = rss_mb()
+    started = time.perf_counter()
+    index = MinimalPairIndex(entries)
+    build = time.perf_counter() - started
+    gc.collect()
+    after = rss_mb()
+    print(f"{len(entries)} words, {index.entry_count} wildcard keys")
+    print(f"build: {build:.2f}s, +{after - before:.1f} MB RSS")
+
+    started = time.perf_counter()
+    pair_count = sum(1 for _ in index.iter_pairs())
+    print(f"all pairs: {pair_count} in {time.perf_counter() - started:.2f}s\n")
+
+    rng = random.Random(7)
+    sample = [rng.choice(entries) for _ in range(QUERIES)]
+    encoded = {position: encode_phonemes(phonemes(syllables or [])) for position, syllables in entries}
+    by_length = {}
+    for position, code in encoded.items():
+        by_length.setdefault(len(code), []).append(position)
+
+    started = time.perf_counter()
+    for position, _ in sample[:SCAN_QUERIES]:
+        scan_pairs(encoded, by_length, encoded[position])
+    scan = (time.perf_counter() - started) / SCAN_QUERIES
+    started = time.perf_counter()
+    for _, syllables in sample:
+        index.pairs_for(phonemes(syllables or []))
+    indexed = (time.perf_counter() - started) / QUERIES
+    print(f"pairs of one word: scan {scan * 1e3:.1f} ms, index {indexed * 1e6:.1f} us ({scan / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
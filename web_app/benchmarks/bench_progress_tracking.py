@@ -0,0 +1,128 @@
+"""
+Benchmark: recording quiz attempts with each progress store
+Records the same attempts, spread over many sessions, through
+FileProgressTracker (one journal append per attempt, also with a snapshot
+whose most_missed already holds 20,000 words), SessionProgressRegistry
+(file stats, write-behind) and SqliteProgressTracker (row log, batched
+inserts), then times a global and a per-session stats read. Finally runs
+the /api/quiz/submit-answer handler with each store. The handler is
+awaited directly, because TestClient's own overhead (about 570 requests/s
+even for /api/health on this box) would hide the difference.
+
+Usage (from web_app/):
+    python benchmarks/bench_progress_tracking.py
+"""
+
+import asyncio
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+import api.main as api
+from core.progress_service import FileProgressTracker, SessionProgressRegistry
+from core.sqlite_progress import SqliteProgressTracker
+
+ATTEMPTS = 50_000
+SINGLE_FILE_ATTEMPTS = 1_000
+MISSED_WORDS = 20_000
+SESSIONS = 200
+REQUESTS = 20_000
+FEATURES = ["stress", "rhythm", "assimilation", "t_flap", "intonation", "skip"]
+
+
+def attempts(count):
+    rng = random.Random(7)
+    words = [f"word{i}" for i in range(5_000)]
+    for _ in range(count):
+        yield f"user_{rng.randrange(SESSIONS)}", rng.choice(words), rng.choice(FEATURES), rng.random() < 0.6
+
+
+def report(name, count, seconds):
+    print(f"{name:<34} {count:>7} attempts  {count / seconds:>10,.0f} attempts/s")
+
+
+def timed_stats(name, store, session_id):
+    started = time.perf_counter()
+    store.get_stats()
+    global_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    store.get_stats(session_id)
+    session_ms = (time.perf_counter() - started) * 1000
+    print(f"{name:<34} stats: global {global_ms:.1f} ms, one session {session_ms:.1f} ms")
+
+
+async def submit_answers(store):
+    api.session_progress = store
+    api._indexed_words()
+    for i in range(SESSIONS):
+        await api.new_word(session_id=f"user_{i}")
+    started = time.perf_counter()
+    for i in range(REQUESTS):
+        request = api.SubmitAnswerRequest(session_id=f"user_{i % SESSIONS}", feature=FEATURES[i % len(FEATURES)])
+        await api.submit_answer(request)
+    elapsed = time.perf_counter() - started
+    store.close()
+    return REQUESTS / elapsed
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp(prefix="bench_progress_")
+
+    large_path = os.path.join(tmp_dir, "large.json")
+    with open(large_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "total_rounds": MISSED_WORDS, "correct": 0, "skipped": 0, "attempts_per_word": {},
+            "per_feature": {}, "most_missed": {f"missed{i}": 1 for i in range(MISSED_WORDS)},
+        }, f)
+    for name, path in (("", "single.json"), (f", {MISSED_WORDS // 1000}k missed", large_path)):
+        tracker = FileProgressTracker(os.path.join(tmp_dir, path))
+        started = time.perf_counter()
+        for _, word, feature, correct in attempts(SINGLE_FILE_ATTEMPTS):
+            tracker.save_attempt(word, correct, feature)
+        report(f"FileProgressTracker{name}", SINGLE_FILE_ATTEMPTS, time.perf_counter() - started)
+
+    registry = SessionProgressRegistry(
+        FileProgressTracker(os.path.join(tmp_dir, "aggregate.json")),
+        os.path.join(tmp_dir, "sessions"),
+    )
+    started = time.perf_counter()
+    for session_id, word, feature, correct in attempts(ATTEMPTS):
+        registry.record(session_id, word, feature, None, correct)
+    registry.close()
+    report("SessionProgressRegistry", ATTEMPTS, time.perf_counter() - started)
+
+    store = SqliteProgressTracker(os.path.join(tmp_dir, "stats.db"))
+    started = time.perf_counter()
+    for session_id, word, feature, correct in attempts(ATTEMPTS):
+        store.record(session_id, word, feature, "stress", correct, latency_ms=1200)
+    store.flush()
+    report("SqliteProgressTracker", ATTEMPTS, time.perf_counter() - started)
+    print()
+    timed_stats("SessionProgressRegistry", registry, "user_0")
+    timed_stats("SqliteProgressTracker", store, "user_0")
+    store.close()
+
+    print()
+    stores = [
+        ("file", SessionProgressRegistry(
+            FileProgressTracker(os.path.join(tmp_dir, "api.json")), os.path.join(tmp_dir, "api_sessions"))),
+        ("sqlite", SqliteProgressTracker(os.path.join(tmp_dir, "api.db"))),
+    ]
+    for method, store in stores:
+        rate = asyncio.run(submit_answers(store))
+        print(f"submit_answer handler x{REQUESTS} ({method}): {rate:,.0f} answers/s")
+
+    shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: spaced-repetition due queue
+Times a review loop - next_due() then schedule() for the answered word -
+against a learner's card count (the heap keeps both near O(log n)), and a
+linear scan for the earliest due card as a reference.
+
+Usage (from web_app/):
+    python benchmarks/bench_review_scheduler.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.review_scheduler import LearnerSchedule, answer_quality, sm2_update
+
+SIZES = [1_000, 10_000, 100_000]
+OPERATIONS = 20_000
+
+
+def build(size, rng):
+    now = 0.0
+    cards = {}
+    for i in range(size):
+        card = None
+        for _ in range(rng.randrange(1, 4)):
+            card = sm2_update(card, answer_quality(rng.random() < 0.7), now - rng.random() * 10**7)
+        cards[f"word{i}"] = card
+    return LearnerSchedule(cards)
+
+
+def main():
+    rng = random.Random(3)
+    # Later than every initial due time, earlier than any rescheduled one
+    now = 10.0**9
+    print(f"{'cards':>8}  {'next_due + schedule':>20}  {'linear scan':>12}")
+    for size in SIZES:
+        schedule = build(size, rng)
+        rounds = min(OPERATIONS, size)
+
+        # A review session: take the most overdue word, answer, reschedule
+        started = time.perf_counter()
+        for i in range(rounds):
+            word = schedule.next_due(now)
+            schedule.schedule(word, sm2_update(schedule.cards[word], answer_quality(i % 3 != 0), now))
+        heap_us = (time.perf_counter() - started) / rounds * 1e6
+
+        scans = 100
+        started = time.perf_counter()
+        for _ in range(scans):
+            min(((card["due"], word) for word, card in schedule.cards.items() if card["due"] <= now), default=None)
+        scan_us = (time.perf_counter() - started) / scans * 1e6
+
+        print(f"{size:>8,}  {heap_us:>18.2f}µs  {scan_us:>10,.0f}µs")
+
+
+if __name__ == "__main__":
+    main()
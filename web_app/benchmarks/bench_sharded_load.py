@@ -0,0 +1,76 @@
+"""
+Benchmark: cold start of the sharded corpus vs the single JSON file
+Splits all_words_firestore.json into a temporary shard directory and times
+a cold get_all_words() for the single file and for the shards with one and
+with several loader processes, then the reload after editing one word
+(one shard re-read vs the whole file).
+
+Usage (from web_app/):
+    python benchmarks/bench_sharded_load.py [workers]
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.sharded_corpus import ShardedWordDataSource, write_shards
+from core.word_service import JSONWordDataSource
+
+SOURCE_FILE = Path(__file__).resolve().parents[2] / "all_words_firestore.json"
+EDITED_WORD = {"text": "tomato", "syllables": ["T AH0", "M EY1", "T OW2"], "feature_id": "t_flap"}
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def edit_elsewhere(make_source):
+    """Save a word through a second instance, as another worker process would"""
+    make_source().save_word(EDITED_WORD)
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    tmp_dir = tempfile.mkdtemp(prefix="bench_shards_")
+    single_path = os.path.join(tmp_dir, "words.json")
+    shutil.copy(SOURCE_FILE, single_path)
+    with open(SOURCE_FILE, "r", encoding="utf-8") as f:
+        words = json.load(f)
+    print(f"{len(words)} words, {os.cpu_count()} CPUs\n")
+
+    words_list, seconds = timed(lambda: JSONWordDataSource(single_path).get_all_words())
+    print(f"single file              cold load {seconds:.2f}s")
+    source = JSONWordDataSource(single_path)
+    source.get_all_words()
+    edit_elsewhere(lambda: JSONWordDataSource(single_path))
+    _, seconds = timed(source.get_all_words)
+    print(f"single file              reload after edit {seconds:.2f}s\n")
+
+    for scheme, shard_count in (("letter", 0), ("hash", 16)):
+        shard_dir = os.path.join(tmp_dir, scheme)
+        counts = write_shards(words, shard_dir, scheme=scheme, shard_count=shard_count or 16)
+        label = f"{scheme} ({len(counts)} shards)"
+        for n in sorted({1, workers}):
+            _, seconds = timed(lambda: ShardedWordDataSource(shard_dir, workers=n).get_all_words())
+            print(f"{label:<24} cold load, {n} worker(s) {seconds:.2f}s")
+        source = ShardedWordDataSource(shard_dir, workers=1)
+        source.get_all_words()
+        edit_elsewhere(lambda: ShardedWordDataSource(shard_dir, workers=1))
+        _, seconds = timed(source.get_all_words)
+        print(f"{label:<24} reload after edit {seconds:.2f}s\n")
+
+    shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: weighted draws of missed words
+Compares the old review pool (each missed word repeated once per miss, then
+random.choice) with AliasSampler and FenwickSampler over the same miss
+counts: build time, per-draw time, per-update time and memory, as the
+total miss count grows while the number of distinct words stays fixed.
+
+Usage (from web_app/):
+    python benchmarks/bench_weighted_sampler.py
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from core.weighted_sampler import AliasSampler, FenwickSampler
+
+DISTINCT_WORDS = 5_000
+MEAN_MISSES = [2, 20, 200]
+DRAWS = 100_000
+
+
+def duplicated_pool(words, counts):
+    pool = []
+    for word, count in zip(words, counts):
+        pool.extend([word] * count)
+    return pool
+
+
+def measure(build):
+    """Build time (untraced) and the memory a second build holds"""
+    started = time.perf_counter()
+    build()
+    build_ms = (time.perf_counter() - started) * 1000
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, build_ms, memory
+
+
+def per_draw_us(draw):
+    started = time.perf_counter()
+    for _ in range(DRAWS):
+        draw()
+    return (time.perf_counter() - started) / DRAWS * 1e6
+
+
+def main():
+    rng = random.Random(11)
+    words = [{"text": f"word{i}"} for i in range(DISTINCT_WORDS)]
+    print(f"{DISTINCT_WORDS:,} distinct missed words\n")
+    print(f"{'misses':>10}  {'structure':<16} {'build':>9} {'memory':>10} {'draw':>8} {'update':>8}")
+    for mean in MEAN_MISSES:
+        counts = [rng.randint(1, 2 * mean - 1) for _ in words]
+        total = sum(counts)
+
+        pool, build_ms, memory = measure(lambda: duplicated_pool(words, counts))
+        draw_us = per_draw_us(lambda: rng.choice(pool))
+        print(f"{total:>10,}  {'duplicated list':<16} {build_ms:>7.1f}ms {memory / 1024:>8,.0f}KB "
+              f"{draw_us:>6.2f}µs {'-':>8}")
+        del pool
+
+        alias, build_ms, memory = measure(lambda: AliasSampler(counts))
+        draw_us = per_draw_us(lambda: alias.sample(rng))
+        print(f"{'':>10}  {'AliasSampler':<16} {build_ms:>7.1f}ms {memory / 1024:>8,.0f}KB "
+              f"{draw_us:>6.2f}µs {'rebuild':>8}")
+
+        fenwick, build_ms, memory = measure(lambda: FenwickSampler(counts))
+        draw_us = per_draw_us(lambda: fenwick.sample(rng))
+        started = time.perf_counter()
+        for i in range(DRAWS):
+            fenwick.add(i % DISTINCT_WORDS, 1)
+        update_us = (time.perf_counter() - started) / DRAWS * 1e6
+        print(f"{'':>10}  {'FenwickSampler':<16} {build_ms:>7.1f}ms {memory / 1024:>8,.0f}KB "
+              f"{draw_us:>6.2f}µs {update_us:>6.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Corpus maintenance tools
+Offline commands for converting, re-tagging and validating the word JSON
+files. Input files are streamed item by item, so memory does not grow with
+the size of the file.
+
+Usage (from web_app/):
+    python corpus_tools.py import-sqlite ../words.db ../words_firestore.json ../all_words_firestore.json
+    python corpus_tools.py build-binary ../words.bin ../words_firestore.json ../all_words_firestore.json
+    python corpus_tools.py shard ../words_shards ../all_words_firestore.json --by letter
+    python corpus_tools.py retag ../all_words_firestore.json ../all_words_tagged.json
+    python corpus_tools.py validate ../all_words_firestore.json
+    python corpus_tools.py minimal-pairs ../all_words_firestore.json ../minimal_pairs.ndjson --phoneme R
+"""
+
+import argparse
+import json
+import os
+import sys
+import textwrap
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add backend directory to path so we can import core modules
+sys.path.insert(0, str(Path(__file__).parent / "backend"))
+
+from core.binary_corpus import write_binary_corpus, BinaryCorpusReader
+from core.corpus_cache import text_key
+from core.feature_engine import FEATURE_DEFINITIONS, detect_features
+from core.json_stream import iter_json_array
+from core.minimal_pairs import MinimalPairIndex
+from core.rhyme_index import phonemes
+from core.sharded_corpus import SCHEMES, write_shards
+from core.sqlite_word_source import SQLiteWordDataSource
+from core.word_import import word_problems
+
+def _iter_json_words(paths):
+    for path in paths:
+        yield from iter_json_array(path)
+
+
+def cmd_import_sqlite(args: argparse.Namespace) -> None:
+    source = SQLiteWordDataSource(args.database)
+    started = time.perf_counter()
+    imported = source.import_json_files(args.json_files, batch_size=args.batch_size)
+    elapsed = time.perf_counter() - started
+    for path, count in imported.items():
+        print(f"Imported {count} words from {path}")
+    total = source.get_cache_stats()["word_count"]
+    print(f"{total} distinct words in {args.database} ({elapsed:.1f}s)")
+
+
+def cmd_build_binary(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    count = write_binary_corpus(_iter_json_words(args.json_files), args.output)
+    elapsed = time.perf_counter() - started
+    # Compacted generations (<output>.<n>) would be served instead of the new build
+    directory = os.path.dirname(os.path.abspath(args.output))
+    prefix = os.path.basename(args.output) + "."
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name[len(prefix):].isdigit():
+            os.remove(os.path.join(directory, name))
+            print(f"Removed superseded generation {name}")
+    reader = BinaryCorpusReader(args.output)
+    json_bytes = sum(os.path.getsize(path) for path in args.json_files)
+    print(f"Wrote {count} words to {args.output} ({reader.size_bytes / 1e6:.1f} MB "
+          f"from {json_bytes / 1e6:.1f} MB of JSON, {elapsed:.1f}s)")
+
+
+def cmd_shard(args: argparse.Namespace) -> None:
+    started = time.perf_counter()
+    counts = write_shards(_iter_json_words(args.json_files), args.output, scheme=args.by, shard_count=args.count)
+    elapsed = time.perf_counter() - started
+    sizes = list(counts.values())
+    print(f"Wrote {sum(sizes)} words to {len(sizes)} shards in {args.output} "
+          f"({min(sizes)}-{max(sizes)} words per shard, {elapsed:.1f}s)")
+
+
+def cmd_retag(args: argparse.Namespace) -> None:
+    feature_order = list(FEATURE_DEFINITIONS)
+    count = 0
+    changed = 0
+    tmp_path = args.output + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        out.write("[")
+        for word in iter_json_array(args.input):
+            detected = detect_features(word.get("text", ""), word.get("syllables") or [])
+            features = sorted(detected, key=feature_order.index)
+            word["features"] = features
+            if args.set_feature_id and features and word.get("feature_id") != features[0]:
+                word["feature_id"] = features[0]
+                changed += 1
+            out.write(",\n" if count else "\n")
+            out.write(textwrap.indent(json.dumps(word, indent=2, ensure_ascii=False), "  "))
+            count += 1
+        out.write("\n]\n")
+    # Renamed only after the input has been fully read, so output may equal input
+    os.replace(tmp_path, args.output)
+    print(f"Re-tagged {count} words into {args.output}" + (f" ({changed} feature_id changes)" if args.set_feature_id else ""))
+
+
+def cmd_validate(args: argparse.Namespace) -> None:
+    failed = False
+    for path in args.json_files:
+        seen = set()
+        issues = Counter()
+        examples = []
+        count = 0
+        for index, word in enumerate(iter_json_array(path)):
+            count += 1
+            problems = word_problems(word)
+            if isinstance(word, dict):
+                key = text_key(word.get("text"))
+                if key in seen:
+                    problems.append("duplicate text")
+                seen.add(key)
+            for problem in problems:
+                issues[problem] += 1
+                if len(examples) < args.show:
+                    examples.append(f"  #{index} {word.get('text') if isinstance(word, dict) else word!r}: {problem}")
+
+        status = "OK" if not issues else f"{sum(issues.values())} problems"
+        print(f"{path}: {count} words, {status}")
+        for problem, n in issues.most_common():
+            print(f"  {problem}: {n}")
+        if examples:
+            print("First problems:")
+            print("\n".join(examples))
+        failed = failed or bool(issues)
+    sys.exit(1 if failed else 0)
+
+
+def cmd_minimal_pairs(args: argparse.Namespace) -> None:
+    texts = []
+    tokens = []
+    seen = set()
+
+    def entries():
+        for word in _iter_json_words(args.json_files):
+            key = text_key(word.get("text"))
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            texts.append(word["text"])
+            tokens.append([t.rstrip("012") for t in phonemes(word.get("syllables") or [])])
+            yield len(texts) - 1, word.get("syllables")
+
+    started = time.perf_counter()
+    index = MinimalPairIndex(entries())
+    built = time.perf_counter() - started
+    wanted = args.phoneme.upper() if args.phoneme else None
+
+    count = 0
+    tmp_path = args.output + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as out:
+        for a, b, position in index.iter_pairs():
+            contrast = [tokens[a][position], tokens[b][position]]
+            if wanted and wanted not in contrast:
+                continue
+            out.write(json.dumps({"a": texts[a], "b": texts[b], "position": position, "contrast": contrast}) + "\n")
+            count += 1
+    os.replace(tmp_path, args.output)
+    elapsed = time.perf_counter() - started
+    print(f"Wrote {count} minimal pairs over {len(texts)} words to {args.output} "
+          f"(index {built:.1f}s, {index.entry_count} keys; total {elapsed:.1f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Word corpus maintenance tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_sqlite = subparsers.add_parser(
+        "import-sqlite",
+        help="Import word JSON files into a SQLite database (later files win on duplicates)",
+    )
+    import_sqlite.add_argument("database", help="SQLite database file to create or update")
+    import_sqlite.add_argument("json_files", nargs="+", help="Word JSON arrays to import, in order")
+    import_sqlite.add_argument("--batch-size", type=int, default=5000, help="Rows per executemany batch (default: 5000)")
+    import_sqlite.set_defaults(func=cmd_import_sqlite)
+
+    build_binary = subparsers.add_parser(
+        "build-binary",
+        help="Convert word JSON files into the memory-mapped binary corpus (later files win on duplicates)",
+    )
+    build_binary.add_argument("output", help="Binary corpus file to write")
+    build_binary.add_argument("json_files", nargs="+", help="Word JSON arrays to convert, in order")
+    build_binary.set_defaults(func=cmd_build_binary)
+
+    shard = subparsers.add_parser(
+        "shard",
+        help="Split word JSON files into a shard directory with a manifest (later files win on duplicates)",
+    )
+    shard.add_argument("output", help="Shard directory to write")
+    shard.add_argument("json_files", nargs="+", help="Word JSON arrays to split, in order")
+    shard.add_argument("--by", choices=SCHEMES, default="letter", help="Group by first letter or by text hash (default: letter)")
+    shard.add_argument("--count", type=int, default=16, help="Number of hash shards (default: 16)")
+    shard.set_defaults(func=cmd_shard)
+
+    retag = subparsers.add_parser("retag", help="Re-run feature detection over a word JSON file")
+    retag.add_argument("input", help="Word JSON array to read")
+    retag.add_argument("output", help="Word JSON array to write (may be the input file)")
+    retag.add_argument(
+        "--set-feature-id",
+        action="store_true",
+        help="Also replace feature_id with the first detected feature",
+    )
+    retag.set_defaults(func=cmd_retag)
+
+    validate = subparsers.add_parser("validate", help="Check word JSON files for malformed or duplicate entries")
+    validate.add_argument("json_files", nargs="+", help="Word JSON arrays to check")
+    validate.add_argument("--show", type=int, default=10, help="How many individual problems to list (default: 10)")
+    validate.set_defaults(func=cmd_validate)
+
+    minimal_pairs = subparsers.add_parser(
+        "minimal-pairs",
+        help="Export every minimal pair (words one phoneme apart) as NDJSON",
+    )
+    minimal_pairs.add_argument("json_files", nargs="+", help="Word JSON arrays to read (first occurrence of a word wins)")
+    minimal_pairs.add_argument("output", help="NDJSON file to write, one pair per line")
+    minimal_pairs.add_argument("--phoneme", help="Only pairs contrasting this phoneme (e.g. R, L, T)")
+    minimal_pairs.set_defaults(func=cmd_minimal_pairs)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
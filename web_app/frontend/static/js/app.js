@@ -597,7 +597,15 @@ async function searchWord() {
                 addSection.classList.remove('hidden');
             }
         } else {
-            document.getElementById('ipaDisplay').textContent = 'Not found';
+            let notFound = 'Not found';
+            if (ipaResult.status === 'fulfilled' && ipaResult.value.status === 404) {
+                const errorData = await ipaResult.value.json().catch(() => ({}));
+                const candidates = errorData.detail && errorData.detail.did_you_mean;
+                if (Array.isArray(candidates) && candidates.length > 0) {
+                    notFound = `Not found. Did you mean: ${candidates.map(c => c.text).join(', ')}?`;
+                }
+            }
+            document.getElementById('ipaDisplay').textContent = notFound;
             document.getElementById('syllablesDisplay').textContent = '---';
             document.getElementById('originalDisplay').textContent = '---';
             addSection.classList.remove('hidden');
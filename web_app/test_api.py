@@ -124,7 +124,7 @@ try:
     assert response.status_code == 200
     
     words_data = response.json()
-    word_count = words_data['count']
+    word_count = words_data['total']
     
     print(f"   ✅ Status: {response.status_code}")
     print(f"   📚 Total words: {word_count}")
@@ -0,0 +1,141 @@
+"""
+Concurrent-write stress test for the file-backed stores
+Several processes save words (with frequent compactions) and quiz attempts
+into the same files at once; one extra writer is SIGKILLed mid-run. Then
+the files must parse, hold every word, and count every attempt.
+
+Usage (from web_app/):
+    python test_concurrent_writes.py
+"""
+
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from core import word_service
+from core.progress_service import FileProgressTracker
+from core.word_service import JSONWordDataSource
+
+SOURCE_FILE = Path(__file__).resolve().parent.parent / "test_words.json"
+WORKERS = 8
+SAVES_PER_WORKER = 150
+ATTEMPTS_PER_WORKER = 150
+COMPACT_THRESHOLD = 20
+
+
+def make_word(worker: int, i: int) -> dict:
+    return {
+        "text": f"stress{worker}x{i}",
+        "syllables": ["S T R EH1 S"],
+        "feature_id": "1",
+    }
+
+
+def worker(words_path: str, stats_path: str, worker_id: int, saves: int, attempts: int) -> None:
+    source = JSONWordDataSource(words_path, compact_threshold=COMPACT_THRESHOLD)
+    tracker = FileProgressTracker(stats_path, compact_threshold=COMPACT_THRESHOLD)
+    rng = random.Random(worker_id)
+    for i in range(max(saves, attempts)):
+        if i < saves:
+            source.save_word(make_word(worker_id, i))
+        if i < attempts:
+            tracker.save_attempt(f"stress{worker_id}", rng.random() < 0.5, "1")
+    # Let a background compaction started by the last save finish
+    while source._compacting:
+        time.sleep(0.01)
+
+
+def check_compaction_race() -> None:
+    """
+    A save from another process that lands while compaction writes the
+    snapshot must still reach the compacting process's cache.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="race_")
+    words_path = os.path.join(tmp_dir, "words.json")
+    shutil.copy(SOURCE_FILE, words_path)
+    compacting = JSONWordDataSource(words_path)
+    other = JSONWordDataSource(words_path)
+    compacting.save_word(make_word(0, 0))
+
+    real_write = word_service.atomic_write_json
+
+    def write_then_append(*args, **kwargs):
+        real_write(*args, **kwargs)
+        other.save_word(make_word(1, 0))
+
+    word_service.atomic_write_json = write_then_append
+    try:
+        compacting.compact()
+    finally:
+        word_service.atomic_write_json = real_write
+    texts = {w["text"] for w in compacting.get_all_words()}
+    assert make_word(1, 0)["text"] in texts, "save made during compaction never reached the cache"
+    shutil.rmtree(tmp_dir)
+    print("✅ save during compaction is picked up")
+
+
+def main():
+    check_compaction_race()
+
+    tmp_dir = tempfile.mkdtemp(prefix="stress_")
+    words_path = os.path.join(tmp_dir, "words.json")
+    stats_path = os.path.join(tmp_dir, "stats.json")
+    shutil.copy(SOURCE_FILE, words_path)
+    base_count = len(json.load(open(words_path, encoding="utf-8")))
+
+    print(f"{WORKERS} workers x {SAVES_PER_WORKER} saves + {ATTEMPTS_PER_WORKER} attempts in {tmp_dir}")
+    started = time.perf_counter()
+    processes = [
+        multiprocessing.Process(
+            target=worker,
+            args=(words_path, stats_path, w, SAVES_PER_WORKER, ATTEMPTS_PER_WORKER),
+        )
+        for w in range(WORKERS)
+    ]
+    # A writer that is killed at an arbitrary point
+    victim = multiprocessing.Process(target=worker, args=(words_path, stats_path, WORKERS, 10_000, 10_000))
+    for p in processes + [victim]:
+        p.start()
+    time.sleep(1.0)
+    os.kill(victim.pid, signal.SIGKILL)
+    for p in processes + [victim]:
+        p.join()
+    print(f"writers done in {time.perf_counter() - started:.1f}s")
+
+    failures = [p.exitcode for p in processes if p.exitcode != 0]
+    assert not failures, f"worker exit codes: {failures}"
+
+    # Files on disk must be complete JSON at every point, including now
+    json.load(open(words_path, encoding="utf-8"))
+    # Snapshot plus the replayed journal tail
+    stats = FileProgressTracker(stats_path).get_stats()
+
+    words = JSONWordDataSource(words_path).get_all_words()
+    texts = {w["text"] for w in words}
+    expected = {make_word(w, i)["text"] for w in range(WORKERS) for i in range(SAVES_PER_WORKER)}
+    missing = expected - texts
+    assert not missing, f"{len(missing)} saved words missing, e.g. {sorted(missing)[:3]}"
+    victim_saves = len([t for t in texts if t.startswith(f"stress{WORKERS}x")])
+    assert len(words) == base_count + len(expected) + victim_saves, "duplicate or lost words"
+    print(f"words: {len(words)} ({len(expected)} from workers, {victim_saves} before the kill)")
+
+    victim_attempts = stats["total_rounds"] - WORKERS * ATTEMPTS_PER_WORKER
+    assert victim_attempts >= 0, f"lost attempts: total_rounds={stats['total_rounds']}"
+    assert stats["correct"] + sum(stats["most_missed"].values()) == stats["total_rounds"]
+    print(f"attempts: {stats['total_rounds']} ({victim_attempts} before the kill)")
+
+    shutil.rmtree(tmp_dir)
+    print("✅ no lost or torn writes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+"""
+Behavior checks for CorpusIndex and the word indexes behind it
+Indexes are built over small in-memory word lists.
+
+Usage (from web_app/):
+    python test_corpus_index.py
+"""
+
+import random
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from core import corpus_index
+from core.corpus_index import CorpusIndex
+from core.fuzzy_index import FuzzyIndex
+from core.minimal_pairs import MinimalPairIndex
+from core.prefix_trie import PrefixTrie
+from core.rhyme_index import RhymeIndex, phonemes, rhyme_key
+
+
+def levenshtein(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def make_word(text: str, syllables: str = "T EH1 S T", feature_id: str = "stress") -> dict:
+    return {"text": text, "syllables": syllables.split("-"), "feature_id": feature_id}
+
+
+def build_index(words: list) -> CorpusIndex:
+    index = CorpusIndex()
+    index.sync(words)
+    return index
+
+
+def test_page_cursor_survives_inserts():
+    words = [make_word(text) for text in ("bat", "cat", "dog", "eel", "fox", "gnu", "hen")]
+    index = build_index(words)
+
+    page, total, after = index.page(3)
+    assert [w["text"] for w in page] == ["bat", "cat", "dog"] and total == 7
+    seen = [w["text"] for w in page]
+
+    # One word sorts before the cursor, two after it
+    batch = [make_word("ant"), make_word("elk"), make_word("zebu")]
+    words = words + batch
+    index.add_many(batch, words)
+
+    while after is not None:
+        page, total, after = index.page(3, after=after)
+        seen.extend(w["text"] for w in page)
+    assert total == 10
+    assert seen == ["bat", "cat", "dog", "eel", "elk", "fox", "gnu", "hen", "zebu"]
+
+
+def test_page_filters_and_prefix():
+    words = [
+        make_word("tap", feature_id="t_flap"),
+        make_word("tapper", "T AE1-P ER0", feature_id="t_flap"),
+        make_word("table", "T EY1-B AH0 L"),
+        make_word("top"),
+    ]
+    index = build_index(words)
+
+    page, total, after = index.page(10, feature_id="t_flap")
+    assert [w["text"] for w in page] == ["tap", "tapper"] and total == 2 and after is None
+    page, total, _ = index.page(10, syllable_count=2)
+    assert [w["text"] for w in page] == ["table", "tapper"] and total == 2
+    page, total, _ = index.page(10, prefix="Ta")
+    assert [w["text"] for w in page] == ["table", "tap", "tapper"] and total == 3
+    page, total, _ = index.page(10, feature_id="t_flap", syllable_count=1)
+    assert [w["text"] for w in page] == ["tap"] and total == 1
+
+
+def test_page_prefix_ending_in_the_last_code_point():
+    top = "\U0010ffff"
+    texts = ["a", "b", "b" + top, "b" + top + "a", "b" + top + top, "c", top, top + "z"]
+    index = build_index([make_word(text) for text in texts])
+    for prefix in ("b", "b" + top, "b" + top + top, top, top + top, "c"):
+        words, total, _ = index.page(100, prefix=prefix)
+        expected = sorted(text for text in texts if text.startswith(prefix))
+        assert [w["text"] for w in words] == expected and total == len(expected), prefix
+
+
+def test_sample_respects_features_and_avoid():
+    random.seed(9)
+    words = [
+        make_word("flap", "F L AE1 P", feature_id="t_flap"),
+        make_word("two", "T UW1"),
+        make_word("too", "T UW1"),
+        make_word("ten", "T EH1 N"),
+    ]
+    index = build_index(words)
+
+    assert index.sample(features=["missing"]) is None
+    for _ in range(50):
+        assert index.sample(features=["t_flap"])["text"] == "flap"
+        assert index.sample(features=["stress"], avoid=make_word("two", "T UW1"))["text"] == "ten"
+    # Only homophones of `avoid` left: settle for one of them
+    assert index.sample(features=["stress"], avoid=make_word("ten", "T EH1 N"))["text"] in ("two", "too")
+
+
+def test_sample_dedupes_homophones():
+    random.seed(9)
+    words = [make_word(text, "T UW1") for text in ("two", "too", "to")] + [make_word("ten", "T EH1 N")]
+    index = build_index(words)
+
+    draws = 4000
+    tens = sum(index.sample()["text"] == "ten" for _ in range(draws))
+    # One pronunciation of two: "ten" about half the time, not a quarter
+    assert abs(tens / draws - 0.5) < 0.05, tens
+    tens = sum(index.sample(dedupe=False)["text"] == "ten" for _ in range(draws))
+    assert abs(tens / draws - 0.25) < 0.05, tens
+
+
+def test_sample_dedupes_within_requested_features():
+    random.seed(14)
+    # "two" and "too" share a pronunciation but only "two" is a t_flap word
+    words = [
+        make_word("two", "T UW1", feature_id="t_flap"),
+        make_word("too", "T UW1"),
+        make_word("water", "W AO1-T ER0", feature_id="t_flap"),
+    ]
+    index = build_index(words)
+
+    draws = 4000
+    twos = sum(index.sample(features=["t_flap"])["text"] == "two" for _ in range(draws))
+    # Two pronunciations available, so about half each
+    assert abs(twos / draws - 0.5) < 0.05, twos
+    twos = sum(index.sample(features=["t_flap", "stress"])["text"] in ("two", "too") for _ in range(draws))
+    assert abs(twos / draws - 0.5) < 0.05, twos
+
+
+def test_trie_completes_by_weight():
+    items = [("tap", 1.0), ("table", 5.0), ("tab", 5.0), ("top", 9.0), ("t", 2.0), ("tap", 3.0)]
+    # scan_limit=2 makes the larger subtrees use their cached rankings
+    for trie in (PrefixTrie(items), PrefixTrie(items, top_k=2, scan_limit=2)):
+        assert len(trie) == 5
+        assert trie.complete("ta", 2) == [("tab", 5.0), ("table", 5.0)]
+        assert trie.complete("t", 3) == [("top", 9.0), ("tab", 5.0), ("table", 5.0)]
+        assert [key for key, _ in trie.complete("t", 10)] == ["top", "tab", "table", "tap", "t"]
+        assert trie.complete("x") == [] and trie.complete("tops") == []
+        assert trie.count("ta") == 3 and trie.count("") == 5
+        lo, hi = trie.span("tab")
+        assert [trie.key_at(i) for i in range(lo, hi)] == ["tab", "table"]
+
+
+def test_suggest_merges_saved_words_and_vocabulary():
+    words = [dict(make_word("tap"), frequency=3), make_word("tan")]
+    index = CorpusIndex(vocabulary=["tango", "tap"])
+    index.sync(words)
+    assert index.suggest("ta") == [("tap", 3.0, True), ("tan", 1.0, True), ("tango", 0.0, False)]
+
+    # Saved after the trie was built
+    batch = [dict(make_word("tab"), frequency=7)]
+    index.add_many(batch, words + batch)
+    assert index.suggest("ta", limit=2) == [("tab", 7.0, True), ("tap", 3.0, True)]
+
+
+def test_fuzzy_matches_brute_force():
+    rng = random.Random(11)
+    # A small alphabet so many words are within two edits of each other
+    words = {"".join(rng.choice("abcd") for _ in range(rng.randint(1, 6))) for _ in range(300)}
+    index = FuzzyIndex(sorted(words))
+    queries = sorted(words)[:40] + ["".join(rng.choice("abcde") for _ in range(rng.randint(0, 7))) for _ in range(40)]
+    for query in queries:
+        for max_distance in (1, 2):
+            expected = sorted((levenshtein(query, w), w) for w in words if levenshtein(query, w) <= max_distance)
+            found = index.search(query, max_distance, limit=len(words))
+            assert found == [(w, d) for d, w in expected], (query, max_distance)
+
+
+def test_did_you_mean_prefers_close_corpus_words():
+    index = CorpusIndex(vocabulary=["card", "carton"])
+    words = [make_word("cart"), make_word("dart")]
+    index.sync(words)
+
+    # Same distance: corpus words first
+    assert index.did_you_mean("carx", max_distance=1) == [("cart", 1, True), ("card", 1, False)]
+    assert index.did_you_mean("cards") == [("card", 1, False), ("cart", 2, True)]
+    assert index.did_you_mean("xylophone") == []
+
+    batch = [make_word("cards")]
+    index.add_many(batch, words + batch)
+    assert index.did_you_mean("cards", limit=2) == [("cards", 0, True), ("card", 1, False)]
+
+
+def test_rhyme_key_starts_at_last_stressed_vowel():
+    assert rhyme_key(phonemes(["K AA1 M", "B AE2 T"])) == ["AE2", "T"]
+    assert rhyme_key(phonemes(["B AH0", "N AE1", "N AH0"])) == ["AE1", "N", "AH0"]
+    # No stress marks: last vowel
+    assert rhyme_key(["DH", "AH0"]) == ["AH0"]
+
+
+def test_rhyme_index_pages_and_excludes():
+    entries = [
+        (0, "cat", ["K AE1 T"]),
+        (1, "bat", ["B AE1 T"]),
+        (2, "kit", ["K IH1 T"]),
+        (3, "combat", ["K AA1 M", "B AE2 T"]),
+        (4, "at", ["AE1 T"]),
+        (5, "brat", ["B R AE1 T"]),
+        (6, "at", []),
+    ]
+    index = RhymeIndex(entries)
+    assert len(index) == 6
+
+    cat = phonemes(["K AE1 T"])
+    everything, total = index.rhymes(cat, limit=100)
+    assert total == 5 and sorted(everything) == [0, 1, 3, 4, 5]
+    others, total = index.rhymes(cat, limit=100, exclude=0)
+    assert total == 4 and others == [p for p in everything if p != 0]
+    # Pages line up however the excluded word falls
+    for size in (1, 2, 3):
+        paged = []
+        for offset in range(0, total, size):
+            paged.extend(index.rhymes(cat, offset, size, exclude=0)[0])
+        assert paged == others, size
+
+    index.add(7, ["HH AE1 T"])
+    index.add(8, ["HH IH1 T"])
+    rhymes, total = index.rhymes(cat, limit=100, exclude=0)
+    assert total == 5 and rhymes == others + [7]
+    assert index.rhymes(phonemes(["HH AE1 T"]), limit=100, exclude=7) == (everything, 5)
+
+
+def test_corpus_rhymes_follow_saves():
+    words = [make_word("cat", "K AE1 T"), make_word("bat", "B AE1 T"), make_word("kit", "K IH1 T")]
+    index = build_index(words)
+    rhymes, total = index.rhymes(["K AE1 T"], exclude="Cat")
+    assert [w["text"] for w in rhymes] == ["bat"] and total == 1
+
+    # "kit" changes pronunciation, "hat" is new
+    batch = [make_word("kit", "K AE1 T"), make_word("hat", "HH AE1 T")]
+    words = [words[0], words[1], batch[0], batch[1]]
+    index.add_many(batch, words)
+    rhymes, total = index.rhymes(["K AE1 T"], exclude="cat")
+    assert sorted(w["text"] for w in rhymes) == ["bat", "hat", "kit"] and total == 3
+
+
+def test_phoneme_indexes_follow_replacements():
+    rng = random.Random(12)
+    inventory = ["P", "B", "T", "K", "AE1", "IH1", "R", "L"]
+
+    def pronunciation():
+        return " ".join(rng.choice(inventory) for _ in range(rng.randint(1, 4)))
+
+    words = [make_word(f"w{i}", pronunciation()) for i in range(120)]
+    index = build_index(words)
+    index.warm("rhymes")
+    index.warm("minimal_pairs")
+    rhymes, pairs = index._rhymes, index._pairs
+
+    # Only the clip changes: both indexes are kept as they are
+    words = list(words)
+    words[3] = dict(words[3], clip_id="clip9")
+    index.add(words[3], words)
+    assert index._rhymes is rhymes and index._pairs is pairs
+
+    for _ in range(40):
+        position = rng.randrange(len(words))
+        words = list(words)
+        words[position] = make_word(f"w{position}", pronunciation())
+        index.add(words[position], words)
+    assert index._rhymes is rhymes and index._pairs is pairs
+
+    fresh = build_index(words)
+    for word in words:
+        syllables, text = word["syllables"], word["text"]
+        got, total = index.rhymes(syllables, limit=1000, exclude=text)
+        want, want_total = fresh.rhymes(syllables, limit=1000, exclude=text)
+        assert total == want_total and sorted(w["text"] for w in got) == sorted(w["text"] for w in want), text
+        assert index.minimal_pairs(syllables) == fresh.minimal_pairs(syllables), text
+    assert sorted(map(sorted, ((a, b) for a, b, _ in index._pairs.iter_pairs()))) == sorted(
+        map(sorted, ((a, b) for a, b, _ in fresh._pairs.iter_pairs()))
+    )
+
+
+def test_warm_builds_without_the_lock():
+    words = [make_word("cat", "K AE1 T"), make_word("bat", "B AE1 T")]
+    index = build_index(words)
+    building, release = threading.Event(), threading.Event()
+    attribute, builder = corpus_index._LAZY_INDEXES["rhymes"]
+    snapshots = []
+
+    def slow_builder(*snapshot):
+        snapshots.append(snapshot)
+        building.set()
+        release.wait(5)
+        return builder(*snapshot)
+
+    corpus_index._LAZY_INDEXES["rhymes"] = (attribute, slow_builder)
+    try:
+        warming = threading.Thread(target=index.warm, args=("rhymes",))
+        warming.start()
+        assert building.wait(5)
+        # Queries and saves go through while the index builds
+        assert index.feature_counts() == {"stress": 2}
+        words = words + [make_word("hat", "HH AE1 T")]
+        index.add(words[-1], words)
+        building.clear()
+        release.set()
+        warming.join(5)
+        assert not warming.is_alive()
+    finally:
+        corpus_index._LAZY_INDEXES["rhymes"] = (attribute, builder)
+
+    # The build that missed "hat" was thrown away and redone
+    assert len(snapshots) == 2
+    assert sorted(w["text"] for w in index.rhymes(["K AE1 T"], exclude="cat")[0]) == ["bat", "hat"]
+
+
+def test_sync_swaps_in_a_new_list():
+    words = [make_word("cat"), make_word("bat")]
+    index = build_index(words)
+    version = index.version()
+    words = words + [make_word("hat", feature_id="t_flap")]
+    index.sync(words)
+    assert index.build_count == 2 and index.version() != version
+    assert index.feature_counts() == {"stress": 2, "t_flap": 1}
+    assert [w["text"] for w in index.page(10)[0]] == ["bat", "cat", "hat"]
+
+
+def test_minimal_pairs_match_brute_force():
+    rng = random.Random(13)
+    inventory = ["P", "B", "T", "D", "K", "AE1", "IH1", "R", "L"]
+    prons = [[" ".join(rng.choice(inventory) for _ in range(rng.randint(1, 4)))] for _ in range(200)]
+    split = 150
+    index = MinimalPairIndex(enumerate(prons[:split]))
+    for position in range(split, len(prons)):
+        index.add(position, prons[position])
+
+    def stripped(syllables):
+        return [token.rstrip("012") for token in phonemes(syllables)]
+
+    def differences(a, b):
+        return [i for i, (x, y) in enumerate(zip(a, b)) if x != y] if len(a) == len(b) else []
+
+    expected = set()
+    for a in range(len(prons)):
+        for b in range(a + 1, len(prons)):
+            diff = differences(stripped(prons[a]), stripped(prons[b]))
+            if len(diff) == 1:
+                expected.add((a, b, diff[0]))
+    found = [(min(a, b), max(a, b), i) for a, b, i in index.iter_pairs()]
+    assert len(found) == len(expected) and set(found) == expected
+
+    query = phonemes(["B AE1 T"])
+    pairs = sorted(index.pairs_for(query))
+    assert pairs == sorted(
+        (p, d[0]) for p in range(len(prons))
+        for d in [differences(stripped(query), stripped(prons[p]))] if len(d) == 1
+    )
+
+
+def test_corpus_minimal_pairs_filter_by_phoneme():
+    words = [
+        make_word("rock", "R AA1 K"),
+        make_word("lock", "L AA1 K"),
+        make_word("rack", "R AE1 K"),
+        make_word("wreck", "R EH1 K"),
+        make_word("roc", "R AA1 K"),
+    ]
+    index = build_index(words)
+    pairs = index.minimal_pairs(["R AA1 K"])
+    # Homophones ("roc") are not pairs
+    assert [(w["text"], i, own, theirs) for w, i, own, theirs in pairs] == [
+        ("lock", 0, "R", "L"),
+        ("rack", 1, "AA", "AE"),
+        ("wreck", 1, "AA", "EH"),
+    ]
+    assert [w["text"] for w, *_ in index.minimal_pairs(["R AA1 K"], phoneme="l")] == ["lock"]
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
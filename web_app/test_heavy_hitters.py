@@ -0,0 +1,100 @@
+"""
+Behavior checks for the Space-Saving top-K sketch
+Streams are compared with exact counts from collections.Counter.
+
+Usage (from web_app/):
+    python test_heavy_hitters.py
+"""
+
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from core.heavy_hitters import SpaceSaving
+
+
+def skewed_stream(rng, length, vocabulary):
+    """Zipf-like: word i drawn with weight 1 / (i + 1)"""
+    weights = [1 / (i + 1) for i in range(vocabulary)]
+    return [f"w{i}" for i in rng.choices(range(vocabulary), weights, k=length)]
+
+
+def test_counts_bracket_the_true_counts():
+    rng = random.Random(25)
+    for capacity in (1, 5, 20, 100):
+        stream = skewed_stream(rng, 5000, 300)
+        exact = Counter(stream)
+        sketch = SpaceSaving(capacity)
+        for word in stream:
+            sketch.add(word)
+
+        assert len(sketch) == capacity
+        # Every occurrence is counted once, by whichever item holds it now
+        assert sum(sketch.counts.values()) == len(stream)
+        for word, count in sketch.counts.items():
+            error = sketch.errors[word]
+            assert exact[word] <= count <= exact[word] + error, (capacity, word)
+            assert error <= sketch.min_count
+        for word, true_count in exact.items():
+            if word not in sketch:
+                assert true_count <= sketch.min_count, (capacity, word)
+            if true_count > len(stream) / capacity:
+                assert word in sketch, (capacity, word)
+
+
+def test_top_is_ordered_and_exact_below_capacity():
+    rng = random.Random(25)
+    stream = skewed_stream(rng, 2000, 40)
+    sketch = SpaceSaving(50)
+    for word in stream:
+        assert sketch.add(word) is None
+    assert sketch.counts == Counter(stream) and sketch.min_count == 0
+    assert set(sketch.errors.values()) == {0}
+
+    top = sketch.top(10)
+    counts = [count for _, count, _ in top]
+    assert counts == sorted(counts, reverse=True)
+    assert counts == sorted(Counter(stream).values(), reverse=True)[:10]
+    assert list(sketch.iter_top())[:10] == top
+    assert sketch.top(0) == []
+
+
+def test_eviction_takes_the_oldest_lowest_count():
+    sketch = SpaceSaving(2)
+    sketch.add("a", 3)
+    sketch.add("b")
+    sketch.add("c")
+    assert "b" not in sketch
+    assert sketch.add("d") == "c"
+    # "d" inherits c's count as its possible overcount
+    assert (sketch.counts["d"], sketch.errors["d"]) == (3, 2)
+    assert sketch.top(5) == [("a", 3, 0), ("d", 3, 2)]
+    assert sketch.add("a", 0) is None and sketch.counts["a"] == 3
+
+
+def test_round_trips_through_dicts():
+    rng = random.Random(25)
+    sketch = SpaceSaving(10)
+    for word in skewed_stream(rng, 1000, 100):
+        sketch.add(word)
+    restored = SpaceSaving(10, dict(sketch.counts), dict(sketch.errors))
+    assert restored.counts == sketch.counts and restored.errors == sketch.errors
+    assert [c for _, c, _ in restored.top(10)] == [c for _, c, _ in sketch.top(10)]
+
+    # Loading into a smaller capacity keeps the highest counts
+    smaller = SpaceSaving(3, dict(sketch.counts), dict(sketch.errors))
+    assert sorted(smaller.counts.values()) == sorted(sketch.counts.values())[-3:]
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
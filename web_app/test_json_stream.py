@@ -0,0 +1,91 @@
+"""
+Behavior checks for the streaming JSON array reader
+Every fixture is read at every chunk size from 1 to its length, so each
+token gets split at each possible point.
+
+Usage (from web_app/):
+    python test_json_stream.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from core.json_stream import iter_json_array
+
+FIXTURE = """ [
+  {"text": "water", "syllables": ["W AO1", "T ER0"], "feature_id": "t_flap", "frequency": 12.5},
+  {"text": "caf\\u00e9 \\"quoted\\"", "nested": {"a": [1, [2, {}]], "b": []}, "flag": true},
+  1.5, -1e5, 0, -0.25, 3E+2, 6.02e-23, 12345678901234567890,
+  true,false,null, "", "naïve ✓", [], {}
+]
+"""
+
+MALFORMED = [
+    "",
+    "{}",
+    "[1, 2",
+    "[1,, 2]",
+    "[1, 2,]",
+    "[1 2]",
+    "[1.]",
+    "[-]",
+    "[tru]",
+    '["open]',
+]
+
+
+def write_fixture(text: str) -> str:
+    handle, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(handle, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def test_every_chunk_size_matches_json_loads():
+    path = write_fixture(FIXTURE)
+    try:
+        expected = json.loads(FIXTURE)
+        for chunk_size in range(1, len(FIXTURE) + 1):
+            assert list(iter_json_array(path, chunk_size)) == expected, chunk_size
+    finally:
+        os.remove(path)
+
+
+def test_numbers_split_at_the_chunk_edge():
+    for text in ("[1.5, 2]", "[-1e5, 2]", "[10,2]", "[2.5e-3]", "[7]"):
+        path = write_fixture(text)
+        try:
+            for chunk_size in range(1, len(text) + 1):
+                assert list(iter_json_array(path, chunk_size)) == json.loads(text), (text, chunk_size)
+        finally:
+            os.remove(path)
+
+
+def test_malformed_arrays_raise_at_every_chunk_size():
+    for text in MALFORMED:
+        path = write_fixture(text)
+        try:
+            for chunk_size in range(1, len(text) + 2):
+                try:
+                    list(iter_json_array(path, chunk_size))
+                except ValueError:
+                    continue
+                raise AssertionError(f"accepted {text!r} at chunk size {chunk_size}")
+        finally:
+            os.remove(path)
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
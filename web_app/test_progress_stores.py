@@ -0,0 +1,134 @@
+"""
+Behavior checks shared by the session progress stores
+Every check runs against SessionProgressRegistry (files) and
+SqliteProgressTracker, each in a temporary directory.
+
+Usage (from web_app/):
+    python test_progress_stores.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from core.progress_service import FileProgressTracker, ProgressTracker, SessionProgressRegistry, SessionProgressStore
+from core.sqlite_progress import SqliteProgressTracker
+
+
+@contextmanager
+def stores(**options):
+    """Yield (name, store) pairs for each implementation, closing them afterwards"""
+    tmp_dir = tempfile.mkdtemp(prefix="progress_")
+    created = [
+        ("file", SessionProgressRegistry(
+            FileProgressTracker(os.path.join(tmp_dir, "stats.json"), missed_capacity=options.get("missed_capacity")),
+            os.path.join(tmp_dir, "sessions"),
+            **options,
+        )),
+        ("sqlite", SqliteProgressTracker(os.path.join(tmp_dir, "stats.db"), **options)),
+    ]
+    try:
+        yield created
+    finally:
+        for _, store in created:
+            store.close()
+        shutil.rmtree(tmp_dir)
+
+
+def test_stores_share_one_interface():
+    for store_class in (SessionProgressRegistry, SqliteProgressTracker):
+        assert issubclass(store_class, SessionProgressStore)
+        assert not issubclass(store_class, ProgressTracker)
+
+
+def test_session_and_global_stats():
+    with stores(flush_every=1000) as created:
+        for name, store in created:
+            store.record("alice", "water", "t_flap", "t_flap", True)
+            store.record("alice", "record", "stress", "rhythm", False)
+            store.record("bob", "record", "stress", "rhythm", False)
+            store.record(None, "butter", "t_flap", "t_flap", True)
+            assert store.get_buffer_stats()["pending_attempts"] > 0, name
+
+            alice = store.get_stats("alice")
+            assert (alice["total_rounds"], alice["correct"]) == (2, 1), name
+            assert alice["per_feature"] == {"t_flap": 1} and alice["most_missed"] == {"record": 1}, name
+            everyone = store.get_stats()
+            assert (everyone["total_rounds"], everyone["correct"]) == (4, 2), name
+            assert everyone["most_missed"] == {"record": 2}, name
+
+            store.reset("alice")
+            assert store.get_stats("alice")["total_rounds"] == 0, name
+            assert store.get_stats("bob")["total_rounds"] == 1, name
+
+
+def test_top_missed_bounds():
+    misses = {"record": 5, "water": 3, "butter": 2, "later": 1, "ladder": 1}
+    with stores(missed_capacity=3) as created:
+        for name, store in created:
+            for word, count in misses.items():
+                for _ in range(count):
+                    store.record("alice", word, "t_flap", "t_flap", False)
+            store.record("bob", "record", "stress", "rhythm", False)
+
+            top = store.top_missed("alice", 10)
+            assert top[0]["word"] == "record", name
+            # The file store keeps a sketch of 3 words; SQLite counts exactly
+            assert len(top) == (3 if name == "file" else len(misses)), name
+            counts = [entry["count"] for entry in top]
+            assert counts == sorted(counts, reverse=True), name
+            for entry in top:
+                true_count = misses[entry["word"]]
+                assert true_count <= entry["count"] <= true_count + entry["error"], (name, entry)
+            assert store.top_missed(None, 1) == [{"word": "record", "count": 6, "error": 0}], name
+            assert store.top_missed("carol", 3) == [], name
+
+    # Unbounded counts are exact
+    with stores() as created:
+        for name, store in created:
+            for word, count in misses.items():
+                for _ in range(count):
+                    store.record("alice", word, "t_flap", "t_flap", False)
+            top = store.top_missed("alice", 10)
+            assert {entry["word"]: entry["count"] for entry in top} == misses, name
+            assert {entry["error"] for entry in top} == {0}, name
+
+
+def test_cards_round_trip():
+    card = {"ease": 2.5, "interval": 1.0, "reps": 1, "due": 1000.0}
+    with stores() as created:
+        for name, store in created:
+            store.save_cards("alice", {"water": card})
+            # Readable before and after the flush
+            assert store.load_cards("alice") == {"water": card}, name
+            store.flush()
+            store.save_cards("alice", {"water": dict(card, reps=2)})
+            assert store.load_cards("alice")["water"]["reps"] == 2, name
+            assert store.load_cards("bob") == {}, name
+
+
+def test_background_flush_and_close():
+    with stores(flush_interval=0.01) as created:
+        for name, store in created:
+            store.start()
+            store.start()
+            store.record("alice", "water", "t_flap", "t_flap", True)
+            store.close()
+            assert store.get_buffer_stats()["pending_attempts"] == 0, name
+            assert store.flush_count >= 1, name
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
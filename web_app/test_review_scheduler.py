@@ -0,0 +1,120 @@
+"""
+Behavior checks for the SM-2 review scheduler
+Uses an in-memory card store and explicit `now` times.
+
+Usage (from web_app/):
+    python test_review_scheduler.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from core.review_scheduler import DAY_SECONDS, LearnerSchedule, ReviewScheduler, answer_quality, sm2_update
+
+
+class MemoryCardStore:
+    """The load_cards/save_cards half of a progress store"""
+
+    def __init__(self):
+        self.cards = {}
+        self.load_count = 0
+
+    def load_cards(self, session_id):
+        self.load_count += 1
+        return dict(self.cards.get(session_id, {}))
+
+    def save_cards(self, session_id, cards):
+        self.cards.setdefault(session_id, {}).update(cards)
+
+
+def test_answer_quality():
+    assert answer_quality(True, latency_ms=1200) == 5
+    assert answer_quality(True, latency_ms=8000) == 4
+    assert answer_quality(True) == 4
+    assert answer_quality(False) == 1
+    assert answer_quality(True, skipped=True) == 0
+
+
+def test_sm2_known_sequence():
+    now = 1_000_000.0
+    expected = [
+        # (grade, ease, interval, reps, due offset)
+        (4, 2.5, 1 * DAY_SECONDS, 1, 1 * DAY_SECONDS),
+        (4, 2.5, 6 * DAY_SECONDS, 2, 6 * DAY_SECONDS),
+        (4, 2.5, 15 * DAY_SECONDS, 3, 15 * DAY_SECONDS),
+        # Lapse: ease drops by 0.54, back in a minute
+        (1, 1.96, 0.0, 0, 60.0),
+        (5, 2.06, 1 * DAY_SECONDS, 1, 1 * DAY_SECONDS),
+        (5, 2.16, 6 * DAY_SECONDS, 2, 6 * DAY_SECONDS),
+        (5, 2.26, round(6 * DAY_SECONDS * 2.26), 3, round(6 * DAY_SECONDS * 2.26)),
+    ]
+    card = None
+    for grade, ease, interval, reps, offset in expected:
+        card = sm2_update(card, grade, now)
+        assert card == {"ease": ease, "interval": interval, "reps": reps, "due": now + offset}, (grade, card)
+
+    # Ease never falls below 1.3
+    for _ in range(10):
+        card = sm2_update(card, 0, now)
+    assert card["ease"] == 1.3
+
+
+def test_heap_skips_stale_entries():
+    schedule = LearnerSchedule({"bat": {"due": 50.0}, "cat": {"due": 10.0}})
+    assert schedule.next_due(5.0) is None
+    assert schedule.next_due(10.0) == "cat"
+    # Not dequeued: still due until answered
+    assert schedule.next_due(10.0) == "cat"
+
+    # Rescheduling leaves the old (due 10) entry behind; it must not win
+    schedule.schedule("Cat", {"due": 100.0})
+    assert schedule.next_due(60.0) == "bat"
+    assert schedule.next_due_at() == 50.0
+    assert schedule.next_due(60.0, accept=lambda word: word != "bat") is None
+    # Entries passed over by `accept` are put back
+    assert schedule.next_due(200.0, accept=lambda word: word != "bat") == "cat"
+    assert schedule.next_due(200.0) == "bat"
+
+
+def test_heap_stays_bounded_under_reschedules():
+    schedule = LearnerSchedule()
+    for word in ("bat", "cat", "dog"):
+        schedule.schedule(word, {"due": 0.0})
+    for i in range(1, 1000):
+        schedule.schedule("bat", {"due": float(i)})
+        assert len(schedule._heap) <= 2 * len(schedule) + 17
+    assert len(schedule) == 3 and "BAT" in schedule
+    assert schedule.next_due(500.0, accept=lambda word: word == "bat") is None
+    assert schedule.next_due(999.0, accept=lambda word: word == "bat") == "bat"
+
+
+def test_scheduler_saves_and_reloads_cards():
+    store = MemoryCardStore()
+    scheduler = ReviewScheduler(store, relearn_seconds=30.0, max_learners=1)
+    now = 1_000.0
+    scheduler.answer("alice", "Water", correct=False, now=now)
+    scheduler.answer("alice", "butter", correct=True, latency_ms=900, now=now)
+    assert store.cards["alice"]["water"]["due"] == now + 30.0
+    assert scheduler.next_due("alice", now=now + 29.0) is None
+    assert scheduler.next_due("alice", now=now + 30.0) == "water"
+    assert scheduler.get_stats("alice", now=now) == {"cards": 2, "next_due_in_seconds": 30.0}
+
+    # "bob" evicts "alice"; her schedule comes back from the store
+    assert scheduler.next_due("bob", now=now) is None
+    loads = store.load_count
+    assert scheduler.is_scheduled("alice", "WATER")
+    assert store.load_count == loads + 1
+    assert scheduler.next_due("alice", accept=lambda word: word != "water", now=now + DAY_SECONDS) == "butter"
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
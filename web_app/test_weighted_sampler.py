@@ -0,0 +1,144 @@
+"""
+Behavior checks for the alias and Fenwick weighted samplers
+Draws use seeded random.Random instances.
+
+Usage (from web_app/):
+    python test_weighted_sampler.py
+"""
+
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pronunciation_quiz
+from core.weighted_sampler import AliasSampler, FenwickSampler
+
+
+def assert_distribution(sampler, weights, rng, draws=20000, tolerance=0.02):
+    counts = Counter(sampler.sample(rng) for _ in range(draws))
+    total = sum(weights)
+    for index, weight in enumerate(weights):
+        share = counts[index] / draws
+        assert abs(share - weight / total) < tolerance, (index, share, weight / total)
+
+
+def test_alias_matches_weights():
+    rng = random.Random(24)
+    weights = [5, 1, 0, 3, 1]
+    sampler = AliasSampler(weights)
+    assert len(sampler) == 5 and sampler.total == 10
+    assert_distribution(sampler, weights, rng)
+
+    for bad in ([], [0, 0], [1, -1]):
+        try:
+            AliasSampler(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"AliasSampler accepted {bad}")
+
+
+def test_fenwick_prefix_sums_follow_updates():
+    rng = random.Random(24)
+    weights = [float(rng.randint(0, 9)) for _ in range(37)]
+    sampler = FenwickSampler(weights)
+    for _ in range(500):
+        op = rng.random()
+        if op < 0.2:
+            weight = float(rng.randint(0, 9))
+            assert sampler.append(weight) == len(weights)
+            weights.append(weight)
+        elif op < 0.6:
+            index = rng.randrange(len(weights))
+            weight = float(rng.randint(0, 9))
+            sampler.set(index, weight)
+            weights[index] = weight
+        else:
+            index = rng.randrange(len(weights))
+            delta = float(rng.randint(-int(weights[index]), 5))
+            sampler.add(index, delta)
+            weights[index] += delta
+        assert len(sampler) == len(weights)
+        assert sampler.total == sum(weights)
+        for i in (0, len(weights) // 2, len(weights)):
+            assert sampler._prefix(i) == sum(weights[:i]), i
+    assert [sampler.weight(i) for i in range(len(weights))] == weights
+
+
+def test_fenwick_draws_follow_updates():
+    rng = random.Random(24)
+    weights = [4.0, 1.0, 2.0, 1.0]
+    sampler = FenwickSampler(weights)
+    assert_distribution(sampler, weights, rng)
+
+    # Removing a word is setting its weight to zero
+    sampler.set(0, 0.0)
+    sampler.add(2, 3.0)
+    sampler.append(2.0)
+    weights = [0.0, 1.0, 5.0, 1.0, 2.0]
+    assert_distribution(sampler, weights, rng)
+    assert all(sampler.sample(rng) != 0 for _ in range(2000))
+
+    for index in range(len(weights)):
+        sampler.set(index, 0.0)
+    try:
+        sampler.sample(rng)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("sampled with every weight zero")
+    try:
+        sampler.add(1, -1.0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("accepted a negative weight")
+
+
+def test_fenwick_single_positive_weight():
+    rng = random.Random(24)
+    for size in (1, 2, 7, 8, 9, 64):
+        for index in range(size):
+            weights = [0.0] * size
+            weights[index] = 0.5
+            sampler = FenwickSampler(weights)
+            assert {sampler.sample(rng) for _ in range(20)} == {index}, (size, index)
+
+
+def test_cli_review_ends_without_perfect_answers():
+    pool = [{"text": "cart", "feature_id": "stress"}, {"text": "dart", "feature_id": "t_flap"}]
+    saved = pronunciation_quiz.run_round
+    for outcome in ("skip", "retry", "first try"):
+        rounds = []
+
+        def fake_round(words, *round_args):
+            rounds.append(words[0]["text"])
+            if len(rounds) > 100:
+                raise AssertionError(f"review with {outcome} answers never ended")
+            correct = outcome != "skip"
+            wrong_guesses = 1 if outcome == "retry" else 0
+            return 1 + wrong_guesses, wrong_guesses, not correct, correct, words[0]["feature_id"], words[0]["text"], False
+
+        pronunciation_quiz.run_round = fake_round
+        try:
+            missed_pool, sampler = pronunciation_quiz.build_missed_words_pool(pool, {"cart": 3, "dart": 2})
+            review_stats = pronunciation_quiz.run_review(missed_pool, sampler, None)
+        finally:
+            pronunciation_quiz.run_round = saved
+        credit = pronunciation_quiz.review_credit(outcome != "skip", 1 if outcome == "retry" else 0)
+        assert len(rounds) == 5 / credit, (outcome, len(rounds))
+        assert rounds.count("cart") == 3 / credit and review_stats["total_rounds"] == len(rounds)
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
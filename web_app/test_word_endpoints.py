@@ -0,0 +1,351 @@
+"""
+In-process checks for the word API endpoints
+Each check points the app at a temporary JSON corpus and a fresh
+CorpusIndex; the CMU dictionary is left empty so only corpus words match.
+
+Usage (from web_app/):
+    python test_word_endpoints.py
+"""
+
+import io
+import json
+import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
+from email.utils import formatdate
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "backend"))
+
+from fastapi.testclient import TestClient
+
+from api import main as api
+from core.binary_corpus import BinaryWordDataSource, write_binary_corpus
+from core.corpus_index import CorpusIndex
+from core.review_scheduler import ReviewScheduler
+from core.sharded_corpus import ShardedWordDataSource, write_shards
+from core.sqlite_progress import SqliteProgressTracker
+from core.sqlite_word_source import SQLiteWordDataSource
+from core.word_service import JSONWordDataSource, WordDataSource
+
+
+@contextmanager
+def patched(module, **attrs):
+    """Temporarily replace module attributes"""
+    saved = {name: getattr(module, name) for name in attrs}
+    try:
+        for name, value in attrs.items():
+            setattr(module, name, value)
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def make_word(text: str, syllables: str = "T EH1 S T", feature_id: str = "stress") -> dict:
+    return {"text": text, "syllables": syllables.split("-"), "feature_id": feature_id}
+
+
+@contextmanager
+def app_client(words: list):
+    """TestClient over `words`; restores the app's services afterwards"""
+    tmp_dir = tempfile.mkdtemp(prefix="words_")
+    saved = (api.word_service, api.corpus_index, api._cmu)
+    try:
+        word_file = Path(tmp_dir) / "words.json"
+        word_file.write_text(json.dumps(words), encoding="utf-8")
+        api.word_service = JSONWordDataSource(str(word_file))
+        api.corpus_index = CorpusIndex()
+        api._cmu = {}
+        # Not entered as a context manager, so startup (warm-up) doesn't run
+        yield TestClient(api.app)
+    finally:
+        api.word_service, api.corpus_index, api._cmu = saved
+        shutil.rmtree(tmp_dir)
+
+
+@contextmanager
+def temp_progress():
+    """Point the app's progress store and review scheduler at a temporary SQLite file"""
+    tmp_dir = tempfile.mkdtemp(prefix="stats_")
+    progress = SqliteProgressTracker(str(Path(tmp_dir) / "stats.db"))
+    try:
+        with patched(api, session_progress=progress, review_scheduler=ReviewScheduler(progress)):
+            yield progress
+    finally:
+        progress.close()
+        shutil.rmtree(tmp_dir)
+
+
+def test_words_paging():
+    words = [make_word(text) for text in ("bat", "cat", "dog", "eel", "fox")]
+    with app_client(words) as client:
+        first = client.get("/api/words", params={"limit": 2, "fields": "text"}).json()
+        assert first["words"] == [{"text": "bat"}, {"text": "cat"}]
+        assert first["total"] == 5 and first["next_after"] == "cat"
+
+        texts = [w["text"] for w in first["words"]]
+        after = first["next_after"]
+        while after is not None:
+            page = client.get("/api/words", params={"limit": 2, "after": after}).json()
+            texts.extend(w["text"] for w in page["words"])
+            after = page["next_after"]
+        assert texts == ["bat", "cat", "dog", "eel", "fox"]
+
+        filtered = client.get("/api/words", params={"prefix": "d"}).json()
+        assert [w["text"] for w in filtered["words"]] == ["dog"]
+
+
+def test_words_prefix_of_the_last_code_point():
+    with app_client([make_word("cart"), make_word("\U0010ffff")]) as client:
+        response = client.get("/api/words?prefix=%F4%8F%BF%BF")
+        assert response.status_code == 200
+        assert [w["text"] for w in response.json()["words"]] == ["\U0010ffff"]
+
+
+def test_suggest():
+    words = [dict(make_word("tap"), frequency=3), make_word("tan"), make_word("dog")]
+    with app_client(words) as client:
+        body = client.get("/api/words/suggest", params={"prefix": "TA"}).json()
+        assert body["count"] == 2
+        assert body["suggestions"] == [
+            {"text": "tap", "weight": 3.0, "source": "local"},
+            {"text": "tan", "weight": 1.0, "source": "local"},
+        ]
+        assert client.get("/api/words/suggest", params={"prefix": "ta", "limit": 0}).status_code == 422
+
+
+def test_ipa_suggests_close_words():
+    words = [make_word("cart", "K AA1 R T"), make_word("dart", "D AA1 R T")]
+    with app_client(words) as client:
+        found = client.get("/api/pronunciation/ipa/cart").json()
+        assert found["source"] == "local" and found["syllables"] == ["K AA1 R T"]
+
+        missed = client.get("/api/pronunciation/ipa/carts")
+        assert missed.status_code == 404
+        assert missed.json()["detail"]["did_you_mean"] == [
+            {"text": "cart", "distance": 1, "source": "local"},
+            {"text": "dart", "distance": 2, "source": "local"},
+        ]
+
+
+def test_rhymes():
+    words = [make_word("cat", "K AE1 T"), make_word("bat", "B AE1 T"), make_word("brat", "B R AE1 T"), make_word("kit", "K IH1 T")]
+    with app_client(words) as client:
+        body = client.get("/api/words/rhymes/cat", params={"limit": 1}).json()
+        assert body["rhyme"] == "AE1 T" and body["total"] == 2
+        first = body["words"]
+        second = client.get("/api/words/rhymes/cat", params={"limit": 1, "offset": 1}).json()["words"]
+        assert sorted(w["text"] for w in first + second) == ["bat", "brat"]
+        assert client.get("/api/words/rhymes/zzz").status_code == 404
+
+
+def test_minimal_pairs():
+    words = [make_word("rock", "R AA1 K"), make_word("lock", "L AA1 K"), make_word("rack", "R AE1 K")]
+    with app_client(words) as client:
+        body = client.get("/api/words/rock/minimal-pairs").json()
+        assert body["phonemes"] == "R AA1 K" and body["count"] == 2
+        assert [(p["text"], p["position"], p["contrast"]) for p in body["pairs"]] == [
+            ("lock", 0, ["R", "L"]),
+            ("rack", 1, ["AA", "AE"]),
+        ]
+        filtered = client.get("/api/words/rock/minimal-pairs", params={"phoneme": "L"}).json()
+        assert [p["text"] for p in filtered["pairs"]] == ["lock"]
+        assert client.get("/api/words/zzz/minimal-pairs").status_code == 404
+
+
+def test_homophones():
+    words = [make_word("two", "T UW1"), make_word("too", "T UW1"), make_word("to", "T UW1"), make_word("toe", "T OW1")]
+    with app_client(words) as client:
+        body = client.get("/api/words/Two/homophones").json()
+        assert body["phonemes"] == "T UW1" and body["count"] == 2
+        assert [w["text"] for w in body["homophones"]] == ["to", "too"]
+        assert client.get("/api/words/toe/homophones").json()["count"] == 0
+        assert client.get("/api/words/zzz/homophones").status_code == 404
+        assert client.get("/api/corpus/stats").json()["pronunciations"] == 2
+
+
+def test_dictionaryapi_fallback():
+    requests = []
+
+    def fake_urlopen(request, timeout=None):
+        requests.append(request)
+        entry = {
+            "phonetics": [{"text": "/ˈzɛbjuː/"}],
+            "meanings": [{"definitions": [{"definition": "A humped ox."}]}],
+        }
+        return io.BytesIO(json.dumps([entry]).encode("utf-8"))
+
+    def offline(*args, **kwargs):
+        raise ConnectionError("offline")
+
+    with app_client([make_word("cart")]) as client, \
+            patched(api, urlopen=fake_urlopen), patched(api.wikipedia, summary=offline):
+        body = client.get("/api/pronunciation/ipa/zebu").json()
+        assert body["source"] == "dictionaryapi" and body["ipa"] == "/ˈzɛbjuː/"
+        body = client.get("/api/reference/definition/zebu").json()
+        assert body["source"] == "DictionaryAPI" and body["definition"] == "A humped ox."
+    assert len(requests) == 2
+    assert requests[0].full_url.endswith("/entries/en/zebu")
+    assert requests[0].get_header("User-agent") == "PronunciationQuiz/1.0"
+
+
+def test_bulk_import():
+    with app_client([make_word("cart", "K AA1 R T")]) as client:
+        body = "\n".join([
+            json.dumps(make_word("Cart", "K AA1 R T", feature_id="t_flap")),
+            json.dumps(make_word("dart", "D AA1 R T")),
+            "{not json",
+            json.dumps(make_word("dart", "D AA1 R T")),
+            json.dumps({"text": "zork", "syllables": ["Z Q1"], "feature_id": "stress"}),
+        ])
+        result = client.post("/api/words/bulk", content=body).json()
+        assert (result["received"], result["saved"], result["invalid"]) == (5, 2, 3)
+        assert [r["status"] for r in result["results"]] == ["updated", "added", "invalid", "invalid", "invalid"]
+        assert result["results"][3]["errors"] == ["duplicate of item 1"]
+
+        # Saved words are listed and indexed straight away
+        listed = client.get("/api/words", params={"fields": "text,feature_id"}).json()
+        assert listed["words"] == [{"text": "cart", "feature_id": "t_flap"}, {"text": "dart", "feature_id": "stress"}]
+        assert client.get("/api/words/dart/homophones").status_code == 200
+        assert client.post("/api/words/bulk", content="[{").status_code == 400
+
+
+def test_conditional_get():
+    with app_client([make_word("cart"), make_word("dart")]) as client:
+        first = client.get("/api/words")
+        etag = first.headers["etag"]
+        # Derived from the words alone, so every worker sends the same one
+        assert "last-modified" not in first.headers
+        assert etag == f'"{api.corpus_index.version()}"'
+
+        cached = client.get("/api/words", headers={"If-None-Match": f'W/{etag}, "other"'})
+        assert cached.status_code == 304 and cached.content == b"" and cached.headers["etag"] == etag
+        assert client.get("/api/words", headers={"If-Modified-Since": formatdate(usegmt=True)}).status_code == 200
+
+        client.post("/api/words/add", json=make_word("eel"))
+        changed = client.get("/api/words", headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.headers["etag"] != etag
+        assert changed.json()["total"] == 3
+
+        features = client.get("/api/features")
+        modified = features.headers["last-modified"]
+        assert client.get("/api/features", headers={"If-Modified-Since": modified}).status_code == 304
+        assert client.get("/api/features", headers={"If-None-Match": '"stale"', "If-Modified-Since": modified}).status_code == 200
+
+
+class ListWordDataSource(WordDataSource):
+    """A source with no cache, so get_cache_stats is the base default"""
+
+    def __init__(self, words):
+        self.words = list(words)
+
+    def get_all_words(self):
+        return self.words
+
+    def get_word_by_id(self, word_id):
+        return next((w for w in self.words if w["text"] == word_id), None)
+
+    def save_word(self, word):
+        self.words.append(word)
+
+
+def test_corpus_stats_for_every_source():
+    words = [make_word("cart", "K AA1 R T"), make_word("kart", "K AA1 R T"), make_word("water", feature_id="t_flap")]
+    with app_client([]) as client:
+        tmp_dir = Path(tempfile.mkdtemp(prefix="sources_"))
+        try:
+            sqlite_source = SQLiteWordDataSource(str(tmp_dir / "words.db"))
+            sqlite_source.save_words(words)
+            write_binary_corpus(words, str(tmp_dir / "words.bin"))
+            write_shards(words, str(tmp_dir / "shards"))
+            sources = [
+                ListWordDataSource(words),
+                sqlite_source,
+                BinaryWordDataSource(str(tmp_dir / "words.bin")),
+                ShardedWordDataSource(str(tmp_dir / "shards")),
+            ]
+            for source in sources:
+                with patched(api, word_service=source, corpus_index=CorpusIndex()):
+                    response = client.get("/api/corpus/stats")
+                    name = type(source).__name__
+                    assert response.status_code == 200, (name, response.text)
+                    stats = response.json()
+                    assert stats["feature_counts"] == {"stress": 2, "t_flap": 1}, name
+                    assert stats["pronunciations"] == 2, name
+        finally:
+            shutil.rmtree(tmp_dir)
+
+
+def test_missed_review_reweights_after_answers():
+    words = [make_word("cart", "K AA1 R T"), make_word("dart", "D AA1 R T"), make_word("hat", "HH AE1 T")]
+    with temp_progress() as progress, app_client(words) as client:
+        for word in ("cart", "dart") * 3:
+            progress.record("s", word, "t_flap", "stress", False)
+        started = client.post("/api/quiz/new-word", params={"session_id": "s", "missed": True}).json()
+        assert started["review"] == {"source": "missed", "missed_words": 2}
+        _, review_words, positions, sampler = api.session_missed["s"]
+
+        def answer(text, correct):
+            api.sessions["s"] = next(w for w in review_words + words if w["text"] == text)
+            feature = "stress" if correct else "t_flap"
+            return client.post("/api/quiz/submit-answer", json={"session_id": "s", "feature": feature}).json()
+
+        def share(text):
+            return sampler.weight(positions[text]) / sampler.total
+
+        # Each correct answer makes "cart" less likely, until it drops out
+        before = share("cart")
+        answer("cart", True)
+        assert share("cart") < before
+        answer("cart", True)
+        result = answer("cart", True)
+        assert share("cart") == 0 and result["review"]["missed_words"] == 1
+        drawn = {answer("dart", False)["next_word"]["text"] for _ in range(30)}
+        assert drawn == {"dart"}
+        # A first miss joins the review
+        assert answer("hat", False)["review"]["missed_words"] == 2
+        assert sampler.weight(positions["hat"]) == 1
+
+
+def test_unservable_focus_is_not_kept():
+    words = [make_word("cart", feature_id="stress"), make_word("water", feature_id="t_flap")]
+    with temp_progress(), app_client(words) as client:
+        first = client.post("/api/quiz/new-word", params={"session_id": "focus", "feature": "stress"}).json()
+        assert first["word"]["text"] == "cart"
+        answer = {"session_id": "focus", "feature": "stress"}
+        assert client.post("/api/quiz/submit-answer", json={**answer, "next_feature": "nope"}).status_code == 404
+        # The session keeps its old focus
+        result = client.post("/api/quiz/submit-answer", json=answer)
+        assert result.status_code == 200 and result.json()["next_word"]["text"] == "cart"
+        result = client.post("/api/quiz/submit-answer", json={**answer, "next_feature": "t_flap"}).json()
+        assert result["next_word"]["text"] == "water"
+        assert api.session_features["focus"] == ["t_flap"]
+
+
+def test_stats_top_missed():
+    tmp_dir = tempfile.mkdtemp(prefix="stats_")
+    progress = SqliteProgressTracker(str(Path(tmp_dir) / "stats.db"))
+    try:
+        with patched(api, session_progress=progress), app_client([]) as client:
+            for word in ("record", "record", "water"):
+                progress.record("alice", word, "stress", "rhythm", False)
+            assert "top_missed" not in client.get("/api/stats", params={"session_id": "alice"}).json()
+            stats = client.get("/api/stats", params={"session_id": "alice", "top": 1}).json()
+            assert stats["top_missed"] == [{"word": "record", "count": 2, "error": 0}]
+            assert client.get("/api/stats", params={"top": 0}).status_code == 422
+    finally:
+        progress.close()
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Behavior checks for the word data sources
+Each check builds its source in a temporary directory.
+
+Usage (from web_app/):
+    python test_word_sources.py
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+WEB_APP_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(WEB_APP_DIR / "backend"))
+
+from core.binary_corpus import BinaryWordDataSource, write_binary_corpus
+from core.sharded_corpus import ShardedWordDataSource, read_manifest, write_shards
+from core.sqlite_word_source import SQLiteWordDataSource
+
+
+def make_word(text: str, feature_id: str = "stress") -> dict:
+    return {"text": text, "syllables": ["T EH1 S T"], "feature_id": feature_id}
+
+
+def test_sqlite_local_writes_skip_reload():
+    tmp_dir = tempfile.mkdtemp(prefix="words_")
+    try:
+        source = SQLiteWordDataSource(os.path.join(tmp_dir, "words.db"))
+        source.save_words(make_word(f"word{i}") for i in range(100))
+        before = source.get_all_words()
+        assert source.load_count == 1
+
+        source.save_word(make_word("added"))
+        source.save_word(make_word("word5", feature_id="t_flap"))
+        source.save_words([make_word("bulk1"), make_word("bulk2")])
+        words = source.get_all_words()
+        assert source.load_count == 1, "a local write re-read the whole table"
+        assert len(before) == 100, "the list handed out earlier changed"
+        assert [w["text"] for w in words][-3:] == ["added", "bulk1", "bulk2"]
+        assert words[5]["feature_id"] == "t_flap"
+
+        # The cached list matches a fresh read of the table
+        fresh = SQLiteWordDataSource(os.path.join(tmp_dir, "words.db")).get_all_words()
+        assert [dict(w) for w in fresh] == [dict(w) for w in words]
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_sqlite_sees_other_connections_writes():
+    tmp_dir = tempfile.mkdtemp(prefix="words_")
+    try:
+        path = os.path.join(tmp_dir, "words.db")
+        source = SQLiteWordDataSource(path)
+        source.save_word(make_word("mine"))
+        assert len(source.get_all_words()) == 1
+
+        SQLiteWordDataSource(path).save_word(make_word("theirs"))
+        assert {w["text"] for w in source.get_all_words()} == {"mine", "theirs"}
+        assert source.load_count == 2
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_binary_compaction_writes_new_generation():
+    tmp_dir = tempfile.mkdtemp(prefix="words_")
+    try:
+        path = os.path.join(tmp_dir, "words.bin")
+        write_binary_corpus([make_word(f"word{i}") for i in range(50)], path)
+        base_inode = os.stat(path).st_ino
+        source = BinaryWordDataSource(path, compact_threshold=10_000)
+        other = BinaryWordDataSource(path, compact_threshold=10_000)
+        mapped_before = source.get_all_words()
+
+        source.save_words([make_word("added"), make_word("word3", feature_id="t_flap")])
+        source.compact()
+        # The mapped file is never replaced; the rebuild is generation 1
+        assert os.stat(path).st_ino == base_inode
+        assert os.path.exists(path + ".1")
+        assert source.get_cache_stats()["generation"] == 1
+        assert len(mapped_before) == 50 and mapped_before[3]["feature_id"] == "stress"
+
+        # Another process switches over on its next read
+        words = other.get_all_words()
+        assert len(words) == 51
+        assert other.get_word_by_id("word3")["feature_id"] == "t_flap"
+        assert other.get_cache_stats()["generation"] == 1
+
+        other.save_word(make_word("later"))
+        other.compact()
+        assert source.get_word_by_id("later") is not None
+        assert source.get_cache_stats()["generation"] == 2
+        # Generation 1 is superseded and removed; generation 0 is kept
+        assert not os.path.exists(path + ".1") and os.path.exists(path)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_sharded_new_shards_keep_the_manifest_complete():
+    tmp_dir = tempfile.mkdtemp(prefix="words_")
+    try:
+        counts = write_shards([make_word("apple"), make_word("avocado"), make_word("banana")], tmp_dir)
+        assert counts == {"a": 2, "b": 1}
+        source = ShardedWordDataSource(tmp_dir, workers=1)
+        other = ShardedWordDataSource(tmp_dir, workers=1)
+        assert len(source.get_all_words()) == 3
+
+        # Each process starts a shard the other doesn't know about
+        source.save_word(make_word("cherry"))
+        other.save_words([make_word("date"), make_word("apricot")])
+        manifest = read_manifest(tmp_dir)
+        assert [(s["key"], s["file"]) for s in manifest["shards"]] == [
+            ("a", "words_a.json"), ("b", "words_b.json"), ("c", "words_c.json"), ("d", "words_d.json"),
+        ]
+        fresh = ShardedWordDataSource(tmp_dir, workers=1).get_all_words()
+        assert sorted(w["text"] for w in fresh) == ["apple", "apricot", "avocado", "banana", "cherry", "date"]
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+# Stands in for nltk's CMU dictionary so generate_words.py runs offline
+FAKE_NLTK = {
+    "nltk/__init__.py": "def download(name):\n    pass\n",
+    "nltk/corpus/__init__.py": (
+        "import json, os\n"
+        "class cmudict:\n"
+        "    @staticmethod\n"
+        "    def dict():\n"
+        "        with open(os.environ['FAKE_CMUDICT']) as f:\n"
+        "            return json.load(f)\n"
+    ),
+}
+
+
+def run_cli(args, cwd, **env):
+    result = subprocess.run(
+        [sys.executable, *args], cwd=cwd, capture_output=True, text=True, env={**os.environ, **env}
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_shard_clis_write_loadable_shards():
+    tmp_dir = Path(tempfile.mkdtemp(prefix="words_"))
+    try:
+        for name, source in FAKE_NLTK.items():
+            (tmp_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_dir / name).write_text(source)
+        letters = "abcdefg"
+        cmu = {a + b + c: [["K", "AE1", "T"]] for a in letters for b in letters for c in letters}
+        (tmp_dir / "cmudict.json").write_text(json.dumps(cmu))
+
+        output = run_cli(
+            [str(WEB_APP_DIR.parent / "generate_words.py"), "--shards", "gen_shards"], tmp_dir,
+            PYTHONPATH=str(tmp_dir), FAKE_CMUDICT=str(tmp_dir / "cmudict.json"),
+        )
+        assert f"Wrote {len(letters)} shards to gen_shards" in output
+        words = ShardedWordDataSource(str(tmp_dir / "gen_shards"), workers=1).get_all_words()
+        assert len(words) == len(cmu)
+
+        output = run_cli(
+            [str(WEB_APP_DIR / "corpus_tools.py"), "shard", str(tmp_dir / "cli_shards"), str(tmp_dir / "test_words.json")],
+            tmp_dir,
+        )
+        assert len(ShardedWordDataSource(str(tmp_dir / "cli_shards"), workers=1).get_all_words()) == 300
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    for name, check in list(globals().items()):
+        if name.startswith("test_") and callable(check):
+            check()
+            print(f"✅ {name}")
+
+
+if __name__ == "__main__":
+    main()